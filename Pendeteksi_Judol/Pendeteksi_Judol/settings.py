@@ -161,6 +161,20 @@ CACHES = {
     }
 }
 
+# Cache hasil preprocessing & prediksi per konten komentar (deteksi/ml/cache.py).
+# BACKEND "lru" = cache in-process per worker, "django" = memakai CACHES[ALIAS].
+TEXT_CACHE = {
+    'BACKEND': os.getenv("TEXT_CACHE_BACKEND", "lru"),
+    'ALIAS': 'default',
+    'MAX_ENTRIES': 50_000,
+    'MAX_BYTES': 32 * 1024 * 1024,
+    'TIMEOUT': 60 * 60,
+    'CACHE_PROBA': True,
+}
+
+# Analisis dari form utama (HTMX) dikirim bertahap lewat server-sent events.
+STREAM_ANALYSIS = os.getenv("STREAM_ANALYSIS", "1") == "1"
+
 
 
 # Static files (CSS, JavaScript, Images)
@@ -16,12 +16,13 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from deteksi.views import index, oauth_start, oauth_callback, revoke_and_logout_view, moderate_comments, home, my_videos_partial, video_saya, comment_detail, get_ai_insight, get_dataset
+from deteksi.views import index, oauth_start, oauth_callback, revoke_and_logout_view, moderate_comments, home, my_videos_partial, video_saya, comment_detail, get_ai_insight, get_dataset, analysis_stream
 from .views import privacy_policy, terms_of_service
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', index, name='index'),
+    path('analysis/stream/', analysis_stream, name='analysis_stream'),
     path('get-ai-insight/', get_ai_insight, name='get_ai_insight'),
     path('preproces/', home, name='home'),
     path("oauth/start/", oauth_start, name="oauth_start"),
@@ -1,6 +1,15 @@
+import os
+
 from django.apps import AppConfig
 
 
 class DeteksiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'deteksi'
+
+    def ready(self):
+        # Preload model aktif saat proses start (misal runserver atau gunicorn --preload),
+        # supaya request pertama tidak menanggung waktu joblib.load.
+        if os.environ.get("JUDOL_PRELOAD_MODEL", "0") == "1":
+            from .ml.registry import get_registry
+            get_registry().preload()
@@ -0,0 +1,186 @@
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.evaluation import classification_metrics
+from deteksi.ml.predict import BEST_THR
+from deteksi.ml.preprocess import PREPROCESS_TAG, preprocess_many
+from deteksi.ml.registry import get_registry
+
+PROJECT_DIR = Path(__file__).resolve().parents[3]
+# Data latih model; akurasi/F1 di sini adalah skor in-sample, tidak bisa membandingkan model.
+TRAINING_PATH = PROJECT_DIR / "dataset" / "dataset_training.csv"
+
+# Proses anak (satu per model, agar waktu muat dan RSS tidak saling memengaruhi): memuat
+# model seperti worker, mengukur latensi per komentar dan throughput batch, lalu mengirim
+# skor mentah ke proses induk sebagai JSON.
+_CHILD = """
+import json, sys, time
+import numpy as np
+import sklearn.pipeline, sklearn.linear_model, sklearn.feature_extraction.text
+from deteksi.ml.registry import ModelRegistry, describe_pipeline
+
+name, corpus, singles, use_scorer = sys.argv[1], sys.argv[2], int(sys.argv[3]), sys.argv[4] == "1"
+with open(corpus, encoding="utf-8") as f:
+    texts = json.load(f)
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+before = rss_kb()
+model = ModelRegistry(shared=False, linear_scorer=use_scorer).load(name)
+after = rss_kb()
+
+try:
+    model.proba_positive(texts[:1])
+    score, kind = model.proba_positive, "proba"
+except AttributeError:
+    score, kind = (lambda x: model.pipeline.decision_function(x).tolist()), "decision"
+
+latencies = []
+for t in texts[:singles]:
+    start = time.perf_counter()
+    score([t])
+    latencies.append(time.perf_counter() - start)
+start = time.perf_counter()
+scores = score(texts)
+batch = time.perf_counter() - start
+
+info = describe_pipeline(model.pipeline)
+print(json.dumps({
+    "load_seconds": model.load_seconds,
+    "model_rss_kb": after - before,
+    "latency_ms": {
+        "p50": float(np.percentile(latencies, 50)) * 1000,
+        "p99": float(np.percentile(latencies, 99)) * 1000,
+        "mean": float(np.mean(latencies)) * 1000,
+    },
+    "batch_seconds": batch,
+    "score_kind": kind,
+    "linear_scorer": model.scorer is not None and model.scorer.has_proba,
+    "classifier": info["classifier"],
+    "loss": info["loss"],
+    "n_features": info["n_features"],
+    "scores": [float(s) for s in scores],
+}))
+"""
+
+def run_child(name: str, corpus: Path, singles: int, use_scorer: bool) -> dict:
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_DIR)}
+    out = subprocess.run([sys.executable, "-c", _CHILD, name, str(corpus), str(singles), "1" if use_scorer else "0"],
+                         cwd=PROJECT_DIR, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "proses uji gagal")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+class Command(BaseCommand):
+    help = ("Benchmark semua versi model pada korpus tetap: waktu muat, RSS, latensi p50/p99 per "
+            "komentar, throughput batch, serta akurasi/F1 pada BEST_THR. Laporan dalam JSON. Akurasi hanya "
+            "bermakna pada data berlabel yang tidak ikut melatih model (--dataset).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", help="Versi model (default: semua di deteksi/ml/model/).")
+        parser.add_argument("--dataset", required=True,
+                            help="CSV held-out dengan kolom text,label yang tidak dipakai saat melatih model "
+                                 f"(bukan {TRAINING_PATH.name}).")
+        parser.add_argument("--in-sample", action="store_true",
+                            help=f"Izinkan {TRAINING_PATH.name} (hanya untuk mengukur kecepatan; akurasi/F1 "
+                                 "ditandai in-sample di laporan).")
+        parser.add_argument("-n", "--size", type=int, default=2000, help="Jumlah komentar korpus (sampel ber-seed).")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--singles", type=int, default=300,
+                            help="Jumlah komentar untuk pengukuran latensi satu per satu.")
+        parser.add_argument("--no-scorer", action="store_true",
+                            help="Ukur predict_proba sklearn murni (tanpa LinearScorer).")
+        parser.add_argument("--output", default=None, help="Tulis laporan JSON ke file ini.")
+        parser.add_argument("--json", action="store_true", help="Cetak laporan JSON ke stdout, bukan tabel.")
+
+    def handle(self, *args, **options):
+        registry = get_registry()
+        available = [i.name for i in registry.available()]
+        names = options["models"] or available
+        unknown = [n for n in names if n not in available]
+        if unknown:
+            raise CommandError(f"Model tidak dikenal: {', '.join(unknown)}")
+
+        in_sample = Path(options["dataset"]).resolve() == TRAINING_PATH
+        if in_sample and not options["in_sample"]:
+            raise CommandError(f"{TRAINING_PATH.name} adalah data latih model; akurasi/F1 darinya in-sample. "
+                               "Gunakan data held-out, atau --in-sample untuk mengukur kecepatan saja.")
+
+        with open(options["dataset"], encoding="utf-8") as f:
+            rows = [r for r in csv.DictReader(f) if r.get("text") is not None]
+        rows = random.Random(options["seed"]).sample(rows, min(options["size"], len(rows)))
+        labels = [int(r["label"]) for r in rows]
+        cleans = preprocess_many([r["text"] for r in rows])
+
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "corpus": {"dataset": Path(options["dataset"]).name, "size": len(rows), "seed": options["seed"],
+                       "preprocess": PREPROCESS_TAG, "singles": min(options["singles"], len(rows)),
+                       "in_sample": in_sample},
+            "threshold": BEST_THR,
+            "active": registry.configured_name(),
+            "linear_scorer": not options["no_scorer"],
+            "env": {"python": platform.python_version(), "cpus": os.cpu_count()},
+            "models": [],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = Path(tmp) / "corpus.json"
+            corpus.write_text(json.dumps(cleans), encoding="utf-8")
+            for name in names:
+                if not options["json"]:
+                    self.stderr.write(f"{name} ...", ending="\r")
+                try:
+                    res = run_child(name, corpus, options["singles"], not options["no_scorer"])
+                except RuntimeError as e:
+                    report["models"].append({"name": name, "error": str(e)})
+                    continue
+                scores = res.pop("scores")
+                thr = BEST_THR if res["score_kind"] == "proba" else 0.0
+                pred = [int(s >= thr) if c.strip() else 0 for s, c in zip(scores, cleans)]
+                report["models"].append({
+                    "name": name,
+                    "file_kb": round(registry.path_for(name).stat().st_size / 1024, 1),
+                    **res,
+                    "throughput_per_s": len(cleans) / res["batch_seconds"] if res["batch_seconds"] else None,
+                    **classification_metrics(pred, labels),
+                })
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self._write_table(report)
+
+    def _write_table(self, report: dict):
+        c = report["corpus"]
+        self.stdout.write(f"Korpus: {c['size']} komentar dari {c['dataset']} (seed {c['seed']}), "
+                          f"ambang {report['threshold']}, model aktif {report['active']}")
+        if c["in_sample"]:
+            self.stdout.write(self.style.WARNING("  Akurasi/F1 in-sample (data latih): jangan dipakai memilih model."))
+        self.stdout.write(f"  {'model':<26} {'muat s':>7} {'RSS MB':>7} {'p50 ms':>7} {'p99 ms':>7} "
+                          f"{'teks/s':>8} {'akurasi':>8} {'f1':>7}")
+        for m in report["models"]:
+            if "error" in m:
+                self.stdout.write(f"  {m['name']:<26} GAGAL: {m['error']}")
+                continue
+            self.stdout.write(
+                f"  {m['name']:<26} {m['load_seconds']:>7.2f} {m['model_rss_kb'] / 1024:>7.1f} "
+                f"{m['latency_ms']['p50']:>7.3f} {m['latency_ms']['p99']:>7.3f} {m['throughput_per_s']:>8.0f} "
+                f"{m['accuracy']:>8.4f} {m['f1']:>7.4f}"
+            )
@@ -0,0 +1,75 @@
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.linear_scorer import LinearScorer
+from deteksi.ml.preprocess import preprocess_many
+from deteksi.ml.registry import ModelRegistry, get_registry
+
+DATASET_PATH = Path(__file__).resolve().parents[3] / "dataset" / "dataset_training.csv"
+
+def _per_call_ms(fn, texts) -> float:
+    start = time.perf_counter()
+    for t in texts:
+        fn([t])
+    return (time.perf_counter() - start) / len(texts) * 1000
+
+class Command(BaseCommand):
+    help = "Membandingkan LinearScorer dengan predict_proba sklearn (ketepatan dan kecepatan)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", help="Versi model (default: model aktif).")
+        parser.add_argument("--dataset", default=str(DATASET_PATH), help="CSV dengan kolom text.")
+        parser.add_argument("-n", "--size", type=int, default=5000, help="Jumlah komentar untuk uji batch.")
+        parser.add_argument("--single", type=int, default=300, help="Jumlah komentar untuk uji satu per satu.")
+        parser.add_argument("--tolerance", type=float, default=1e-9, help="Selisih proba maksimum yang diterima.")
+
+    def handle(self, *args, **options):
+        names = options["models"] or [get_registry().configured_name()]
+        with open(options["dataset"], encoding="utf-8") as f:
+            raw = [r["text"] for r, _ in zip(csv.DictReader(f), range(options["size"]))]
+        texts = preprocess_many(raw)
+        single = texts[:options["single"]]
+
+        registry = ModelRegistry(linear_scorer=False)
+        failed = []
+        for name in names:
+            model = registry.load(name)
+            pipe = model.pipeline
+            if not LinearScorer.supports(pipe):
+                self.stdout.write(self.style.WARNING(f"{name}: pipeline tidak didukung LinearScorer"))
+                continue
+            start = time.perf_counter()
+            scorer = LinearScorer.from_pipeline(pipe, name)
+            build_ms = (time.perf_counter() - start) * 1000
+
+            if scorer.has_proba:
+                sk_fn, our_fn, what = (lambda x: pipe.predict_proba(x)[:, 1]), scorer.proba_positive, "proba"
+            else:
+                sk_fn, our_fn, what = pipe.decision_function, scorer.decision_function, "decision"
+
+            start = time.perf_counter()
+            expected = np.asarray(sk_fn(texts))
+            sk_batch = time.perf_counter() - start
+            start = time.perf_counter()
+            got = np.asarray(our_fn(texts))
+            our_batch = time.perf_counter() - start
+            max_diff = float(np.abs(expected - got).max())
+
+            sk_single = _per_call_ms(sk_fn, single)
+            our_single = _per_call_ms(our_fn, single)
+
+            self.stdout.write(f"{name} ({scorer.loss}, scorer dibangun {build_ms:.0f} ms)")
+            self.stdout.write(f"  selisih {what} maks : {max_diff:.2e}")
+            self.stdout.write(f"  satu komentar     : sklearn {sk_single:.3f} ms, scorer {our_single:.3f} ms "
+                              f"({sk_single / our_single:.1f}x)")
+            self.stdout.write(f"  batch {len(texts):>6}      : sklearn {sk_batch:.2f} s, scorer {our_batch:.2f} s "
+                              f"({sk_batch / our_batch:.1f}x)")
+            if max_diff > options["tolerance"]:
+                failed.append(name)
+
+        if failed:
+            raise CommandError(f"Selisih melebihi toleransi {options['tolerance']:g}: {', '.join(failed)}")
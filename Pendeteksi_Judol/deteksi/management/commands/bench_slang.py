@@ -0,0 +1,76 @@
+import csv
+import random
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from deteksi.ml import preprocess as pp
+
+DATASET_PATH = Path(__file__).resolve().parents[3] / "dataset" / "dataset_training.csv"
+
+def _timed_preprocess(texts, slang):
+    """Menjalankan preprocess serial dengan peta slang tertentu; mengembalikan (hasil, detik)."""
+    original = pp.SLANG_MAP
+    pp.SLANG_MAP = slang
+    try:
+        start = time.perf_counter()
+        out = [pp.preprocess(t) for t in texts]
+        return out, time.perf_counter() - start
+    finally:
+        pp.SLANG_MAP = original
+
+class Command(BaseCommand):
+    help = "Mengukur biaya tahap normalisasi bahasa alay (PREPROCESS_SLANG) per 10k komentar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dataset", default=str(DATASET_PATH), help="CSV dengan kolom text,label.")
+        parser.add_argument("-n", "--size", type=int, default=10_000, help="Jumlah komentar sampel.")
+        parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan (diambil yang tercepat).")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--accuracy", action="store_true",
+                            help="Juga membandingkan akurasi model produksi dengan dan tanpa tahap slang.")
+
+    def handle(self, *args, **options):
+        with open(options["dataset"], encoding="utf-8") as f:
+            rows = [r for r in csv.DictReader(f) if r.get("text")]
+        rng = random.Random(options["seed"])
+        sample = [rng.choice(rows) for _ in range(options["size"])]
+        texts = [r["text"] for r in sample]
+
+        start = time.perf_counter()
+        slang = pp.build_slang_map()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Kedua varian dijalankan bergantian agar gangguan mesin (CPU lain, cache) terbagi rata.
+        t_off = t_on = float("inf")
+        for _ in range(options["repeat"]):
+            base, elapsed = _timed_preprocess(texts, pp.MappingProxyType({}))
+            t_off = min(t_off, elapsed)
+            with_slang, elapsed = _timed_preprocess(texts, slang)
+            t_on = min(t_on, elapsed)
+
+        tokens = [tok for c in base for tok in c.split()]
+        hit_tokens = sum(1 for tok in tokens if tok in slang)
+        changed = sum(1 for a, b in zip(base, with_slang) if a != b)
+        per_10k = 10_000 / len(texts)
+
+        self.stdout.write(f"Kamus slang: {len(slang)} entri (dibangun dalam {build_ms:.1f} ms)")
+        self.stdout.write(f"Sampel: {len(texts)} komentar, {len(tokens)} token")
+        self.stdout.write(f"Tanpa slang : {t_off * per_10k * 1000:8.1f} ms / 10k komentar")
+        self.stdout.write(f"Dengan slang: {t_on * per_10k * 1000:8.1f} ms / 10k komentar")
+        self.stdout.write(f"Selisih     : {(t_on - t_off) * per_10k * 1000:+8.1f} ms / 10k komentar "
+                          f"({(t_on / t_off - 1) * 100:+.1f}%)")
+        self.stdout.write(f"Token terganti: {hit_tokens} ({hit_tokens / max(len(tokens), 1):.2%}), "
+                          f"komentar berubah: {changed} ({changed / len(texts):.2%})")
+
+        if options["accuracy"]:
+            from deteksi.ml import predict
+            from deteksi.ml.registry import get_active_model
+            pipeline = get_active_model().pipeline
+            labels = [int(r["label"]) for r in sample]
+            for name, cleans in (("tanpa slang", base), ("dengan slang", with_slang)):
+                proba = pipeline.predict_proba(cleans)[:, 1]
+                pred = (proba >= predict.BEST_THR).astype(int)
+                acc = sum(int(p == y) for p, y in zip(pred, labels)) / len(labels)
+                self.stdout.write(f"Akurasi {name}: {acc:.4f}")
@@ -0,0 +1,70 @@
+import sys
+import unicodedata
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.preprocess import emoji_char_to_ascii, EMOJI_MAP
+
+EMOJI_MAP_PATH = Path(__file__).resolve().parents[2] / "ml" / "asset" / "kamus" / "kamus_emoji.py"
+EMOJI_MAP_VERSION = 1
+PER_LINE = 8
+
+def build_emoji_map() -> dict:
+    """
+    Memindai seluruh code point Unicode dan mengumpulkan karakter yang diubah oleh
+    `emoji_char_to_ascii` (regional indicator, huruf squared/circled, keycap, angka).
+
+    Returns:
+        dict: Peta code point (int) -> pengganti ASCII.
+    """
+    table = {}
+    for cp in range(sys.maxunicode + 1):
+        if 0xD800 <= cp <= 0xDFFF:
+            continue
+        ch = chr(cp)
+        out = emoji_char_to_ascii(ch)
+        if out != ch:
+            table[cp] = out
+    return table
+
+def render_emoji_map(table: dict) -> str:
+    """Merender tabel menjadi modul Python yang bisa di-import."""
+    lines = [
+        "# File ini dibangkitkan oleh `python manage.py build_emoji_map`. Jangan diedit manual.",
+        f"EMOJI_MAP_VERSION = {EMOJI_MAP_VERSION}",
+        f'UNICODE_VERSION = "{unicodedata.unidata_version}"',
+        "",
+        "EMOJI_MAP = {",
+    ]
+    items = sorted(table.items())
+    for i in range(0, len(items), PER_LINE):
+        chunk = items[i:i + PER_LINE]
+        lines.append("    " + " ".join(f"0x{cp:05X}: {out!r}," for cp, out in chunk))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+class Command(BaseCommand):
+    help = "Membangkitkan tabel emoji/keycap/regional-indicator -> ASCII (kamus_emoji.py)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true",
+                            help="Hanya memeriksa apakah tabel yang ada masih sesuai dengan versi Unicode saat ini.")
+        parser.add_argument("--output", default=str(EMOJI_MAP_PATH), help="Lokasi file keluaran.")
+
+    def handle(self, *args, **options):
+        table = build_emoji_map()
+
+        if options["check"]:
+            if table != EMOJI_MAP:
+                raise CommandError(
+                    f"EMOJI_MAP tidak sesuai dengan Unicode {unicodedata.unidata_version}; "
+                    "jalankan `python manage.py build_emoji_map`."
+                )
+            self.stdout.write(self.style.SUCCESS(f"EMOJI_MAP sesuai ({len(table)} code point)."))
+            return
+
+        Path(options["output"]).write_text(render_emoji_map(table), encoding="utf-8")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(table)} code point ditulis ke {options['output']} (Unicode {unicodedata.unidata_version})."
+        ))
@@ -0,0 +1,75 @@
+import csv
+import random
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.calibration import CALIBRATION_METHODS, calibration_path, fit_calibrator, save_calibrator
+from deteksi.ml.evaluation import calibration_metrics, classification_metrics
+from deteksi.ml.predict import BEST_THR
+from deteksi.ml.preprocess import preprocess_many
+from deteksi.ml.registry import ModelRegistry, get_registry
+from deteksi.ml.shared_model import source_signature
+
+# Data latih model; skornya terlalu yakin sehingga tidak boleh dipakai untuk kalibrasi.
+TRAINING_PATH = Path(__file__).resolve().parents[3] / "dataset" / "dataset_training.csv"
+
+class Command(BaseCommand):
+    help = ("Mem-fit kalibrasi (isotonic/Platt) untuk satu versi model secara offline dan menyimpannya "
+            "sebagai tabel interpolasi di deteksi/ml/model/calibration/. Wajib memakai data berlabel yang "
+            "tidak ikut melatih model (--dataset); tabel baru dipakai jika JUDOL_CALIBRATION=1.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", nargs="?", default=None, help="Versi model (default: model aktif).")
+        parser.add_argument("--dataset", required=True,
+                            help="CSV held-out dengan kolom text,label yang tidak dipakai saat melatih model "
+                                 f"(bukan {TRAINING_PATH.name}).")
+        parser.add_argument("--method", default="isotonic", choices=CALIBRATION_METHODS)
+        parser.add_argument("--holdout", type=float, default=0.3,
+                            help="Porsi data untuk mengukur kalibrasi (tidak dipakai untuk fit).")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--dry-run", action="store_true", help="Hanya laporkan, jangan simpan tabel.")
+
+    def handle(self, *args, **options):
+        registry = get_registry()
+        name = options["model"] or registry.configured_name()
+        if not registry.path_for(name).exists():
+            raise CommandError(f"Model tidak dikenal: {name}")
+        model = ModelRegistry(shared=False, calibration=False).load(name)
+        if Path(options["dataset"]).resolve() == TRAINING_PATH:
+            raise CommandError(f"{TRAINING_PATH.name} adalah data latih model; gunakan data held-out untuk kalibrasi.")
+
+        with open(options["dataset"], encoding="utf-8") as f:
+            rows = [r for r in csv.DictReader(f) if r.get("text") is not None]
+        random.Random(options["seed"]).shuffle(rows)
+        cleans = preprocess_many([r["text"] for r in rows])
+        labels = [int(r["label"]) for r in rows]
+        scores = [float(s) for s in model.raw_scores(cleans)]
+        cut = int(len(rows) * (1 - options["holdout"]))
+
+        calibrator = fit_calibrator(scores[:cut], labels[:cut], options["method"], name)
+        calibrator.meta["source_signature"] = source_signature(model.path)
+        calibrator.meta["dataset"] = Path(options["dataset"]).name
+
+        test_scores, test_labels = scores[cut:], labels[cut:]
+        calibrated = calibrator(test_scores).tolist()
+        has_proba = all(0.0 <= s <= 1.0 for s in scores)
+        self.stdout.write(f"Model {name}: fit {options['method']} pada {cut} komentar, "
+                          f"uji {len(test_labels)} komentar, {calibrator.x.size} titik tabel")
+        self.stdout.write(f"  {'':<12} {'brier':>8} {'ece':>8} {'akurasi':>8} {'f1':>7}")
+        if has_proba:
+            self._row("mentah", test_scores, test_labels)
+        else:
+            self.stdout.write(f"  {'mentah':<12} (skor decision_function, bukan proba)")
+        self._row("terkalibrasi", calibrated, test_labels)
+
+        if options["dry_run"]:
+            return
+        path = save_calibrator(calibrator, calibration_path(name, registry.model_dir / "calibration"))
+        self.stdout.write(f"Disimpan ke {path}")
+
+    def _row(self, label, probas, labels):
+        cal = calibration_metrics(probas, labels)
+        res = classification_metrics([int(p >= BEST_THR) for p in probas], labels)
+        self.stdout.write(f"  {label:<12} {cal['brier']:>8.4f} {cal['ece']:>8.4f} {res['accuracy']:>8.4f} "
+                          f"{res['f1']:>7.4f}")
@@ -0,0 +1,153 @@
+import csv
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.compact import QUANT_DTYPES, compact_name, compact_pipeline, write_compact_model
+from deteksi.ml.linear_scorer import _vectorizer_list
+from deteksi.ml.preprocess import preprocess_many
+from deteksi.ml.registry import ModelRegistry, get_registry
+
+PROJECT_DIR = Path(__file__).resolve().parents[3]
+DATASET_PATH = PROJECT_DIR / "dataset" / "dataset_training.csv"
+
+# Proses anak: mengimpor sklearn dan registry, memuat satu model seperti worker (kecuali
+# nama "-" sebagai pembanding), lalu melaporkan waktu muat dan VmRSS-nya sendiri.
+_CHILD = """
+import json, sys
+name = sys.argv[1]
+seconds = 0.0
+import sklearn.pipeline, sklearn.linear_model, sklearn.feature_extraction.text
+from deteksi.ml.registry import ModelRegistry
+if name != "-":
+    seconds = ModelRegistry(shared=False).load(name).load_seconds
+rss = 0
+with open("/proc/self/status") as f:
+    for line in f:
+        if line.startswith("VmRSS:"):
+            rss = int(line.split()[1])
+print(json.dumps({"load_seconds": seconds, "rss_kb": rss}))
+"""
+
+def measure_load(name: str) -> dict:
+    """Memuat model `name` di proses baru; mengembalikan waktu muat dan RSS proses."""
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_DIR)}
+    out = subprocess.run([sys.executable, "-c", _CHILD, name], cwd=PROJECT_DIR, env=env,
+                         capture_output=True, text=True)
+    if out.returncode != 0:
+        raise CommandError(f"Gagal memuat {name} di proses uji:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def vocabulary_size(pipeline) -> int:
+    return sum(len(v.vocabulary_) for _, v in _vectorizer_list(pipeline))
+
+class Command(BaseCommand):
+    help = ("Membuat versi ringkas model (fitur berkoefisien kecil dipangkas, koefisien float16/int8) "
+            "dan melaporkan selisih akurasi, ukuran vocabulary, waktu muat, dan RSS.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="Versi model sumber (default: model aktif).")
+        parser.add_argument("--thresholds", nargs="+", type=float, default=[0.01, 0.05, 0.1],
+                            help="Ambang |koefisien| untuk pemangkasan.")
+        parser.add_argument("--dtypes", nargs="+", choices=QUANT_DTYPES, default=["float16", "int8"],
+                            help="Tipe penyimpanan koefisien.")
+        parser.add_argument("--dataset", default=str(DATASET_PATH), help="CSV dengan kolom text,label.")
+        parser.add_argument("--holdout", type=float, default=0.2,
+                            help="Porsi dataset (sampel acak ber-seed) untuk evaluasi; 1 = seluruh file.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Hanya evaluasi di memori; tidak menulis file model (tanpa ukur RSS).")
+        parser.add_argument("--json", action="store_true", help="Keluaran laporan dalam format JSON.")
+
+    def handle(self, *args, **options):
+        registry = get_registry()
+        available = {i.name for i in registry.available()}
+        names = options["names"] or [registry.configured_name()]
+        unknown = [n for n in names if n not in available]
+        if unknown:
+            raise CommandError(f"Model tidak dikenal: {', '.join(unknown)}")
+
+        with open(options["dataset"], encoding="utf-8") as f:
+            rows = [r for r in csv.DictReader(f) if r.get("text") is not None]
+        if options["holdout"] < 1:
+            rows = random.Random(options["seed"]).sample(rows, max(1, int(len(rows) * options["holdout"])))
+        labels = np.asarray([int(r["label"]) for r in rows])
+        texts = preprocess_many([r["text"] for r in rows])
+
+        loader = ModelRegistry(shared=False, linear_scorer=False)
+        baseline = None if options["dry_run"] else measure_load("-")
+        report = []
+        for name in names:
+            source = loader.load(name)
+            base_pred = source.pipeline.predict(texts)
+            base_acc = float((base_pred == labels).mean())
+            base_vocab = vocabulary_size(source.pipeline)
+            entry = {
+                "model": name,
+                "eval_rows": len(rows),
+                "accuracy": base_acc,
+                "vocabulary": base_vocab,
+                "file_kb": round(source.path.stat().st_size / 1024, 1),
+                "variants": [],
+            }
+            if baseline:
+                entry.update(self._memory(name, baseline))
+
+            for threshold in options["thresholds"]:
+                for dtype in options["dtypes"]:
+                    if options["dry_run"]:
+                        variant_name = compact_name(name, threshold, dtype)
+                        pipeline, _, _ = compact_pipeline(source.pipeline, threshold, dtype)
+                        path = None
+                    else:
+                        variant_name, path, pipeline = write_compact_model(source, threshold, dtype)
+                    pred = pipeline.predict(texts)
+                    vocab = vocabulary_size(pipeline)
+                    variant = {
+                        "name": variant_name,
+                        "threshold": threshold,
+                        "dtype": dtype,
+                        "accuracy": float((pred == labels).mean()),
+                        "accuracy_delta": float((pred == labels).mean()) - base_acc,
+                        "flips": int((pred != base_pred).sum()),
+                        "vocabulary": vocab,
+                        "vocabulary_reduction": 1 - vocab / base_vocab if base_vocab else 0.0,
+                    }
+                    if path is not None:
+                        variant["file_kb"] = round(path.stat().st_size / 1024, 1)
+                        variant.update(self._memory(variant_name, baseline))
+                    entry["variants"].append(variant)
+            report.append(entry)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            for entry in report:
+                self._write_entry(entry)
+
+    def _memory(self, name: str, baseline: dict) -> dict:
+        mem = measure_load(name)
+        return {"load_seconds": mem["load_seconds"], "model_rss_kb": mem["rss_kb"] - baseline["rss_kb"]}
+
+    def _write_entry(self, entry: dict):
+        self.stdout.write(
+            f"{entry['model']}: akurasi {entry['accuracy']:.4f} pada {entry['eval_rows']} komentar, "
+            f"vocabulary {entry['vocabulary']}, file {entry['file_kb']:.0f} KB"
+            + (f", muat {entry['load_seconds']:.2f} s, RSS model {entry['model_rss_kb'] / 1024:.1f} MB"
+               if "load_seconds" in entry else "")
+        )
+        self.stdout.write(f"  {'varian':<34} {'akurasi':>8} {'delta':>8} {'flip':>5} {'vocab':>7} "
+                          f"{'-vocab':>7} {'file KB':>8} {'muat s':>7} {'RSS MB':>7}")
+        for v in entry["variants"]:
+            extra = (f" {v['file_kb']:>8.0f} {v['load_seconds']:>7.2f} {v['model_rss_kb'] / 1024:>7.1f}"
+                     if "file_kb" in v else "")
+            self.stdout.write(
+                f"  {v['name']:<34} {v['accuracy']:>8.4f} {v['accuracy_delta']:>+8.4f} {v['flips']:>5} "
+                f"{v['vocabulary']:>7} {v['vocabulary_reduction']:>7.1%}{extra}"
+            )
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.lexicon import (
+    COMPILED_DIR, LEXICON_SOURCES, CompiledLexicon, compile_lexicon, is_stale,
+)
+
+class Command(BaseCommand):
+    help = "Mengompilasi kamus di asset/ (kamus_alay, lexicon_alay, dll.) menjadi file biner .lex yang bisa di-mmap."
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help=f"Leksikon yang dikompilasi (default semua: {', '.join(LEXICON_SOURCES)}).")
+        parser.add_argument("--check", action="store_true",
+                            help="Hanya memeriksa apakah file .lex ada dan sesuai dengan sumbernya.")
+        parser.add_argument("--output", default=str(COMPILED_DIR), help="Folder keluaran.")
+
+    def handle(self, *args, **options):
+        names = options["names"] or list(LEXICON_SOURCES)
+        unknown = [n for n in names if n not in LEXICON_SOURCES]
+        if unknown:
+            raise CommandError(f"Leksikon tidak dikenal: {', '.join(unknown)}")
+
+        if options["check"]:
+            stale = [n for n in names if is_stale(n, options["output"])]
+            if stale:
+                raise CommandError(
+                    f"Leksikon usang/tidak ada: {', '.join(stale)}; jalankan `python manage.py compile_lexicons`."
+                )
+            self.stdout.write(self.style.SUCCESS(f"{len(names)} leksikon sesuai dengan sumbernya."))
+            return
+
+        for name in names:
+            start = time.perf_counter()
+            path = compile_lexicon(name, options["output"])
+            elapsed = time.perf_counter() - start
+            lex = CompiledLexicon(path)
+            self.stdout.write(
+                f"{name}: {len(lex)} entri, {path.stat().st_size / 1024:.1f} KB, {elapsed * 1000:.0f} ms -> {path}"
+            )
+            lex.close()
+        self.stdout.write(self.style.SUCCESS(f"{len(names)} leksikon dikompilasi."))
@@ -0,0 +1,70 @@
+import csv
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.cascade import CASCADE_MODES, get_lexicon_stage
+from deteksi.ml.evaluation import classification_metrics
+from deteksi.ml.predict import BEST_THR
+from deteksi.ml.preprocess import preprocess_many
+from deteksi.ml.registry import ModelRegistry, get_registry
+
+DATASET_PATH = Path(__file__).resolve().parents[3] / "dataset" / "dataset_training.csv"
+
+class Command(BaseCommand):
+    help = "Evaluasi offline kaskade (tahap kamus + model) terhadap dataset berlabel."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dataset", default=str(DATASET_PATH), help="CSV dengan kolom text,label.")
+        parser.add_argument("--model", default=None, help="Versi model (default: model aktif).")
+        parser.add_argument("--modes", nargs="*", default=[m for m in CASCADE_MODES if m != "off"],
+                            choices=CASCADE_MODES, help="Mode kaskade yang dievaluasi.")
+        parser.add_argument("--allow-loss", action="store_true",
+                            help="Jangan gagal meskipun akurasi kaskade lebih rendah dari model saja.")
+
+    def handle(self, *args, **options):
+        with open(options["dataset"], encoding="utf-8") as f:
+            rows = [r for r in csv.DictReader(f) if r.get("text") is not None]
+        labels = [int(r["label"]) for r in rows]
+        cleans = preprocess_many([r["text"] for r in rows])
+
+        name = options["model"] or get_registry().configured_name()
+        model = ModelRegistry().load(name)
+        start = time.perf_counter()
+        probas = model.proba_positive(cleans)
+        model_seconds = time.perf_counter() - start
+        model_pred = [int(p >= BEST_THR) if c.strip() else 0 for p, c in zip(probas, cleans)]
+        base = classification_metrics(model_pred, labels)
+
+        self.stdout.write(f"Dataset: {len(rows)} komentar, model {name}")
+        self.stdout.write(f"  {'mode':<10} {'tahap1+':>8} {'tahap1-':>8} {'ke model':>9} {'akurasi':>9} "
+                          f"{'f1':>7} {'fp':>5} {'fn':>5} {'beda':>5} {'ms/10k':>8}")
+        self._row("off", 0, 0, len(rows), base, 0, model_seconds / len(rows) * 10_000 * 1000)
+
+        stage = get_lexicon_stage()
+        failed = []
+        for mode in options["modes"]:
+            start = time.perf_counter()
+            decisions = [stage.decide(c, mode) if c.strip() else None for c in cleans]
+            stage_seconds = time.perf_counter() - start
+            pred = [m if d is None else d for d, m in zip(decisions, model_pred)]
+            res = classification_metrics(pred, labels)
+            n_pos = sum(1 for d in decisions if d == 1)
+            n_neg = sum(1 for d in decisions if d == 0)
+            remaining = len(rows) - n_pos - n_neg
+            # Perkiraan biaya: tahap 1 untuk semua + model hanya untuk sisanya.
+            cost = stage_seconds + model_seconds * remaining / len(rows)
+            diff = sum(1 for a, b in zip(pred, model_pred) if a != b)
+            self._row(mode, n_pos, n_neg, remaining, res, diff, cost / len(rows) * 10_000 * 1000)
+            if res["accuracy"] < base["accuracy"]:
+                failed.append(mode)
+
+        if failed and not options["allow_loss"]:
+            raise CommandError(f"Akurasi turun dibanding model saja pada mode: {', '.join(failed)}")
+
+    def _row(self, mode, n_pos, n_neg, remaining, res, diff, ms_per_10k):
+        self.stdout.write(
+            f"  {mode:<10} {n_pos:>8} {n_neg:>8} {remaining:>9} {res['accuracy']:>9.4f} {res['f1']:>7.4f} "
+            f"{res['fp']:>5} {res['fn']:>5} {diff:>5} {ms_per_10k:>8.0f}"
+        )
@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.registry import ModelRegistry, get_registry
+from deteksi.ml.shared_model import SHARED_DIR, export_shared_model
+
+PROJECT_DIR = Path(__file__).resolve().parents[3]
+
+# Dijalankan di setiap proses anak: memuat model (biasa / mmap), menskor beberapa teks
+# seperti worker yang sudah melayani request, lalu menunggu sampai stdin ditutup.
+_CHILD = """
+import sys
+from deteksi.ml.registry import ModelRegistry
+mode, name = sys.argv[1], sys.argv[2]
+if mode != "baseline":
+    model = ModelRegistry(shared=(mode == "mmap")).load(name)
+    model.pipeline.predict_proba(["slot gacor maxwin hari ini", "videonya bagus banget kak"] * 50)
+else:
+    import sklearn.pipeline, sklearn.linear_model, sklearn.feature_extraction.text
+print("ready", flush=True)
+sys.stdin.read()
+"""
+
+def _memory_kb(pid: int) -> dict:
+    """Membaca Rss/Pss proses dari /proc/<pid>/smaps_rollup (Linux)."""
+    out = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                out[key] = int(rest.split()[0])
+    return out
+
+def measure_workers(mode: str, name: str, workers: int) -> list[dict]:
+    """Menjalankan beberapa proses sekaligus dalam satu mode dan mengukur memori masing-masing."""
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_DIR)}
+    procs = [
+        subprocess.Popen([sys.executable, "-c", _CHILD, mode, name], cwd=PROJECT_DIR, env=env,
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(workers)
+    ]
+    try:
+        for p in procs:
+            if p.stdout.readline().strip() != "ready":
+                raise CommandError(f"Proses uji ({mode}) gagal memuat model {name}")
+        return [_memory_kb(p.pid) for p in procs]
+    finally:
+        for p in procs:
+            p.stdin.close()
+            p.wait()
+
+class Command(BaseCommand):
+    help = "Mengekspor model ke tata letak mmap bersama (JUDOL_SHARED_MODEL=1) dan melaporkan RSS/PSS per worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="Versi model (default: model aktif).")
+        parser.add_argument("--all", action="store_true", help="Ekspor semua model di deteksi/ml/model/.")
+        parser.add_argument("--report", action="store_true",
+                            help="Bandingkan RSS/PSS worker yang memuat joblib biasa vs ekspor mmap.")
+        parser.add_argument("--workers", type=int, default=3, help="Jumlah proses uji untuk --report.")
+
+    def handle(self, *args, **options):
+        registry = get_registry()
+        available = [i.name for i in registry.available()]
+        names = available if options["all"] else (options["names"] or [registry.configured_name()])
+        unknown = [n for n in names if n not in available]
+        if unknown:
+            raise CommandError(f"Model tidak dikenal: {', '.join(unknown)}")
+
+        for name in names:
+            start = time.perf_counter()
+            folder = export_shared_model(ModelRegistry(shared=False).load(name), SHARED_DIR)
+            size = sum(f.stat().st_size for f in folder.iterdir())
+            self.stdout.write(f"{name}: {size / 1024:.0f} KB -> {folder} ({time.perf_counter() - start:.2f} s)")
+
+        if not options["report"]:
+            return
+
+        workers = options["workers"]
+        for name in names:
+            self.stdout.write(f"\n{name} ({workers} worker; 'model' = Pss dikurangi worker tanpa model)")
+            self.stdout.write(f"  {'mode':<9} {'Rss/worker':>12} {'Pss/worker':>12} {'model/worker':>13} {'total Pss':>12}")
+            base_pss = None
+            for mode in ("baseline", "joblib", "mmap"):
+                mem = measure_workers(mode, name, workers)
+                rss = sum(m["Rss"] for m in mem) / workers / 1024
+                pss = sum(m["Pss"] for m in mem) / workers / 1024
+                base_pss = pss if base_pss is None else base_pss
+                self.stdout.write(
+                    f"  {mode:<9} {rss:>9.1f} MB {pss:>9.1f} MB {pss - base_pss:>10.1f} MB {pss * workers:>9.1f} MB"
+                )
@@ -0,0 +1,46 @@
+import json
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from deteksi.ml.registry import get_registry
+
+class Command(BaseCommand):
+    help = "Menampilkan daftar versi model di deteksi/ml/model/ beserta model yang aktif."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--describe", action="store_true",
+                            help="Memuat setiap model untuk menampilkan classifier, jumlah fitur, dan vectorizer.")
+        parser.add_argument("--json", action="store_true", help="Keluaran dalam format JSON.")
+
+    def handle(self, *args, **options):
+        registry = get_registry()
+        active = registry.configured_name()
+        rows = []
+        for info in registry.available():
+            row = {
+                "name": info.name,
+                "active": info.name == active,
+                "size_kb": round(info.size_bytes / 1024, 1),
+                "modified": datetime.fromtimestamp(info.modified).isoformat(timespec="seconds"),
+            }
+            if options["describe"]:
+                desc = registry.describe(info.name)
+                row.update({
+                    "classifier": desc["classifier"],
+                    "n_features": desc["n_features"],
+                    "load_seconds": round(desc["load_seconds"], 3),
+                    "vectorizers": desc["vectorizers"],
+                })
+            rows.append(row)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(rows, indent=2))
+            return
+
+        for row in rows:
+            mark = "*" if row["active"] else " "
+            line = f"{mark} {row['name']:<28} {row['size_kb']:>8} KB  {row['modified']}"
+            if options["describe"]:
+                line += f"  {row['classifier']:<20} {row['n_features']:>7} fitur  {row['load_seconds']:.2f} s"
+            self.stdout.write(line)
@@ -0,0 +1,49 @@
+import json
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.shadow import SHADOW_LOG_DIR
+
+class Command(BaseCommand):
+    help = "Merangkum log shadow scoring: tingkat ketidaksepakatan, arah perubahan label, dan latensi."
+
+    def add_arguments(self, parser):
+        parser.add_argument("files", nargs="*", help=f"File log (default: semua *.jsonl di {SHADOW_LOG_DIR}).")
+        parser.add_argument("--examples", type=int, default=10, help="Jumlah contoh ketidaksepakatan yang ditampilkan.")
+
+    def handle(self, *args, **options):
+        files = [Path(f) for f in options["files"]] or sorted(SHADOW_LOG_DIR.glob("*.jsonl"))
+        if not files:
+            raise CommandError(f"Tidak ada log shadow di {SHADOW_LOG_DIR}")
+
+        for path in files:
+            entries = []
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue  # baris terakhir yang terpotong
+            if not entries:
+                continue
+            n = sum(e["n"] for e in entries)
+            diffs = [d for e in entries for d in e["diff"]]
+            direction = Counter("non->judol" if cand >= prod else "judol->non" for _, prod, cand in diffs)
+            prod_ms = np.array([e["prod_ms"] / e["n"] for e in entries])
+            cand_ms = np.array([e["cand_ms"] / e["n"] for e in entries])
+
+            first = entries[0]
+            self.stdout.write(f"{path.name}: {first['prod']} (produksi) vs {first['cand']} (kandidat)")
+            self.stdout.write(f"  {len(entries)} batch, {n} komentar, {entries[0]['ts']} .. {entries[-1]['ts']}")
+            self.stdout.write(f"  judol: produksi {sum(e['pos_prod'] for e in entries)}, "
+                              f"kandidat {sum(e['pos_cand'] for e in entries)}")
+            self.stdout.write(f"  tidak sepakat: {len(diffs)} ({len(diffs) / n:.2%}) "
+                              f"[{', '.join(f'{k}: {v}' for k, v in direction.most_common())}]")
+            self.stdout.write(f"  ms/komentar p50/p99: produksi {np.percentile(prod_ms, 50):.3f}/"
+                              f"{np.percentile(prod_ms, 99):.3f}, kandidat {np.percentile(cand_ms, 50):.3f}/"
+                              f"{np.percentile(cand_ms, 99):.3f}")
+            for text, prod, cand in diffs[-options["examples"]:]:
+                self.stdout.write(f"    {prod:.2f} -> {cand:.2f}  {text}")
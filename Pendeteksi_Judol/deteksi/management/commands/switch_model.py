@@ -0,0 +1,35 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.registry import get_registry
+
+class Command(BaseCommand):
+    help = "Mengganti model aktif untuk semua worker (menulis file penunjuk ACTIVE) tanpa restart."
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", help="Nama versi model, misal v16 atau v17_sdg.")
+        parser.add_argument("--no-verify", action="store_true",
+                            help="Lewati pemuatan uji sebelum file penunjuk ditulis.")
+
+    def handle(self, *args, **options):
+        registry = get_registry()
+        name = options["name"]
+        names = [i.name for i in registry.available()]
+        if name not in names:
+            raise CommandError(f"Model {name!r} tidak ada. Tersedia: {', '.join(names)}")
+
+        if not options["no_verify"]:
+            model = registry.load(name)
+            model.pipeline.predict_proba(["uji"])
+            self.stdout.write(f"Model {name} berhasil dimuat ({model.load_seconds:.2f} s).")
+
+        registry.set_pointer(name)
+        self.stdout.write(self.style.SUCCESS(
+            f"Model aktif -> {name} ({registry.pointer}). Worker berpindah dalam "
+            f"{registry.poll_interval:g} detik."
+        ))
+        if os.environ.get("JUDOL_MODEL"):
+            self.stdout.write(self.style.WARNING(
+                f"Env JUDOL_MODEL={os.environ['JUDOL_MODEL']} masih diset dan mengalahkan file penunjuk."
+            ))
@@ -0,0 +1,84 @@
+import csv
+import platform
+import random
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import sklearn
+from django.core.management.base import BaseCommand, CommandError
+
+from deteksi.ml.hashing import CHAR_NGRAMS, HASH_FEATURES, WORD_NGRAMS, build_hashing_pipeline
+from deteksi.ml.preprocess import preprocess_many
+from deteksi.ml.registry import ModelRegistry, get_registry, save_model_blob
+
+DATASET_PATH = Path(__file__).resolve().parents[3] / "dataset" / "dataset_training.csv"
+
+def _fit(pipeline, texts, labels) -> float:
+    start = time.perf_counter()
+    pipeline.fit(texts, labels)
+    return time.perf_counter() - start
+
+class Command(BaseCommand):
+    help = ("Melatih pipeline berbasis feature hashing (HashingVectorizer + TfidfTransformer) tanpa "
+            "vocabulary, mengevaluasinya pada data uji, lalu menyimpannya ke deteksi/ml/model/.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--name", default="v21_hashing", help="Nama versi model yang disimpan.")
+        parser.add_argument("--dataset", default=str(DATASET_PATH), help="CSV dengan kolom text,label.")
+        parser.add_argument("--n-features", type=int, default=HASH_FEATURES,
+                            help="Jumlah kolom hash per vectorizer.")
+        parser.add_argument("--holdout", type=float, default=0.2, help="Porsi data uji untuk evaluasi.")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--compare", default=None,
+                            help="Model pembanding untuk waktu muat dan ukuran (default: model aktif).")
+        parser.add_argument("--no-refit", action="store_true",
+                            help="Simpan model hasil latih pada porsi latih saja (tanpa latih ulang di seluruh data).")
+        parser.add_argument("--force", action="store_true", help="Timpa model dengan nama yang sama.")
+
+    def handle(self, *args, **options):
+        registry = get_registry()
+        name = options["name"]
+        if registry.path_for(name).exists() and not options["force"]:
+            raise CommandError(f"Model {name!r} sudah ada; pakai --force untuk menimpa.")
+
+        with open(options["dataset"], encoding="utf-8") as f:
+            rows = [r for r in csv.DictReader(f) if r.get("text") is not None]
+        random.Random(options["seed"]).shuffle(rows)
+        texts = preprocess_many([r["text"] for r in rows])
+        labels = np.asarray([int(r["label"]) for r in rows])
+        cut = int(len(rows) * (1 - options["holdout"]))
+
+        n_features = options["n_features"]
+        pipeline = build_hashing_pipeline(n_features)
+        fit_seconds = _fit(pipeline, texts[:cut], labels[:cut])
+        accuracy = float((pipeline.predict(texts[cut:]) == labels[cut:]).mean())
+        self.stdout.write(f"Latih {cut} komentar dalam {fit_seconds:.1f} s; "
+                          f"akurasi data uji ({len(rows) - cut}): {accuracy:.4f}")
+
+        if not options["no_refit"]:
+            pipeline = build_hashing_pipeline(n_features)
+            fit_seconds = _fit(pipeline, texts, labels)
+            self.stdout.write(f"Latih ulang di seluruh {len(rows)} komentar dalam {fit_seconds:.1f} s")
+
+        path = save_model_blob({
+            "pipeline": pipeline,
+            "version": name,
+            "notes": (f"HashingVectorizer (word {WORD_NGRAMS} + char_wb {CHAR_NGRAMS}, {n_features} kolom) "
+                      f"+ TfidfTransformer + LogisticRegression"),
+            "env": {"python": platform.python_version(), "sklearn": sklearn.__version__,
+                    "joblib": joblib.__version__},
+            "hashing": {"n_features": n_features, "holdout_accuracy": accuracy, "trained_rows": len(rows)},
+        }, name)
+
+        loader = ModelRegistry(shared=False, linear_scorer=False)
+        compare = options["compare"] or registry.configured_name()
+        self.stdout.write(f"Disimpan ke {path}")
+        self.stdout.write(f"  {'model':<16} {'file KB':>8} {'muat s':>7} {'fitur':>9}")
+        for label in (name, compare):
+            model = loader.load(label)
+            self.stdout.write(
+                f"  {label:<16} {model.path.stat().st_size / 1024:>8.0f} {model.load_seconds:>7.2f} "
+                f"{model.pipeline.steps[-1][1].coef_.shape[1]:>9}"
+            )
@@ -0,0 +1,175 @@
+# File ini dibangkitkan oleh `python manage.py build_emoji_map`. Jangan diedit manual.
+EMOJI_MAP_VERSION = 1
+UNICODE_VERSION = "14.0.0"
+
+EMOJI_MAP = {
+    0x000B2: '2', 0x000B3: '3', 0x000B9: '1', 0x00660: '0', 0x00661: '1', 0x00662: '2', 0x00663: '3', 0x00664: '4',
+    0x00665: '5', 0x00666: '6', 0x00667: '7', 0x00668: '8', 0x00669: '9', 0x006F0: '0', 0x006F1: '1', 0x006F2: '2',
+    0x006F3: '3', 0x006F4: '4', 0x006F5: '5', 0x006F6: '6', 0x006F7: '7', 0x006F8: '8', 0x006F9: '9', 0x007C0: '0',
+    0x007C1: '1', 0x007C2: '2', 0x007C3: '3', 0x007C4: '4', 0x007C5: '5', 0x007C6: '6', 0x007C7: '7', 0x007C8: '8',
+    0x007C9: '9', 0x00966: '0', 0x00967: '1', 0x00968: '2', 0x00969: '3', 0x0096A: '4', 0x0096B: '5', 0x0096C: '6',
+    0x0096D: '7', 0x0096E: '8', 0x0096F: '9', 0x009E6: '0', 0x009E7: '1', 0x009E8: '2', 0x009E9: '3', 0x009EA: '4',
+    0x009EB: '5', 0x009EC: '6', 0x009ED: '7', 0x009EE: '8', 0x009EF: '9', 0x00A66: '0', 0x00A67: '1', 0x00A68: '2',
+    0x00A69: '3', 0x00A6A: '4', 0x00A6B: '5', 0x00A6C: '6', 0x00A6D: '7', 0x00A6E: '8', 0x00A6F: '9', 0x00AE6: '0',
+    0x00AE7: '1', 0x00AE8: '2', 0x00AE9: '3', 0x00AEA: '4', 0x00AEB: '5', 0x00AEC: '6', 0x00AED: '7', 0x00AEE: '8',
+    0x00AEF: '9', 0x00B66: '0', 0x00B67: '1', 0x00B68: '2', 0x00B69: '3', 0x00B6A: '4', 0x00B6B: '5', 0x00B6C: '6',
+    0x00B6D: '7', 0x00B6E: '8', 0x00B6F: '9', 0x00BE6: '0', 0x00BE7: '1', 0x00BE8: '2', 0x00BE9: '3', 0x00BEA: '4',
+    0x00BEB: '5', 0x00BEC: '6', 0x00BED: '7', 0x00BEE: '8', 0x00BEF: '9', 0x00C66: '0', 0x00C67: '1', 0x00C68: '2',
+    0x00C69: '3', 0x00C6A: '4', 0x00C6B: '5', 0x00C6C: '6', 0x00C6D: '7', 0x00C6E: '8', 0x00C6F: '9', 0x00C78: '0',
+    0x00C79: '1', 0x00C7A: '2', 0x00C7B: '3', 0x00C7C: '1', 0x00C7D: '2', 0x00C7E: '3', 0x00CE6: '0', 0x00CE7: '1',
+    0x00CE8: '2', 0x00CE9: '3', 0x00CEA: '4', 0x00CEB: '5', 0x00CEC: '6', 0x00CED: '7', 0x00CEE: '8', 0x00CEF: '9',
+    0x00D66: '0', 0x00D67: '1', 0x00D68: '2', 0x00D69: '3', 0x00D6A: '4', 0x00D6B: '5', 0x00D6C: '6', 0x00D6D: '7',
+    0x00D6E: '8', 0x00D6F: '9', 0x00DE6: '0', 0x00DE7: '1', 0x00DE8: '2', 0x00DE9: '3', 0x00DEA: '4', 0x00DEB: '5',
+    0x00DEC: '6', 0x00DED: '7', 0x00DEE: '8', 0x00DEF: '9', 0x00E50: '0', 0x00E51: '1', 0x00E52: '2', 0x00E53: '3',
+    0x00E54: '4', 0x00E55: '5', 0x00E56: '6', 0x00E57: '7', 0x00E58: '8', 0x00E59: '9', 0x00ED0: '0', 0x00ED1: '1',
+    0x00ED2: '2', 0x00ED3: '3', 0x00ED4: '4', 0x00ED5: '5', 0x00ED6: '6', 0x00ED7: '7', 0x00ED8: '8', 0x00ED9: '9',
+    0x00F20: '0', 0x00F21: '1', 0x00F22: '2', 0x00F23: '3', 0x00F24: '4', 0x00F25: '5', 0x00F26: '6', 0x00F27: '7',
+    0x00F28: '8', 0x00F29: '9', 0x01040: '0', 0x01041: '1', 0x01042: '2', 0x01043: '3', 0x01044: '4', 0x01045: '5',
+    0x01046: '6', 0x01047: '7', 0x01048: '8', 0x01049: '9', 0x01090: '0', 0x01091: '1', 0x01092: '2', 0x01093: '3',
+    0x01094: '4', 0x01095: '5', 0x01096: '6', 0x01097: '7', 0x01098: '8', 0x01099: '9', 0x01369: '1', 0x0136A: '2',
+    0x0136B: '3', 0x0136C: '4', 0x0136D: '5', 0x0136E: '6', 0x0136F: '7', 0x01370: '8', 0x01371: '9', 0x017E0: '0',
+    0x017E1: '1', 0x017E2: '2', 0x017E3: '3', 0x017E4: '4', 0x017E5: '5', 0x017E6: '6', 0x017E7: '7', 0x017E8: '8',
+    0x017E9: '9', 0x017F0: '0', 0x017F1: '1', 0x017F2: '2', 0x017F3: '3', 0x017F4: '4', 0x017F5: '5', 0x017F6: '6',
+    0x017F7: '7', 0x017F8: '8', 0x017F9: '9', 0x01810: '0', 0x01811: '1', 0x01812: '2', 0x01813: '3', 0x01814: '4',
+    0x01815: '5', 0x01816: '6', 0x01817: '7', 0x01818: '8', 0x01819: '9', 0x01946: '0', 0x01947: '1', 0x01948: '2',
+    0x01949: '3', 0x0194A: '4', 0x0194B: '5', 0x0194C: '6', 0x0194D: '7', 0x0194E: '8', 0x0194F: '9', 0x019D0: '0',
+    0x019D1: '1', 0x019D2: '2', 0x019D3: '3', 0x019D4: '4', 0x019D5: '5', 0x019D6: '6', 0x019D7: '7', 0x019D8: '8',
+    0x019D9: '9', 0x019DA: '1', 0x01A80: '0', 0x01A81: '1', 0x01A82: '2', 0x01A83: '3', 0x01A84: '4', 0x01A85: '5',
+    0x01A86: '6', 0x01A87: '7', 0x01A88: '8', 0x01A89: '9', 0x01A90: '0', 0x01A91: '1', 0x01A92: '2', 0x01A93: '3',
+    0x01A94: '4', 0x01A95: '5', 0x01A96: '6', 0x01A97: '7', 0x01A98: '8', 0x01A99: '9', 0x01B50: '0', 0x01B51: '1',
+    0x01B52: '2', 0x01B53: '3', 0x01B54: '4', 0x01B55: '5', 0x01B56: '6', 0x01B57: '7', 0x01B58: '8', 0x01B59: '9',
+    0x01BB0: '0', 0x01BB1: '1', 0x01BB2: '2', 0x01BB3: '3', 0x01BB4: '4', 0x01BB5: '5', 0x01BB6: '6', 0x01BB7: '7',
+    0x01BB8: '8', 0x01BB9: '9', 0x01C40: '0', 0x01C41: '1', 0x01C42: '2', 0x01C43: '3', 0x01C44: '4', 0x01C45: '5',
+    0x01C46: '6', 0x01C47: '7', 0x01C48: '8', 0x01C49: '9', 0x01C50: '0', 0x01C51: '1', 0x01C52: '2', 0x01C53: '3',
+    0x01C54: '4', 0x01C55: '5', 0x01C56: '6', 0x01C57: '7', 0x01C58: '8', 0x01C59: '9', 0x02020: 't', 0x02021: 't',
+    0x02070: '0', 0x02074: '4', 0x02075: '5', 0x02076: '6', 0x02077: '7', 0x02078: '8', 0x02079: '9', 0x02080: '0',
+    0x02081: '1', 0x02082: '2', 0x02083: '3', 0x02084: '4', 0x02085: '5', 0x02086: '6', 0x02087: '7', 0x02088: '8',
+    0x02089: '9', 0x0215F: '1', 0x02160: '1', 0x02161: '2', 0x02162: '3', 0x02163: '4', 0x02164: '5', 0x02165: '6',
+    0x02166: '7', 0x02167: '8', 0x02168: '9', 0x02170: '1', 0x02171: '2', 0x02172: '3', 0x02173: '4', 0x02174: '5',
+    0x02175: '6', 0x02176: '7', 0x02177: '8', 0x02178: '9', 0x02185: '6', 0x02189: '0', 0x02460: '1', 0x02461: '2',
+    0x02462: '3', 0x02463: '4', 0x02464: '5', 0x02465: '6', 0x02466: '7', 0x02467: '8', 0x02468: '9', 0x02474: '1',
+    0x02475: '2', 0x02476: '3', 0x02477: '4', 0x02478: '5', 0x02479: '6', 0x0247A: '7', 0x0247B: '8', 0x0247C: '9',
+    0x02488: '1', 0x02489: '2', 0x0248A: '3', 0x0248B: '4', 0x0248C: '5', 0x0248D: '6', 0x0248E: '7', 0x0248F: '8',
+    0x02490: '9', 0x024B6: 'A', 0x024B7: 'B', 0x024B8: 'C', 0x024B9: 'D', 0x024BA: 'E', 0x024BB: 'F', 0x024BC: 'G',
+    0x024BD: 'H', 0x024BE: 'I', 0x024BF: 'J', 0x024C0: 'K', 0x024C1: 'L', 0x024C2: 'M', 0x024C3: 'N', 0x024C4: 'O',
+    0x024C5: 'P', 0x024C6: 'Q', 0x024C7: 'R', 0x024C8: 'S', 0x024C9: 'T', 0x024CA: 'U', 0x024CB: 'V', 0x024CC: 'W',
+    0x024CD: 'X', 0x024CE: 'Y', 0x024CF: 'Z', 0x024EA: '0', 0x024F5: '1', 0x024F6: '2', 0x024F7: '3', 0x024F8: '4',
+    0x024F9: '5', 0x024FA: '6', 0x024FB: '7', 0x024FC: '8', 0x024FD: '9', 0x024FF: '0', 0x02776: '1', 0x02777: '2',
+    0x02778: '3', 0x02779: '4', 0x0277A: '5', 0x0277B: '6', 0x0277C: '7', 0x0277D: '8', 0x0277E: '9', 0x02780: '1',
+    0x02781: '2', 0x02782: '3', 0x02783: '4', 0x02784: '5', 0x02785: '6', 0x02786: '7', 0x02787: '8', 0x02788: '9',
+    0x0278A: '1', 0x0278B: '2', 0x0278C: '3', 0x0278D: '4', 0x0278E: '5', 0x0278F: '6', 0x02790: '7', 0x02791: '8',
+    0x02792: '9', 0x02E36: 't', 0x02E37: 't', 0x02E38: 't', 0x02E4B: 't', 0x03007: '0', 0x03021: '1', 0x03022: '2',
+    0x03023: '3', 0x03024: '4', 0x03025: '5', 0x03026: '6', 0x03027: '7', 0x03028: '8', 0x03029: '9', 0x03192: '1',
+    0x03193: '2', 0x03194: '3', 0x03195: '4', 0x03220: '1', 0x03221: '2', 0x03222: '3', 0x03223: '4', 0x03224: '5',
+    0x03225: '6', 0x03226: '7', 0x03227: '8', 0x03228: '9', 0x03280: '1', 0x03281: '2', 0x03282: '3', 0x03283: '4',
+    0x03284: '5', 0x03285: '6', 0x03286: '7', 0x03287: '8', 0x03288: '9', 0x03405: '5', 0x03483: '2', 0x0382A: '5',
+    0x03B4D: '7', 0x04E00: '1', 0x04E03: '7', 0x04E09: '3', 0x04E5D: '9', 0x04E8C: '2', 0x04E94: '5', 0x04E96: '4',
+    0x04EE8: '3', 0x04F0D: '5', 0x05169: '2', 0x0516B: '8', 0x0516D: '6', 0x053C1: '3', 0x053C2: '3', 0x053C3: '3',
+    0x053C4: '3', 0x056DB: '4', 0x058F1: '1', 0x058F9: '1', 0x05E7A: '1', 0x05EFE: '9', 0x05F0C: '1', 0x05F0D: '2',
+    0x05F0E: '3', 0x05F10: '2', 0x0634C: '8', 0x067D2: '7', 0x06F06: '7', 0x07396: '9', 0x08086: '4', 0x08CAE: '2',
+    0x08CB3: '2', 0x08D30: '2', 0x09646: '6', 0x09678: '6', 0x096F6: '0', 0x0A620: '0', 0x0A621: '1', 0x0A622: '2',
+    0x0A623: '3', 0x0A624: '4', 0x0A625: '5', 0x0A626: '6', 0x0A627: '7', 0x0A628: '8', 0x0A629: '9', 0x0A6E6: '1',
+    0x0A6E7: '2', 0x0A6E8: '3', 0x0A6E9: '4', 0x0A6EA: '5', 0x0A6EB: '6', 0x0A6EC: '7', 0x0A6ED: '8', 0x0A6EE: '9',
+    0x0A6EF: '0', 0x0A8D0: '0', 0x0A8D1: '1', 0x0A8D2: '2', 0x0A8D3: '3', 0x0A8D4: '4', 0x0A8D5: '5', 0x0A8D6: '6',
+    0x0A8D7: '7', 0x0A8D8: '8', 0x0A8D9: '9', 0x0A900: '0', 0x0A901: '1', 0x0A902: '2', 0x0A903: '3', 0x0A904: '4',
+    0x0A905: '5', 0x0A906: '6', 0x0A907: '7', 0x0A908: '8', 0x0A909: '9', 0x0A9D0: '0', 0x0A9D1: '1', 0x0A9D2: '2',
+    0x0A9D3: '3', 0x0A9D4: '4', 0x0A9D5: '5', 0x0A9D6: '6', 0x0A9D7: '7', 0x0A9D8: '8', 0x0A9D9: '9', 0x0A9F0: '0',
+    0x0A9F1: '1', 0x0A9F2: '2', 0x0A9F3: '3', 0x0A9F4: '4', 0x0A9F5: '5', 0x0A9F6: '6', 0x0A9F7: '7', 0x0A9F8: '8',
+    0x0A9F9: '9', 0x0AA50: '0', 0x0AA51: '1', 0x0AA52: '2', 0x0AA53: '3', 0x0AA54: '4', 0x0AA55: '5', 0x0AA56: '6',
+    0x0AA57: '7', 0x0AA58: '8', 0x0AA59: '9', 0x0ABF0: '0', 0x0ABF1: '1', 0x0ABF2: '2', 0x0ABF3: '3', 0x0ABF4: '4',
+    0x0ABF5: '5', 0x0ABF6: '6', 0x0ABF7: '7', 0x0ABF8: '8', 0x0ABF9: '9', 0x0F96B: '3', 0x0F978: '2', 0x0F9B2: '0',
+    0x0F9D1: '6', 0x0F9D3: '6', 0x0FF10: '0', 0x0FF11: '1', 0x0FF12: '2', 0x0FF13: '3', 0x0FF14: '4', 0x0FF15: '5',
+    0x0FF16: '6', 0x0FF17: '7', 0x0FF18: '8', 0x0FF19: '9', 0x10107: '1', 0x10108: '2', 0x10109: '3', 0x1010A: '4',
+    0x1010B: '5', 0x1010C: '6', 0x1010D: '7', 0x1010E: '8', 0x1010F: '9', 0x10142: '1', 0x10143: '5', 0x10148: '5',
+    0x1014F: '5', 0x10158: '1', 0x10159: '1', 0x1015A: '1', 0x1015B: '2', 0x1015C: '2', 0x1015D: '2', 0x1015E: '2',
+    0x1015F: '5', 0x10173: '5', 0x1018A: '0', 0x102E1: '1', 0x102E2: '2', 0x102E3: '3', 0x102E4: '4', 0x102E5: '5',
+    0x102E6: '6', 0x102E7: '7', 0x102E8: '8', 0x102E9: '9', 0x10320: '1', 0x10321: '5', 0x103D1: '1', 0x103D2: '2',
+    0x104A0: '0', 0x104A1: '1', 0x104A2: '2', 0x104A3: '3', 0x104A4: '4', 0x104A5: '5', 0x104A6: '6', 0x104A7: '7',
+    0x104A8: '8', 0x104A9: '9', 0x10858: '1', 0x10859: '2', 0x1085A: '3', 0x10879: '1', 0x1087A: '2', 0x1087B: '3',
+    0x1087C: '4', 0x1087D: '5', 0x108A7: '1', 0x108A8: '2', 0x108A9: '3', 0x108AA: '4', 0x108AB: '4', 0x108AC: '5',
+    0x108FB: '1', 0x108FC: '5', 0x10916: '1', 0x1091A: '2', 0x1091B: '3', 0x109C0: '1', 0x109C1: '2', 0x109C2: '3',
+    0x109C3: '4', 0x109C4: '5', 0x109C5: '6', 0x109C6: '7', 0x109C7: '8', 0x109C8: '9', 0x10A40: '1', 0x10A41: '2',
+    0x10A42: '3', 0x10A43: '4', 0x10A7D: '1', 0x10A9D: '1', 0x10AEB: '1', 0x10AEC: '5', 0x10B58: '1', 0x10B59: '2',
+    0x10B5A: '3', 0x10B5B: '4', 0x10B78: '1', 0x10B79: '2', 0x10B7A: '3', 0x10B7B: '4', 0x10BA9: '1', 0x10BAA: '2',
+    0x10BAB: '3', 0x10BAC: '4', 0x10CFA: '1', 0x10CFB: '5', 0x10D30: '0', 0x10D31: '1', 0x10D32: '2', 0x10D33: '3',
+    0x10D34: '4', 0x10D35: '5', 0x10D36: '6', 0x10D37: '7', 0x10D38: '8', 0x10D39: '9', 0x10E60: '1', 0x10E61: '2',
+    0x10E62: '3', 0x10E63: '4', 0x10E64: '5', 0x10E65: '6', 0x10E66: '7', 0x10E67: '8', 0x10E68: '9', 0x10F1D: '1',
+    0x10F1E: '2', 0x10F1F: '3', 0x10F20: '4', 0x10F21: '5', 0x10F51: '1', 0x10FC5: '1', 0x10FC6: '2', 0x10FC7: '3',
+    0x10FC8: '4', 0x11052: '1', 0x11053: '2', 0x11054: '3', 0x11055: '4', 0x11056: '5', 0x11057: '6', 0x11058: '7',
+    0x11059: '8', 0x1105A: '9', 0x11066: '0', 0x11067: '1', 0x11068: '2', 0x11069: '3', 0x1106A: '4', 0x1106B: '5',
+    0x1106C: '6', 0x1106D: '7', 0x1106E: '8', 0x1106F: '9', 0x110F0: '0', 0x110F1: '1', 0x110F2: '2', 0x110F3: '3',
+    0x110F4: '4', 0x110F5: '5', 0x110F6: '6', 0x110F7: '7', 0x110F8: '8', 0x110F9: '9', 0x11136: '0', 0x11137: '1',
+    0x11138: '2', 0x11139: '3', 0x1113A: '4', 0x1113B: '5', 0x1113C: '6', 0x1113D: '7', 0x1113E: '8', 0x1113F: '9',
+    0x111D0: '0', 0x111D1: '1', 0x111D2: '2', 0x111D3: '3', 0x111D4: '4', 0x111D5: '5', 0x111D6: '6', 0x111D7: '7',
+    0x111D8: '8', 0x111D9: '9', 0x111E1: '1', 0x111E2: '2', 0x111E3: '3', 0x111E4: '4', 0x111E5: '5', 0x111E6: '6',
+    0x111E7: '7', 0x111E8: '8', 0x111E9: '9', 0x112F0: '0', 0x112F1: '1', 0x112F2: '2', 0x112F3: '3', 0x112F4: '4',
+    0x112F5: '5', 0x112F6: '6', 0x112F7: '7', 0x112F8: '8', 0x112F9: '9', 0x11450: '0', 0x11451: '1', 0x11452: '2',
+    0x11453: '3', 0x11454: '4', 0x11455: '5', 0x11456: '6', 0x11457: '7', 0x11458: '8', 0x11459: '9', 0x114D0: '0',
+    0x114D1: '1', 0x114D2: '2', 0x114D3: '3', 0x114D4: '4', 0x114D5: '5', 0x114D6: '6', 0x114D7: '7', 0x114D8: '8',
+    0x114D9: '9', 0x11650: '0', 0x11651: '1', 0x11652: '2', 0x11653: '3', 0x11654: '4', 0x11655: '5', 0x11656: '6',
+    0x11657: '7', 0x11658: '8', 0x11659: '9', 0x116C0: '0', 0x116C1: '1', 0x116C2: '2', 0x116C3: '3', 0x116C4: '4',
+    0x116C5: '5', 0x116C6: '6', 0x116C7: '7', 0x116C8: '8', 0x116C9: '9', 0x11730: '0', 0x11731: '1', 0x11732: '2',
+    0x11733: '3', 0x11734: '4', 0x11735: '5', 0x11736: '6', 0x11737: '7', 0x11738: '8', 0x11739: '9', 0x118E0: '0',
+    0x118E1: '1', 0x118E2: '2', 0x118E3: '3', 0x118E4: '4', 0x118E5: '5', 0x118E6: '6', 0x118E7: '7', 0x118E8: '8',
+    0x118E9: '9', 0x11950: '0', 0x11951: '1', 0x11952: '2', 0x11953: '3', 0x11954: '4', 0x11955: '5', 0x11956: '6',
+    0x11957: '7', 0x11958: '8', 0x11959: '9', 0x11C50: '0', 0x11C51: '1', 0x11C52: '2', 0x11C53: '3', 0x11C54: '4',
+    0x11C55: '5', 0x11C56: '6', 0x11C57: '7', 0x11C58: '8', 0x11C59: '9', 0x11C5A: '1', 0x11C5B: '2', 0x11C5C: '3',
+    0x11C5D: '4', 0x11C5E: '5', 0x11C5F: '6', 0x11C60: '7', 0x11C61: '8', 0x11C62: '9', 0x11D50: '0', 0x11D51: '1',
+    0x11D52: '2', 0x11D53: '3', 0x11D54: '4', 0x11D55: '5', 0x11D56: '6', 0x11D57: '7', 0x11D58: '8', 0x11D59: '9',
+    0x11DA0: '0', 0x11DA1: '1', 0x11DA2: '2', 0x11DA3: '3', 0x11DA4: '4', 0x11DA5: '5', 0x11DA6: '6', 0x11DA7: '7',
+    0x11DA8: '8', 0x11DA9: '9', 0x12400: '2', 0x12401: '3', 0x12402: '4', 0x12403: '5', 0x12404: '6', 0x12405: '7',
+    0x12406: '8', 0x12407: '9', 0x12408: '3', 0x12409: '4', 0x1240A: '5', 0x1240B: '6', 0x1240C: '7', 0x1240D: '8',
+    0x1240E: '9', 0x1240F: '4', 0x12410: '5', 0x12411: '6', 0x12412: '7', 0x12413: '8', 0x12414: '9', 0x12415: '1',
+    0x12416: '2', 0x12417: '3', 0x12418: '4', 0x12419: '5', 0x1241A: '6', 0x1241B: '7', 0x1241C: '8', 0x1241D: '9',
+    0x1241E: '1', 0x1241F: '2', 0x12420: '3', 0x12421: '4', 0x12422: '5', 0x12423: '2', 0x12424: '3', 0x12425: '3',
+    0x12426: '4', 0x12427: '5', 0x12428: '6', 0x12429: '7', 0x1242A: '8', 0x1242B: '9', 0x1242C: '1', 0x1242D: '2',
+    0x1242E: '3', 0x1242F: '3', 0x12430: '4', 0x12431: '5', 0x12434: '1', 0x12435: '2', 0x12436: '3', 0x12437: '3',
+    0x12438: '4', 0x12439: '5', 0x1243A: '3', 0x1243B: '3', 0x1243C: '4', 0x1243D: '4', 0x1243E: '4', 0x1243F: '4',
+    0x12440: '6', 0x12441: '7', 0x12442: '7', 0x12443: '7', 0x12444: '8', 0x12445: '8', 0x12446: '9', 0x12447: '9',
+    0x12448: '9', 0x12449: '9', 0x1244A: '2', 0x1244B: '3', 0x1244C: '4', 0x1244D: '5', 0x1244E: '6', 0x1244F: '1',
+    0x12450: '2', 0x12451: '3', 0x12452: '4', 0x12453: '4', 0x12454: '5', 0x12455: '5', 0x12456: '2', 0x12457: '3',
+    0x12458: '1', 0x12459: '2', 0x12469: '4', 0x1246A: '5', 0x1246B: '6', 0x1246C: '7', 0x1246D: '8', 0x1246E: '9',
+    0x16A60: '0', 0x16A61: '1', 0x16A62: '2', 0x16A63: '3', 0x16A64: '4', 0x16A65: '5', 0x16A66: '6', 0x16A67: '7',
+    0x16A68: '8', 0x16A69: '9', 0x16AC0: '0', 0x16AC1: '1', 0x16AC2: '2', 0x16AC3: '3', 0x16AC4: '4', 0x16AC5: '5',
+    0x16AC6: '6', 0x16AC7: '7', 0x16AC8: '8', 0x16AC9: '9', 0x16B50: '0', 0x16B51: '1', 0x16B52: '2', 0x16B53: '3',
+    0x16B54: '4', 0x16B55: '5', 0x16B56: '6', 0x16B57: '7', 0x16B58: '8', 0x16B59: '9', 0x16E80: '0', 0x16E81: '1',
+    0x16E82: '2', 0x16E83: '3', 0x16E84: '4', 0x16E85: '5', 0x16E86: '6', 0x16E87: '7', 0x16E88: '8', 0x16E89: '9',
+    0x16E94: '1', 0x16E95: '2', 0x16E96: '3', 0x1D2E0: '0', 0x1D2E1: '1', 0x1D2E2: '2', 0x1D2E3: '3', 0x1D2E4: '4',
+    0x1D2E5: '5', 0x1D2E6: '6', 0x1D2E7: '7', 0x1D2E8: '8', 0x1D2E9: '9', 0x1D360: '1', 0x1D361: '2', 0x1D362: '3',
+    0x1D363: '4', 0x1D364: '5', 0x1D365: '6', 0x1D366: '7', 0x1D367: '8', 0x1D368: '9', 0x1D372: '1', 0x1D373: '2',
+    0x1D374: '3', 0x1D375: '4', 0x1D376: '5', 0x1D377: '1', 0x1D378: '5', 0x1D7CE: '0', 0x1D7CF: '1', 0x1D7D0: '2',
+    0x1D7D1: '3', 0x1D7D2: '4', 0x1D7D3: '5', 0x1D7D4: '6', 0x1D7D5: '7', 0x1D7D6: '8', 0x1D7D7: '9', 0x1D7D8: '0',
+    0x1D7D9: '1', 0x1D7DA: '2', 0x1D7DB: '3', 0x1D7DC: '4', 0x1D7DD: '5', 0x1D7DE: '6', 0x1D7DF: '7', 0x1D7E0: '8',
+    0x1D7E1: '9', 0x1D7E2: '0', 0x1D7E3: '1', 0x1D7E4: '2', 0x1D7E5: '3', 0x1D7E6: '4', 0x1D7E7: '5', 0x1D7E8: '6',
+    0x1D7E9: '7', 0x1D7EA: '8', 0x1D7EB: '9', 0x1D7EC: '0', 0x1D7ED: '1', 0x1D7EE: '2', 0x1D7EF: '3', 0x1D7F0: '4',
+    0x1D7F1: '5', 0x1D7F2: '6', 0x1D7F3: '7', 0x1D7F4: '8', 0x1D7F5: '9', 0x1D7F6: '0', 0x1D7F7: '1', 0x1D7F8: '2',
+    0x1D7F9: '3', 0x1D7FA: '4', 0x1D7FB: '5', 0x1D7FC: '6', 0x1D7FD: '7', 0x1D7FE: '8', 0x1D7FF: '9', 0x1E140: '0',
+    0x1E141: '1', 0x1E142: '2', 0x1E143: '3', 0x1E144: '4', 0x1E145: '5', 0x1E146: '6', 0x1E147: '7', 0x1E148: '8',
+    0x1E149: '9', 0x1E2F0: '0', 0x1E2F1: '1', 0x1E2F2: '2', 0x1E2F3: '3', 0x1E2F4: '4', 0x1E2F5: '5', 0x1E2F6: '6',
+    0x1E2F7: '7', 0x1E2F8: '8', 0x1E2F9: '9', 0x1E8C7: '1', 0x1E8C8: '2', 0x1E8C9: '3', 0x1E8CA: '4', 0x1E8CB: '5',
+    0x1E8CC: '6', 0x1E8CD: '7', 0x1E8CE: '8', 0x1E8CF: '9', 0x1E950: '0', 0x1E951: '1', 0x1E952: '2', 0x1E953: '3',
+    0x1E954: '4', 0x1E955: '5', 0x1E956: '6', 0x1E957: '7', 0x1E958: '8', 0x1E959: '9', 0x1EC71: '1', 0x1EC72: '2',
+    0x1EC73: '3', 0x1EC74: '4', 0x1EC75: '5', 0x1EC76: '6', 0x1EC77: '7', 0x1EC78: '8', 0x1EC79: '9', 0x1ECA3: '1',
+    0x1ECA4: '2', 0x1ECA5: '3', 0x1ECA6: '4', 0x1ECA7: '5', 0x1ECA8: '6', 0x1ECA9: '7', 0x1ECAA: '8', 0x1ECAB: '9',
+    0x1ECB1: '1', 0x1ECB2: '2', 0x1ED01: '1', 0x1ED02: '2', 0x1ED03: '3', 0x1ED04: '4', 0x1ED05: '5', 0x1ED06: '6',
+    0x1ED07: '7', 0x1ED08: '8', 0x1ED09: '9', 0x1ED2F: '2', 0x1ED30: '3', 0x1ED31: '4', 0x1ED32: '5', 0x1ED33: '6',
+    0x1ED34: '7', 0x1ED35: '8', 0x1ED36: '9', 0x1F100: '0', 0x1F101: '0', 0x1F102: '1', 0x1F103: '2', 0x1F104: '3',
+    0x1F105: '4', 0x1F106: '5', 0x1F107: '6', 0x1F108: '7', 0x1F109: '8', 0x1F10A: '9', 0x1F10B: '0', 0x1F10C: '0',
+    0x1F12B: 'C', 0x1F12C: 'R', 0x1F130: 'A', 0x1F131: 'B', 0x1F132: 'C', 0x1F133: 'D', 0x1F134: 'E', 0x1F135: 'F',
+    0x1F136: 'G', 0x1F137: 'H', 0x1F138: 'I', 0x1F139: 'J', 0x1F13A: 'K', 0x1F13B: 'L', 0x1F13C: 'M', 0x1F13D: 'N',
+    0x1F13E: 'O', 0x1F13F: 'P', 0x1F140: 'Q', 0x1F141: 'R', 0x1F142: 'S', 0x1F143: 'T', 0x1F144: 'U', 0x1F145: 'V',
+    0x1F146: 'W', 0x1F147: 'X', 0x1F148: 'Y', 0x1F149: 'Z', 0x1F150: 'A', 0x1F151: 'B', 0x1F152: 'C', 0x1F153: 'D',
+    0x1F154: 'E', 0x1F155: 'F', 0x1F156: 'G', 0x1F157: 'H', 0x1F158: 'I', 0x1F159: 'J', 0x1F15A: 'K', 0x1F15B: 'L',
+    0x1F15C: 'M', 0x1F15D: 'N', 0x1F15E: 'O', 0x1F15F: 'P', 0x1F160: 'Q', 0x1F161: 'R', 0x1F162: 'S', 0x1F163: 'T',
+    0x1F164: 'U', 0x1F165: 'V', 0x1F166: 'W', 0x1F167: 'X', 0x1F168: 'Y', 0x1F169: 'Z', 0x1F170: 'A', 0x1F171: 'B',
+    0x1F172: 'C', 0x1F173: 'D', 0x1F174: 'E', 0x1F175: 'F', 0x1F176: 'G', 0x1F177: 'H', 0x1F178: 'I', 0x1F179: 'J',
+    0x1F17A: 'K', 0x1F17B: 'L', 0x1F17C: 'M', 0x1F17D: 'N', 0x1F17E: 'O', 0x1F17F: 'P', 0x1F180: 'Q', 0x1F181: 'R',
+    0x1F182: 'S', 0x1F183: 'T', 0x1F184: 'U', 0x1F185: 'V', 0x1F186: 'W', 0x1F187: 'X', 0x1F188: 'Y', 0x1F189: 'Z',
+    0x1F18A: 'P', 0x1F1E6: 'A', 0x1F1E7: 'B', 0x1F1E8: 'C', 0x1F1E9: 'D', 0x1F1EA: 'E', 0x1F1EB: 'F', 0x1F1EC: 'G',
+    0x1F1ED: 'H', 0x1F1EE: 'I', 0x1F1EF: 'J', 0x1F1F0: 'K', 0x1F1F1: 'L', 0x1F1F2: 'M', 0x1F1F3: 'N', 0x1F1F4: 'O',
+    0x1F1F5: 'P', 0x1F1F6: 'Q', 0x1F1F7: 'R', 0x1F1F8: 'S', 0x1F1F9: 'T', 0x1F1FA: 'U', 0x1F1FB: 'V', 0x1F1FC: 'W',
+    0x1F1FD: 'X', 0x1F1FE: 'Y', 0x1F1FF: 'Z', 0x1F5E1: 't', 0x1FBF0: '0', 0x1FBF1: '1', 0x1FBF2: '2', 0x1FBF3: '3',
+    0x1FBF4: '4', 0x1FBF5: '5', 0x1FBF6: '6', 0x1FBF7: '7', 0x1FBF8: '8', 0x1FBF9: '9', 0x20001: '7', 0x20064: '4',
+    0x200E2: '4', 0x20121: '5', 0x2092A: '1', 0x20AEA: '6', 0x20AFD: '3', 0x20B19: '3', 0x22390: '2', 0x22998: '3',
+    0x23B1B: '3', 0x2626D: '4', 0x2F890: '9',
+}
@@ -0,0 +1,155 @@
+from __future__ import annotations
+from collections import deque
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, Iterator, Tuple
+
+BRAND_PATH = Path(__file__).resolve().parent / "asset" / "brand_judol.txt"
+
+# Istilah yang lebih pendek dari ini hanya cocok sebagai token utuh ("jp" tidak boleh
+# cocok di dalam "jpeg", "depo" tidak boleh cocok di dalam "depok").
+MIN_SUBSTRING_LEN = 5
+
+DEFAULT_CATEGORY = "brand"
+
+def load_brand_terms(path: Path | str = BRAND_PATH) -> list[Tuple[str, str]]:
+    """
+    Membaca kamus brand/istilah judi online dari file teks.
+
+    Args:
+        path (Path | str): Lokasi file kamus (satu istilah per baris, '#' untuk komentar,
+            '[kategori]' untuk mengganti kategori baris berikutnya).
+
+    Returns:
+        list[tuple]: Daftar (istilah, kategori) unik sesuai urutan di file.
+    """
+    terms = {}
+    category = DEFAULT_CATEGORY
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                category = line[1:-1].strip().lower() or DEFAULT_CATEGORY
+                continue
+            terms.setdefault(line.lower(), category)
+    return list(terms.items())
+
+class AhoCorasick:
+    """
+    Automaton Aho–Corasick sederhana (Python murni) untuk pencocokan banyak pola sekaligus.
+    Teks dipindai satu kali dari kiri ke kanan, sehingga biayanya linear terhadap panjang
+    teks ditambah jumlah kecocokan, berapa pun jumlah polanya.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for pid, pat in enumerate(self.patterns):
+            node = 0
+            for ch in pat:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] = self._out[node] + (pid,)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Menghasilkan semua kecocokan di dalam teks.
+
+        Args:
+            text (str): Teks yang dipindai.
+
+        Yields:
+            tuple: (indeks_akhir_eksklusif, id_pola).
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                yield i + 1, pid
+
+class BrandMatcher:
+    """
+    Pendeteksi brand situs dan istilah judi online pada teks HASIL preprocess.
+    Istilah pendek (< MIN_SUBSTRING_LEN) hanya diterima bila berdiri sebagai token utuh.
+    """
+
+    def __init__(self, terms: Iterable[Tuple[str, str]]):
+        terms = list(terms)
+        self._automaton = AhoCorasick(t for t, _ in terms)
+        self.categories = dict(terms)
+        self._whole_token = [len(p) < MIN_SUBSTRING_LEN for p in self._automaton.patterns]
+
+    def __len__(self) -> int:
+        return len(self._automaton)
+
+    def _accept(self, text: str, end: int, pid: int) -> bool:
+        if not self._whole_token[pid]:
+            return True
+        start = end - len(self._automaton.patterns[pid])
+        return (start == 0 or text[start - 1] == " ") and (end == len(text) or text[end] == " ")
+
+    def find(self, clean: str) -> list[str]:
+        """
+        Mencari semua brand/istilah yang muncul di teks bersih.
+
+        Args:
+            clean (str): Teks hasil preprocess.
+
+        Returns:
+            list[str]: Istilah yang cocok (unik, urut kemunculan pertama).
+        """
+        found = {}
+        patterns = self._automaton.patterns
+        for end, pid in self._automaton.iter_matches(clean or ""):
+            if self._accept(clean, end, pid):
+                found.setdefault(patterns[pid], None)
+        return list(found)
+
+    def has_category(self, clean: str, category: str = DEFAULT_CATEGORY) -> bool:
+        """True jika teks mengandung minimal satu istilah dari kategori tertentu (berhenti di kecocokan pertama)."""
+        for end, pid in self._automaton.iter_matches(clean or ""):
+            term = self._automaton.patterns[pid]
+            if self.categories[term] == category and self._accept(clean, end, pid):
+                return True
+        return False
+
+_matcher_lock = Lock()
+_MATCHER = None
+
+def get_brand_matcher() -> BrandMatcher:
+    """Mengembalikan BrandMatcher dari kamus bawaan (dibangun sekali per proses)."""
+    global _MATCHER
+    if _MATCHER is not None:
+        return _MATCHER
+    with _matcher_lock:
+        if _MATCHER is None:
+            _MATCHER = BrandMatcher(load_brand_terms())
+    return _MATCHER
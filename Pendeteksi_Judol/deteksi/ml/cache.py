@@ -0,0 +1,187 @@
+from __future__ import annotations
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+
+DEFAULT_CONFIG = {
+    "BACKEND": "lru",
+    "ALIAS": "default",
+    "MAX_ENTRIES": 50_000,
+    "MAX_BYTES": 32 * 1024 * 1024,
+    "TIMEOUT": 60 * 60,
+    "CACHE_PROBA": True,
+}
+
+_ENTRY_OVERHEAD = 96
+
+def text_key(text: str) -> str:
+    """
+    Menghasilkan kunci cache berbasis konten (hash BLAKE2b 128-bit) dari teks mentah.
+
+    Args:
+        text (str): Teks komentar mentah.
+
+    Returns:
+        str: Digest heksadesimal 32 karakter.
+    """
+    data = text.encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _entry_size(key: str, value) -> int:
+    """Perkiraan kasar pemakaian memori satu entri cache (dalam byte)."""
+    size = _ENTRY_OVERHEAD + len(key)
+    if isinstance(value, str):
+        size += len(value)
+    elif isinstance(value, tuple):
+        size += sum(len(v) for v in value if isinstance(v, str))
+    return size
+
+class LRUTextCache:
+    """
+    Cache in-process dengan eviksi LRU, dibatasi jumlah entri dan perkiraan byte.
+    Aman dipakai dari banyak thread dalam satu worker.
+    """
+
+    def __init__(self, max_entries: int = 50_000, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, keys) -> dict:
+        """Mengambil banyak kunci sekaligus; kunci yang tidak ada tidak muncul di hasil."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._data.move_to_end(key)
+                    found[key] = self._data[key][0]
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return found
+
+    def set_many(self, mapping: dict):
+        """Menyimpan banyak entri sekaligus, lalu mengeviksi entri terlama jika melewati batas."""
+        with self._lock:
+            for key, value in mapping.items():
+                size = _entry_size(key, value)
+                old = self._data.pop(key, None)
+                if old is not None:
+                    self._bytes -= old[1]
+                self._data[key] = (value, size)
+                self._bytes += size
+            while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, size) = self._data.popitem(last=False)
+                self._bytes -= size
+                self.evictions += 1
+
+    def clear(self):
+        """Mengosongkan cache dan mereset penghitung."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Statistik cache: hit, miss, eviksi, jumlah entri, dan perkiraan byte."""
+        with self._lock:
+            return {
+                "backend": "lru",
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+            }
+
+class DjangoTextCache:
+    """
+    Adapter ke cache Django (`settings.CACHES`), berguna bila cache dibagi antar worker
+    (misalnya Redis/Memcached). Penghitung hit/miss bersifat lokal per worker.
+    """
+
+    def __init__(self, alias: str = "default", timeout: int = 60 * 60, prefix: str = "judol_text"):
+        from django.core.cache import caches
+        self._cache = caches[alias]
+        self.alias = alias
+        self.timeout = timeout
+        self.prefix = prefix
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _k(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get_many(self, keys) -> dict:
+        """Mengambil banyak kunci sekaligus dari cache Django."""
+        keys = list(keys)
+        raw = self._cache.get_many([self._k(k) for k in keys])
+        found = {k: raw[self._k(k)] for k in keys if self._k(k) in raw}
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, mapping: dict):
+        """Menyimpan banyak entri sekaligus ke cache Django."""
+        if mapping:
+            self._cache.set_many({self._k(k): v for k, v in mapping.items()}, self.timeout)
+
+    def clear(self):
+        """Mereset penghitung (isi cache Django tidak dihapus karena bisa dipakai bersama)."""
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Statistik hit/miss lokal worker ini."""
+        with self._lock:
+            return {"backend": f"django:{self.alias}", "hits": self.hits, "misses": self.misses}
+
+_cache_lock = Lock()
+_TEXT_CACHE = None
+_CONFIG = None
+
+def get_cache_config() -> dict:
+    """
+    Mengambil konfigurasi cache dari `settings.TEXT_CACHE` jika Django sudah dikonfigurasi,
+    jika tidak memakai DEFAULT_CONFIG.
+    """
+    config = dict(DEFAULT_CONFIG)
+    try:
+        from django.conf import settings
+        if settings.configured:
+            config.update(getattr(settings, "TEXT_CACHE", {}) or {})
+    except ImportError:
+        pass
+    return config
+
+def get_text_cache():
+    """
+    Mengembalikan instance cache teks (dibuat sekali per proses) sesuai konfigurasi.
+
+    Returns:
+        LRUTextCache | DjangoTextCache: Backend cache yang aktif.
+    """
+    global _TEXT_CACHE, _CONFIG
+    if _TEXT_CACHE is not None:
+        return _TEXT_CACHE
+    with _cache_lock:
+        if _TEXT_CACHE is None:
+            config = get_cache_config()
+            if config["BACKEND"] == "django":
+                _TEXT_CACHE = DjangoTextCache(alias=config["ALIAS"], timeout=config["TIMEOUT"])
+            else:
+                _TEXT_CACHE = LRUTextCache(max_entries=config["MAX_ENTRIES"], max_bytes=config["MAX_BYTES"])
+            _CONFIG = config
+    return _TEXT_CACHE
+
+def cache_proba_enabled() -> bool:
+    """True jika probabilitas model juga disimpan di cache (selain teks bersih)."""
+    get_text_cache()
+    return bool(_CONFIG["CACHE_PROBA"])
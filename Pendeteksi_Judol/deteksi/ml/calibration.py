@@ -0,0 +1,116 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .registry import MODEL_DIR
+
+CALIBRATION_DIR = MODEL_DIR / "calibration"
+CALIBRATION_FORMAT = 1
+CALIBRATION_METHODS = ("isotonic", "platt")
+
+# Jumlah titik tabel untuk Platt (sigmoid halus); isotonic memakai titik lompatannya sendiri.
+PLATT_POINTS = 256
+
+class Calibrator:
+    """
+    Tabel kalibrasi hasil fit offline: skor mentah model `x` (naik) -> proba terkalibrasi `y`.
+    Pemakaian hanya berupa interpolasi linear tervektor (`np.interp`); skor di luar rentang
+    tabel dijepit ke ujungnya.
+    """
+
+    def __init__(self, x, y, method: str = "isotonic", model: str = "", meta: dict | None = None):
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        if self.x.ndim != 1 or self.x.shape != self.y.shape or self.x.size < 2:
+            raise ValueError("Tabel kalibrasi harus berupa dua array 1-D sama panjang (>= 2 titik)")
+        if np.any(np.diff(self.x) < 0):
+            raise ValueError("Titik x tabel kalibrasi harus terurut naik")
+        self.method = method
+        self.model = model
+        self.meta = dict(meta or {})
+        self.digest = hashlib.blake2b(self.x.tobytes() + self.y.tobytes(), digest_size=8).hexdigest()
+
+    def __call__(self, scores) -> np.ndarray:
+        return np.interp(np.asarray(scores, dtype=np.float64), self.x, self.y)
+
+    def to_dict(self) -> dict:
+        return {
+            "format": CALIBRATION_FORMAT,
+            "model": self.model,
+            "method": self.method,
+            **self.meta,
+            "x": self.x.tolist(),
+            "y": self.y.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Calibrator":
+        if data.get("format") != CALIBRATION_FORMAT:
+            raise ValueError(f"Format kalibrasi {data.get('format')!r} tidak didukung")
+        meta = {k: v for k, v in data.items() if k not in ("format", "model", "method", "x", "y")}
+        return cls(data["x"], data["y"], data.get("method", "isotonic"), data.get("model", ""), meta)
+
+def fit_calibrator(scores, labels, method: str = "isotonic", model: str = "") -> Calibrator:
+    """
+    Mem-fit kalibrasi pada skor mentah model (proba atau decision_function) dan label asli.
+
+    Args:
+        scores: Skor mentah model per komentar.
+        labels: Label 0/1 sejajar dengan `scores`.
+        method (str): "isotonic" (monoton, non-parametrik) atau "platt" (sigmoid).
+        model (str): Nama model (informasi saja).
+
+    Returns:
+        Calibrator: Tabel kalibrasi siap disimpan.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    labels = np.asarray(labels, dtype=np.float64)
+    if method == "isotonic":
+        from sklearn.isotonic import IsotonicRegression
+
+        iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(scores, labels)
+        x, y = iso.X_thresholds_, iso.y_thresholds_
+    elif method == "platt":
+        from sklearn.linear_model import LogisticRegression
+
+        lr = LogisticRegression(C=1e6).fit(scores.reshape(-1, 1), labels)
+        x = np.linspace(scores.min(), scores.max(), PLATT_POINTS)
+        y = lr.predict_proba(x.reshape(-1, 1))[:, 1]
+    else:
+        raise ValueError(f"Metode kalibrasi tidak dikenal: {method!r} (pilihan: {', '.join(CALIBRATION_METHODS)})")
+    return Calibrator(x, y, method, model, {"n_samples": int(scores.size)})
+
+def calibration_path(name: str, directory: Path | str = CALIBRATION_DIR) -> Path:
+    return Path(directory) / f"{name}.json"
+
+def save_calibrator(calibrator: Calibrator, path: Path | str) -> Path:
+    """Menyimpan tabel kalibrasi sebagai JSON secara atomik."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(calibrator.to_dict()), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+def load_calibrator(name: str, model_path: Path, directory: Path | str = CALIBRATION_DIR) -> Calibrator | None:
+    """
+    Memuat tabel kalibrasi untuk model `name`, atau None jika tidak ada. Tabel yang di-fit
+    untuk isi file model lain (penanda sumber berbeda) diabaikan.
+    """
+    from .shared_model import source_signature
+
+    path = calibration_path(name, directory)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    calibrator = Calibrator.from_dict(data)
+    expected = calibrator.meta.get("source_signature")
+    if expected and expected != source_signature(model_path):
+        print(f"Kalibrasi {path.name} dibuat untuk file model lain; diabaikan.")
+        return None
+    return calibrator
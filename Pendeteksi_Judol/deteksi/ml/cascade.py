@@ -0,0 +1,159 @@
+from __future__ import annotations
+import os
+import re
+from threading import Lock
+from typing import Iterable, Optional
+
+from .brand import get_brand_matcher, load_brand_terms
+from .lexicon import get_lexicon
+from .preprocess import DOMAIN_WORDS, INDONESIAN_STOPWORDS, SUBS, build_slang_map
+
+# Mode kaskade: "off" (semua ke model), "positive" (hanya brand -> judol), "negative"
+# (hanya komentar yang jelas bersih -> non-judol), atau "both".
+CASCADE_MODES = ("off", "positive", "negative", "both")
+CASCADE_MODE = os.getenv("JUDOL_CASCADE", "off")
+
+# Leksikon kata umum (hasil compile_lexicons) untuk memastikan sebuah komentar "jelas bersih".
+KNOWN_WORD_LEXICONS = ("kata_indonesia", "lexicon_berurutan")
+
+_RE_DIGIT = re.compile(r"\d")
+
+class LexiconStage:
+    """
+    Tahap 1 kaskade: penilai berbasis kamus yang hanya memutuskan kasus yang sangat jelas.
+
+    - Yakin judol: teks menyebut brand situs judi (kamus brand_judol.txt, kategori "brand").
+    - Yakin bersih: teks tidak mengandung angka, tidak mengandung istilah judi (DOMAIN_WORDS,
+      SUBS, kamus brand) baik per token maupun setelah spasi dihapus (menangkap "ga ru da ho ki"),
+      dan SETIAP token adalah kata yang dikenal (kamus bahasa Indonesia, kamus alay, stopword).
+      Token asing sekecil apa pun (brand baru seperti "voliad") membuat teks diteruskan ke model.
+    - Selain itu: diteruskan ke model (tahap 2).
+
+    Leksikon kata umum tidak disimpan di objek ini: `split_by_stage` mengambilnya dari
+    `get_lexicon` sekali per batch, sehingga file .lex yang di-hot-reload langsung dipakai
+    dan mmap lama bisa dilepas.
+    """
+
+    def __init__(self):
+        self.matcher = get_brand_matcher()
+        self.gambling_terms = frozenset(
+            set(DOMAIN_WORDS) | set(SUBS) | set(SUBS.values()) | {t for t, _ in load_brand_terms()}
+        )
+        slang = build_slang_map()
+        extra = set(INDONESIAN_STOPWORDS) | set(slang)
+        for value in slang.values():
+            extra.update(value.split())
+        self.extra_words = frozenset(extra - self.gambling_terms)
+
+    @staticmethod
+    def current_lexicons() -> list:
+        """Leksikon kata umum versi terbaru (dipanggil sekali per batch)."""
+        return [get_lexicon(name) for name in KNOWN_WORD_LEXICONS]
+
+    def _is_known(self, token: str, lexicons: list) -> bool:
+        if token in self.gambling_terms:
+            return False
+        if token in self.extra_words:
+            return True
+        return any(token in lex for lex in lexicons)
+
+    def is_positive(self, clean: str) -> bool:
+        return self.matcher.has_category(clean)
+
+    def is_negative(self, clean: str, lexicons: list | None = None) -> bool:
+        if _RE_DIGIT.search(clean):
+            return False
+        if lexicons is None:
+            lexicons = self.current_lexicons()
+        tokens = clean.split()
+        if not all(self._is_known(t, lexicons) for t in tokens):
+            return False
+        return not (self.matcher.find(clean) or self.matcher.find(clean.replace(" ", "")))
+
+    def decide(self, clean: str, mode: str = "both", lexicons: list | None = None) -> Optional[int]:
+        """
+        Keputusan tahap 1 untuk satu teks bersih.
+
+        Args:
+            clean (str): Teks hasil preprocess (tidak kosong).
+            mode (str): Salah satu CASCADE_MODES.
+            lexicons (list | None): Hasil `current_lexicons()`; None = ambil yang terbaru.
+
+        Returns:
+            int | None: 1 (yakin judol), 0 (yakin bersih), atau None (serahkan ke model).
+        """
+        if mode in ("positive", "both") and self.is_positive(clean):
+            return 1
+        if mode in ("negative", "both") and self.is_negative(clean, lexicons):
+            return 0
+        return None
+
+_stage_lock = Lock()
+_STAGE = None
+
+_stats_lock = Lock()
+_STAGE_COUNTS = {"lexicon_positive": 0, "lexicon_negative": 0, "model": 0}
+
+def get_lexicon_stage() -> LexiconStage:
+    """LexiconStage bawaan, dibangun sekali per proses saat pertama dipakai."""
+    global _STAGE
+    if _STAGE is None:
+        with _stage_lock:
+            if _STAGE is None:
+                _STAGE = LexiconStage()
+    return _STAGE
+
+def split_by_stage(cleans: Iterable[str], mode: Optional[str] = None) -> tuple[dict, list[str]]:
+    """
+    Menjalankan tahap 1 pada teks bersih unik dan mencatat statistik per tahap.
+
+    Args:
+        cleans (Iterable[str]): Teks bersih unik (tidak kosong) yang belum diskor.
+        mode (str | None): Salah satu CASCADE_MODES; default CASCADE_MODE.
+
+    Returns:
+        tuple: (peta teks -> proba untuk yang diputuskan tahap 1 (1.0/0.0),
+                daftar teks yang harus diskor model).
+    """
+    mode = CASCADE_MODE if mode is None else mode
+    if mode not in CASCADE_MODES:
+        raise ValueError(f"Mode kaskade tidak dikenal: {mode!r} (pilihan: {', '.join(CASCADE_MODES)})")
+    cleans = list(cleans)
+    if mode == "off":
+        decided, remaining = {}, cleans
+    else:
+        stage = get_lexicon_stage()
+        lexicons = stage.current_lexicons() if mode != "positive" else None
+        decided, remaining = {}, []
+        for c in cleans:
+            label = stage.decide(c, mode, lexicons)
+            if label is None:
+                remaining.append(c)
+            else:
+                decided[c] = float(label)
+    positives = sum(1 for p in decided.values() if p == 1.0)
+    with _stats_lock:
+        _STAGE_COUNTS["lexicon_positive"] += positives
+        _STAGE_COUNTS["lexicon_negative"] += len(decided) - positives
+        _STAGE_COUNTS["model"] += len(remaining)
+    return decided, remaining
+
+def get_cascade_stats() -> dict:
+    """
+    Statistik kaskade sejak start/reset: jumlah teks yang diputuskan tiap tahap dan
+    proporsinya (hit rate).
+    """
+    with _stats_lock:
+        counts = dict(_STAGE_COUNTS)
+    total = sum(counts.values())
+    return {
+        "mode": CASCADE_MODE,
+        "total": total,
+        **counts,
+        **{f"{k}_rate": (v / total if total else 0.0) for k, v in counts.items()},
+    }
+
+def reset_cascade_stats():
+    with _stats_lock:
+        for k in _STAGE_COUNTS:
+            _STAGE_COUNTS[k] = 0
@@ -0,0 +1,157 @@
+from __future__ import annotations
+import copy
+from pathlib import Path
+
+import numpy as np
+
+from .linear_scorer import _classifier, _vectorizer_list
+from .registry import MODEL_DIR, save_model_blob
+
+COMPACT_FORMAT = 1
+QUANT_DTYPES = ("float64", "float32", "float16", "int8")
+
+def _prunable(pipeline) -> bool:
+    vects = _vectorizer_list(pipeline)
+    clf = _classifier(pipeline)
+    if not vects or clf is None or not hasattr(clf, "coef_") or clf.coef_.shape[0] != 1:
+        return False
+    if not all(hasattr(v, "vocabulary_") for _, v in vects):
+        return False
+    return sum(len(v.vocabulary_) for _, v in vects) == clf.coef_.shape[1]
+
+def prune_pipeline(pipeline, threshold: float):
+    """
+    Membuang fitur yang |koefisien|-nya di bawah `threshold`.
+
+    Nilai TF-IDF setelah normalisasi l2 tidak pernah melebihi 1, jadi |koefisien| adalah
+    batas atas kontribusi sebuah fitur pada skor keputusan. Fitur di bawah ambang dihapus
+    dari vocabulary, idf, dan `coef_`; indeks kolom sisanya dipadatkan dengan urutan tetap.
+    Norma l2 dihitung ulang dari fitur yang tersisa, sehingga skor bisa sedikit bergeser
+    (itulah yang diukur oleh `compact_model`).
+
+    Args:
+        pipeline: Pipeline sklearn (FeatureUnion TfidfVectorizer + classifier linear biner).
+        threshold (float): Ambang |koefisien|; 0 berarti tidak ada yang dibuang.
+
+    Returns:
+        Pipeline baru (salinan); pipeline asli tidak diubah.
+    """
+    if not _prunable(pipeline):
+        raise ValueError("Pipeline tidak bisa dipangkas (butuh vectorizer TF-IDF + classifier linear biner)")
+    pruned = copy.deepcopy(pipeline)
+    clf = _classifier(pruned)
+    coef = np.asarray(clf.coef_[0], dtype=np.float64)
+    keep_cols, offset = [], 0
+    for _, vect in _vectorizer_list(pruned):
+        size = len(vect.vocabulary_)
+        terms = [None] * size
+        for term, j in vect.vocabulary_.items():
+            terms[j] = term
+        keep = np.flatnonzero(np.abs(coef[offset:offset + size]) >= threshold)
+        idf = vect.idf_[keep] if vect.use_idf else None
+        vect.vocabulary_ = {terms[j]: i for i, j in enumerate(keep.tolist())}
+        if idf is not None:
+            vect.idf_ = idf
+        tfidf = getattr(vect, "_tfidf", None)
+        if hasattr(tfidf, "n_features_in_"):
+            tfidf.n_features_in_ = len(keep)
+        if getattr(vect, "stop_words_", None) is not None:
+            vect.stop_words_ = None
+        keep_cols.append(keep + offset)
+        offset += size
+    cols = np.concatenate(keep_cols)
+    clf.coef_ = np.ascontiguousarray(clf.coef_[:, cols])
+    if hasattr(clf, "n_features_in_"):
+        clf.n_features_in_ = len(cols)
+    return pruned
+
+def quantize(coef: np.ndarray, dtype: str) -> tuple[np.ndarray, float]:
+    """
+    Mengubah koefisien ke tipe yang lebih kecil.
+
+    Args:
+        coef (np.ndarray): Koefisien float64.
+        dtype (str): Salah satu QUANT_DTYPES. "int8" memakai skala simetris per model.
+
+    Returns:
+        tuple: (array terkuantisasi, skala) dengan nilai asli ~= array * skala.
+    """
+    if dtype not in QUANT_DTYPES:
+        raise ValueError(f"dtype tidak dikenal: {dtype!r} (pilihan: {', '.join(QUANT_DTYPES)})")
+    if dtype == "int8":
+        peak = float(np.abs(coef).max()) if coef.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        return np.clip(np.rint(coef / scale), -127, 127).astype(np.int8), scale
+    return coef.astype(dtype), 1.0
+
+def dequantize(values: np.ndarray, scale: float) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64) * scale
+
+def compact_pipeline(pipeline, threshold: float, dtype: str):
+    """
+    Memangkas lalu mengkuantisasi pipeline.
+
+    Returns:
+        tuple: (pipeline siap pakai dengan `coef_` float64 hasil dekuantisasi,
+                pipeline untuk disimpan dengan `coef_` terkuantisasi, info kompaksi).
+    """
+    pruned = prune_pipeline(pipeline, threshold)
+    clf = _classifier(pruned)
+    stored, scale = quantize(np.asarray(clf.coef_, dtype=np.float64), dtype)
+    clf.coef_ = dequantize(stored, scale)
+
+    to_save = copy.copy(pruned)
+    to_save.steps = list(pruned.steps)
+    stored_clf = copy.copy(clf)
+    stored_clf.coef_ = stored
+    to_save.steps[-1] = (to_save.steps[-1][0], stored_clf)
+
+    info = {
+        "format": COMPACT_FORMAT,
+        "threshold": float(threshold),
+        "dtype": dtype,
+        "scale": scale,
+        "n_features": int(stored.shape[1]),
+        "n_features_original": int(_classifier(pipeline).coef_.shape[1]),
+    }
+    return pruned, to_save, info
+
+def restore_compact(pipeline, meta: dict):
+    """
+    Dipanggil registry saat memuat model: mengembalikan `coef_` terkuantisasi ke float64
+    agar classifier sklearn dan LinearScorer bisa memakainya seperti biasa.
+    """
+    info = meta.get("compact")
+    if not info:
+        return pipeline
+    if info.get("format") != COMPACT_FORMAT:
+        raise ValueError(f"Format model ringkas {info.get('format')!r} tidak didukung")
+    clf = _classifier(pipeline)
+    clf.coef_ = dequantize(clf.coef_, info["scale"])
+    return pipeline
+
+def compact_name(source: str, threshold: float, dtype: str) -> str:
+    """Nama versi model ringkas, misal v16 + 0.05 + int8 -> "v16_compact_int8_t0.05"."""
+    return f"{source}_compact_{dtype}_t{threshold:g}"
+
+def write_compact_model(model, threshold: float, dtype: str, name: str | None = None,
+                        model_dir: Path | str = MODEL_DIR):
+    """
+    Membuat dan menyimpan versi ringkas dari `LoadedModel` ke folder model, sehingga bisa
+    dipilih lewat JUDOL_MODEL / `switch_model` seperti model lain.
+
+    Returns:
+        tuple: (nama versi baru, path file, pipeline siap pakai).
+    """
+    name = name or compact_name(model.name, threshold, dtype)
+    pipeline, to_save, info = compact_pipeline(model.pipeline, threshold, dtype)
+    info["source"] = model.name
+    blob = {
+        "pipeline": to_save,
+        "version": name,
+        "notes": (f"Versi ringkas dari {model.name}: {info['n_features']}/{info['n_features_original']} "
+                  f"fitur (|coef| >= {threshold:g}), koefisien {dtype}"),
+        "env": model.meta.get("env"),
+        "compact": info,
+    }
+    return name, save_model_blob(blob, name, model_dir), pipeline
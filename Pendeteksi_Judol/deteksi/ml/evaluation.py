@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+def classification_metrics(pred, labels) -> dict:
+    """
+    Metrik klasifikasi biner (kelas positif = judol).
+
+    Args:
+        pred: Label prediksi (0/1).
+        labels: Label sebenarnya (0/1), sejajar dengan `pred`.
+
+    Returns:
+        dict: accuracy, precision, recall, f1, serta jumlah fp dan fn.
+    """
+    pairs = list(zip(pred, labels))
+    tp = sum(1 for p, y in pairs if p == 1 and y == 1)
+    fp = sum(1 for p, y in pairs if p == 1 and y == 0)
+    fn = sum(1 for p, y in pairs if p == 0 and y == 1)
+    correct = sum(1 for p, y in pairs if p == y)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"accuracy": correct / len(pairs) if pairs else 0.0, "precision": precision, "recall": recall,
+            "f1": f1, "fp": fp, "fn": fn}
+
+def calibration_metrics(probas, labels, bins: int = 10) -> dict:
+    """
+    Metrik kalibrasi proba kelas judol.
+
+    Args:
+        probas: Proba judol per komentar (0..1).
+        labels: Label sebenarnya (0/1), sejajar dengan `probas`.
+        bins (int): Jumlah bin lebar sama untuk ECE.
+
+    Returns:
+        dict: brier (rata-rata kuadrat galat) dan ece (expected calibration error).
+    """
+    pairs = list(zip(probas, labels))
+    if not pairs:
+        return {"brier": 0.0, "ece": 0.0}
+    brier = sum((p - y) ** 2 for p, y in pairs) / len(pairs)
+    totals = [[0, 0.0, 0] for _ in range(bins)]
+    for p, y in pairs:
+        b = totals[min(int(p * bins), bins - 1)]
+        b[0] += 1
+        b[1] += p
+        b[2] += y
+    ece = sum(abs(s - pos) for n, s, pos in totals if n) / len(pairs)
+    return {"brier": brier, "ece": ece}
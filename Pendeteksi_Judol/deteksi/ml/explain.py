@@ -0,0 +1,100 @@
+from __future__ import annotations
+import weakref
+from threading import Lock
+
+import numpy as np
+
+from .hashing import hashed_feature_names, hashing_vectorizer
+from .linear_scorer import _classifier, _vectorizer_list
+
+# Hanya n-gram kata yang ditampilkan; n-gram karakter tidak bermakna bagi pengguna.
+DISPLAY_ANALYZERS = ("word",)
+
+class ModelExplainer:
+    """
+    Penjelas kontribusi fitur untuk satu pipeline TF-IDF + classifier linear.
+
+    Nama fitur dan potongan `coef_` untuk tiap vectorizer yang ditampilkan dihitung sekali
+    saat dibangun. Kontribusi (tfidf * koefisien) dihitung sekaligus untuk satu batch dari
+    matriks sparse hasil `transform`, tanpa `get_feature_names_out` dan pengindeksan sparse
+    per fitur di setiap permintaan. Karena FeatureUnion tidak memakai bobot dan tiap
+    vectorizer menormalisasi kolomnya sendiri, cukup vectorizer kata yang dijalankan.
+    Untuk blok hashing (lihat hashing.py) nama fitur dipulihkan per teks dari analyzer.
+    """
+
+    def __init__(self, pipeline):
+        self.blocks = []
+        vects = _vectorizer_list(pipeline)
+        clf = _classifier(pipeline)
+        if not vects or clf is None or not hasattr(clf, "coef_"):
+            return
+        coef = np.asarray(clf.coef_[0], dtype=np.float64)
+        offset = 0
+        for _, vect in vects:
+            hasher = hashing_vectorizer(vect)
+            if hasher is not None:
+                size, analyzer = hasher.n_features, hasher.analyzer
+            else:
+                size, analyzer = len(vect.vocabulary_), getattr(vect, "analyzer", None)
+            if analyzer in DISPLAY_ANALYZERS:
+                names = None if hasher is not None else np.asarray(vect.get_feature_names_out(), dtype=object)
+                self.blocks.append((vect, hasher, names, coef[offset:offset + size]))
+            offset += size
+        if offset != coef.shape[0]:
+            self.blocks = []
+
+    @property
+    def supported(self) -> bool:
+        return bool(self.blocks)
+
+    def explain_many(self, cleans: list[str]) -> list[list[dict]]:
+        """
+        Daftar fitur aktif beserta kontribusinya untuk banyak teks bersih.
+
+        Args:
+            cleans (list[str]): Teks hasil preprocess.
+
+        Returns:
+            list[list[dict]]: Per teks, fitur ('feature', 'tfidf', 'coefficient',
+            'contribution') terurut menurut |contribution| terbesar.
+        """
+        out = [[] for _ in cleans]
+        if not cleans:
+            return out
+        for vect, hasher, names, coef in self.blocks:
+            hashed = hashed_feature_names(hasher, cleans) if hasher is not None else None
+            X = vect.transform(cleans).tocsr()
+            X.sort_indices()
+            coefs = coef[X.indices]
+            contrib = X.data * coefs
+            for i in range(len(cleans)):
+                start, end = X.indptr[i], X.indptr[i + 1]
+                if start == end:
+                    continue
+                cols = X.indices[start:end]
+                feats = names[cols].tolist() if hashed is None else [hashed[i][j] for j in cols.tolist()]
+                out[i].extend(
+                    {"feature": f, "tfidf": t, "coefficient": c, "contribution": v}
+                    for f, t, c, v in zip(
+                        feats, X.data[start:end].tolist(),
+                        coefs[start:end].tolist(), contrib[start:end].tolist(),
+                    )
+                )
+        for feats in out:
+            feats.sort(key=lambda x: abs(x["contribution"]), reverse=True)
+        return out
+
+_lock = Lock()
+# Dikunci per objek pipeline (weak), sehingga penjelas ikut dibuang ketika model diganti.
+_EXPLAINERS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+def get_explainer(model) -> ModelExplainer:
+    """ModelExplainer untuk `LoadedModel`, dibangun sekali per pipeline yang dimuat."""
+    pipeline = model.pipeline
+    explainer = _EXPLAINERS.get(pipeline)
+    if explainer is None:
+        with _lock:
+            explainer = _EXPLAINERS.get(pipeline)
+            if explainer is None:
+                explainer = _EXPLAINERS[pipeline] = ModelExplainer(pipeline)
+    return explainer
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import difflib
+import math
+import string
+from collections import defaultdict
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+_ALPHABET = string.ascii_lowercase + string.digits
+_COLUMN = {ch: i for i, ch in enumerate(_ALPHABET)}
+_OTHER = len(_ALPHABET)
+
+# Toleransi pembulatan saat membandingkan batas rasio dengan cutoff.
+_EPS = 1e-9
+
+def _char_grams(word: str) -> list[tuple[str, int]]:
+    """
+    Gram karakter bernomor kemunculan: "gacor" -> (g,1), (a,1), ...; "aab" -> (a,1), (a,2), (b,1).
+    Irisan gram dua kata sama dengan irisan multiset karakternya (dasar `quick_ratio`).
+    """
+    seen = {}
+    grams = []
+    for ch in word:
+        seen[ch] = seen.get(ch, 0) + 1
+        grams.append((ch, seen[ch]))
+    return grams
+
+def _char_counts(word: str) -> np.ndarray:
+    """Vektor jumlah kemunculan karakter (a-z, 0-9, lainnya) untuk satu kata."""
+    counts = np.zeros(_OTHER + 1, dtype=np.int32)
+    for ch in word:
+        counts[_COLUMN.get(ch, _OTHER)] += 1
+    return counts
+
+class DomainMatcher:
+    """
+    Pencocok fuzzy untuk kosakata domain (judi online) dengan semantik yang sama seperti
+    `difflib.SequenceMatcher(None, query, kandidat).ratio()` terhadap setiap kandidat.
+
+    Dengan `cutoff` > 0, kandidat diambil dari indeks (panjang, gram karakter) alih-alih
+    dipindai semua:
+
+    - Ember panjang: rasio paling tinggi 2*min(la, lb)/(la + lb), jadi hanya panjang kandidat
+      yang masih bisa mencapai cutoff yang dibuka.
+    - Prefix filter gram: kandidat dengan rasio >= cutoff harus berbagi paling sedikit
+      o = ceil(cutoff*(la + lb)/2) gram dengan query, sehingga pasti memuat salah satu dari
+      (la - o + 1) gram query yang paling jarang. Hanya posting gram-gram itu yang dibaca.
+
+    Keduanya batas atas yang sah untuk rasio SequenceMatcher (gram dua karakter tidak, karena
+    blok yang cocok bisa sepanjang satu karakter), jadi hasilnya tetap sama dengan pemindaian
+    penuh. Kandidat lalu diperiksa dari batas atas `quick_ratio` tertinggi, dan rasio
+    SequenceMatcher yang mahal hanya dihitung selama batas atasnya masih bisa mengalahkan
+    hasil terbaik. Pada rasio yang sama, kandidat dengan urutan lebih awal di `words` yang
+    menang. Dengan `cutoff` 0 semua kandidat dipertimbangkan seperti perulangan difflib biasa.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words = list(dict.fromkeys(words))
+        self._lengths = np.array([len(w) for w in self.words], dtype=np.int32)
+        if self.words:
+            self._counts = np.stack([_char_counts(w) for w in self.words])
+        else:
+            self._counts = np.zeros((0, _OTHER + 1), dtype=np.int32)
+        postings = defaultdict(list)
+        self._gram_freq = defaultdict(int)
+        for idx, word in enumerate(self.words):
+            for gram in _char_grams(word):
+                postings[(len(word), gram)].append(idx)
+                self._gram_freq[gram] += 1
+        self._postings = {key: np.array(ids, dtype=np.int64) for key, ids in postings.items()}
+        self._length_set = sorted(set(self._lengths.tolist()))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def upper_bounds(self, query: str, candidates: Optional[np.ndarray] = None) -> np.ndarray:
+        """Batas atas rasio (setara `quick_ratio`) untuk semua kandidat (atau `candidates`) sekaligus."""
+        counts = self._counts if candidates is None else self._counts[candidates]
+        lengths = self._lengths if candidates is None else self._lengths[candidates]
+        matches = np.minimum(counts, _char_counts(query)).sum(axis=1)
+        return 2.0 * matches / (lengths + len(query))
+
+    def candidates(self, query: str, cutoff: float) -> np.ndarray:
+        """
+        Indeks kandidat yang rasionya masih mungkin >= `cutoff` (urut naik).
+
+        Args:
+            query (str): Kata yang dicari (tidak kosong).
+            cutoff (float): Rasio minimum (> 0).
+
+        Returns:
+            np.ndarray: Indeks ke `words` yang lolos ember panjang, prefix filter gram, dan
+            batas `quick_ratio`.
+        """
+        return self._candidates(query, cutoff)[0]
+
+    def _candidates(self, query: str, cutoff: float) -> Tuple[np.ndarray, np.ndarray]:
+        la = len(query)
+        grams = sorted(_char_grams(query), key=lambda g: (self._gram_freq.get(g, 0), g))
+        found = []
+        for lb in self._length_set:
+            if 2.0 * min(la, lb) / (la + lb) < cutoff - _EPS:
+                continue
+            need = max(1, math.ceil(cutoff * (la + lb) / 2.0 - _EPS))
+            for gram in grams[:la - need + 1]:
+                ids = self._postings.get((lb, gram))
+                if ids is not None:
+                    found.append(ids)
+        if not found:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        ids = np.unique(np.concatenate(found))
+        bounds = self.upper_bounds(query, ids)
+        keep = bounds >= cutoff
+        return ids[keep], bounds[keep]
+
+    def best_match(self, query: str, cutoff: float = 0.0) -> Tuple[Optional[str], float]:
+        """
+        Mencari kandidat dengan rasio kemiripan tertinggi terhadap query.
+
+        Args:
+            query (str): Kata yang dicari.
+            cutoff (float): Kandidat yang batas atas rasionya di bawah nilai ini tidak diperiksa.
+
+        Returns:
+            tuple: (kandidat_terbaik atau None, rasio). Jika ada kandidat dengan rasio >= cutoff,
+            hasilnya sama seperti perulangan difflib biasa; jika tidak, (None, 0.0) atau
+            kandidat dengan rasio di bawah cutoff.
+        """
+        if not self.words or not query:
+            return None, 0.0
+
+        if cutoff > 0.0:
+            ids, bounds = self._candidates(query, cutoff)
+        else:
+            ids = np.arange(len(self.words))
+            bounds = self.upper_bounds(query)
+        order = np.lexsort((ids, -bounds))
+
+        best, best_ratio, best_idx = None, 0.0, -1
+        for pos in order.tolist():
+            bound, idx = bounds[pos], int(ids[pos])
+            if bound < cutoff or bound < best_ratio or bound == 0.0:
+                break
+            if bound == best_ratio and idx > best_idx:
+                continue
+            cand = self.words[idx]
+            r = difflib.SequenceMatcher(None, query, cand).ratio()
+            if r > best_ratio or (r == best_ratio and r > 0.0 and idx < best_idx):
+                best, best_ratio, best_idx = cand, r, idx
+        return best, best_ratio
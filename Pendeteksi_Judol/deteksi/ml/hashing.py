@@ -0,0 +1,83 @@
+from __future__ import annotations
+import os
+
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import FeatureUnion, Pipeline
+
+# Jumlah kolom hash per vectorizer. Memori peta fitur (idf + koefisien) tetap, tidak
+# bergantung pada jumlah n-gram di data latih; tabrakan hash makin jarang jika diperbesar.
+HASH_FEATURES = int(os.environ.get("JUDOL_HASH_FEATURES", 2 ** 18))
+
+# Mengikuti konfigurasi vectorizer v16 (min_df/max_df tidak berlaku untuk hashing).
+WORD_NGRAMS = (1, 3)
+CHAR_NGRAMS = (2, 4)
+
+def hashing_block(analyzer: str, ngram_range: tuple[int, int], n_features: int = HASH_FEATURES) -> Pipeline:
+    """
+    Pengganti TfidfVectorizer tanpa vocabulary: HashingVectorizer (hitungan mentah, tanpa
+    tanda bergantian dan tanpa normalisasi) lalu TfidfTransformer yang menyimpan idf per kolom
+    hash dan melakukan sublinear tf + normalisasi l2 seperti model lain.
+    """
+    return Pipeline([
+        ("hash", HashingVectorizer(analyzer=analyzer, ngram_range=ngram_range, n_features=n_features,
+                                   alternate_sign=False, norm=None)),
+        ("tfidf", TfidfTransformer(sublinear_tf=True)),
+    ])
+
+def build_hashing_pipeline(n_features: int = HASH_FEATURES, clf=None) -> Pipeline:
+    """
+    Pipeline belum di-fit dengan struktur yang sama seperti model lain ("features" + "clf"),
+    sehingga bisa dipakai `predict_comment`/`predict_and_explain` tanpa perubahan.
+
+    Args:
+        n_features (int): Jumlah kolom hash per vectorizer.
+        clf: Classifier linear; default LogisticRegression dengan parameter v16.
+
+    Returns:
+        Pipeline: Pipeline sklearn siap `fit`.
+    """
+    if clf is None:
+        clf = LogisticRegression(C=10.0, class_weight="balanced", solver="saga", max_iter=3000, random_state=42)
+    return Pipeline([
+        ("features", FeatureUnion([
+            ("word", hashing_block("word", WORD_NGRAMS, n_features)),
+            ("char", hashing_block("char_wb", CHAR_NGRAMS, n_features)),
+        ])),
+        ("clf", clf),
+    ])
+
+def hashing_vectorizer(step):
+    """HashingVectorizer di dalam blok hashing, atau None jika `step` bukan blok hashing."""
+    steps = getattr(step, "steps", None)
+    if steps and isinstance(steps[0][1], HashingVectorizer):
+        return steps[0][1]
+    return None
+
+def hashed_feature_names(hasher: HashingVectorizer, docs: list[str]) -> list[dict[int, str]]:
+    """
+    Memulihkan nama fitur untuk kolom hash: n-gram tiap teks dihitung ulang dengan analyzer
+    yang sama lalu di-hash dengan fungsi yang sama seperti HashingVectorizer.
+
+    Args:
+        hasher (HashingVectorizer): Vectorizer di dalam pipeline.
+        docs (list[str]): Teks bersih.
+
+    Returns:
+        list[dict[int, str]]: Per teks, peta kolom -> n-gram. Jika beberapa n-gram dalam
+        satu teks jatuh ke kolom yang sama, namanya digabung dengan " | ".
+    """
+    analyze = hasher.build_analyzer()
+    feature_hasher = FeatureHasher(n_features=hasher.n_features, input_type="string",
+                                   alternate_sign=False)
+    out = []
+    for doc in docs:
+        terms = list(dict.fromkeys(analyze(doc)))
+        names = {}
+        if terms:
+            cols = feature_hasher.transform([[t] for t in terms]).indices
+            for col, term in zip(cols.tolist(), terms):
+                names[col] = f"{names[col]} | {term}" if col in names else term
+        out.append(names)
+    return out
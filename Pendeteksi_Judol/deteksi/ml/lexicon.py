@@ -0,0 +1,401 @@
+from __future__ import annotations
+import ast
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+
+ASSET_DIR = Path(__file__).resolve().parent / "asset"
+COMPILED_DIR = ASSET_DIR / "compiled"
+
+MAGIC = b"JLEX"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sII")  # magic, versi format, panjang header JSON
+_ALIGN = 8
+
+LEXICON_POLL_SECONDS = float(os.environ.get("LEXICON_POLL_SECONDS", 5))
+
+# nama -> (file sumber relatif terhadap asset/, nama variabel di modul .py, jenis nilai)
+LEXICON_SOURCES = {
+    "kamus_alay": ("kamus/kamus_alay.py", "kamus_alay", "str"),
+    "lexicon_alay": ("kamus/lexicon_alay.py", "lexicon_alay", "str"),
+    "lexicon_berurutan": ("kamus/kumpulan_kata_huruf_berurutan.py", "lexicon_berurutan", "none"),
+    "kata_indonesia": ("Kumpulan_Kata_Indonesia.txt", None, "none"),
+}
+
+def _read_umask() -> int:
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+# Dibaca sekali saat impor; os.umask hanya bisa dibaca dengan mengubahnya, dan itu tidak aman antar thread.
+_UMASK = _read_umask()
+
+def publish_mode(target, directory: bool = False):
+    """
+    Memberi izin file/folder biasa (0644/0755 dikurangi umask) pada hasil `mkstemp`/`mkdtemp`,
+    yang bawaannya 0600/0700, sebelum di-`os.replace` ke lokasi akhir. Tanpa ini worker yang
+    berjalan sebagai user lain tidak bisa membaca file yang diterbitkan.
+
+    Args:
+        target (int | Path | str): File descriptor terbuka, atau path file/folder.
+        directory (bool): True untuk folder.
+    """
+    mode = (0o755 if directory else 0o644) & ~_UMASK
+    if isinstance(target, int):
+        os.fchmod(target, mode)
+    else:
+        os.chmod(target, mode)
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+def _pack_strings(items: list[bytes]) -> tuple[np.ndarray, bytes]:
+    """Menggabungkan daftar byte string menjadi blob + array offset uint32 (panjang n+1)."""
+    offsets = np.zeros(len(items) + 1, dtype=np.uint32)
+    np.cumsum([len(b) for b in items], out=offsets[1:])
+    return offsets, b"".join(items)
+
+def _hash_table(keys: list[bytes]) -> np.ndarray:
+    """
+    Tabel hash open addressing (linear probing) berisi indeks kunci + 1 (0 = kosong),
+    dengan ukuran pangkat dua minimal 2x jumlah kunci dan hash zlib.crc32 yang stabil.
+    """
+    size = 8
+    while size < 2 * len(keys):
+        size *= 2
+    mask = size - 1
+    table = [0] * size
+    for i, key in enumerate(keys):
+        slot = zlib.crc32(key) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = i + 1
+    return np.asarray(table, dtype=np.uint32)
+
+def write_lexicon(path: Path | str, entries, value_kind: str = "str", meta: dict | None = None) -> Path:
+    """
+    Mengompilasi kamus menjadi file biner yang bisa di-mmap.
+
+    Tata letak file: preamble (magic, versi, panjang header), header JSON berisi metadata
+    dan posisi setiap bagian, lalu array-array yang disejajarkan 8 byte: `key_offsets`
+    dan `key_blob` (kunci UTF-8 terurut), `hash_index` (tabel hash untuk lookup O(1)),
+    serta nilai (`val_offsets`/`val_blob` untuk string atau `values` int64).
+    File ditulis ke file sementara lalu di-`os.replace`, sehingga pembaca tidak pernah
+    melihat file setengah jadi.
+
+    Args:
+        path (Path | str): Lokasi file keluaran.
+        entries (dict | Iterable[str]): Peta kunci -> nilai, atau kumpulan kunci saja.
+        value_kind (str): "str", "int", atau "none" (himpunan tanpa nilai).
+        meta (dict | None): Metadata tambahan yang disimpan di header.
+
+    Returns:
+        Path: Lokasi file yang ditulis.
+    """
+    if value_kind not in ("str", "int", "none"):
+        raise ValueError(f"value_kind tidak dikenal: {value_kind!r}")
+    mapping = dict(entries) if isinstance(entries, Mapping) else dict.fromkeys(entries)
+    items = sorted((str(k).encode("utf-8"), v) for k, v in mapping.items())
+    keys = [k for k, _ in items]
+
+    key_offsets, key_blob = _pack_strings(keys)
+    sections = [
+        ("key_offsets", key_offsets),
+        ("key_blob", np.frombuffer(key_blob, dtype=np.uint8)),
+        ("hash_index", _hash_table(keys)),
+    ]
+    if value_kind == "str":
+        val_offsets, val_blob = _pack_strings([str(v).encode("utf-8") for _, v in items])
+        sections += [("val_offsets", val_offsets), ("val_blob", np.frombuffer(val_blob, dtype=np.uint8))]
+    elif value_kind == "int":
+        sections.append(("values", np.asarray([int(v) for _, v in items], dtype=np.int64)))
+
+    header = {
+        "format": FORMAT_VERSION,
+        "count": len(keys),
+        "value_kind": value_kind,
+        "meta": meta or {},
+        "sections": {},
+    }
+    # Posisi bagian bergantung pada panjang header; hitung ulang sampai stabil.
+    header_len = 0
+    while True:
+        offset = _align(_PREAMBLE.size + header_len)
+        for name, arr in sections:
+            header["sections"][name] = {"offset": offset, "dtype": arr.dtype.str, "length": int(arr.size)}
+            offset = _align(offset + arr.nbytes)
+        raw = json.dumps(header, sort_keys=True).encode("utf-8")
+        if len(raw) == header_len:
+            break
+        header_len = len(raw)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        publish_mode(fd)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(raw)))
+            f.write(raw)
+            for name, arr in sections:
+                f.write(b"\0" * (header["sections"][name]["offset"] - f.tell()))
+                f.write(arr.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return path
+
+class CompiledLexicon(Mapping):
+    """
+    Kamus hasil `write_lexicon` yang dibaca lewat mmap (read-only). Isinya tidak disalin
+    ke heap Python, sehingga halaman file dibagi oleh semua worker gunicorn lewat page cache.
+    Untuk himpunan (value_kind "none"), nilai setiap kunci adalah None.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_len = _PREAMBLE.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path} bukan file leksikon versi {FORMAT_VERSION}")
+        self.header = json.loads(self._mm[_PREAMBLE.size:_PREAMBLE.size + header_len])
+        self.meta = self.header["meta"]
+        self.value_kind = self.header["value_kind"]
+        self._count = self.header["count"]
+
+        self._view = memoryview(self._mm)
+        self._key_offsets = self._section_view("key_offsets", "I")
+        self._key_blob = self._section_view("key_blob", "B")
+        self._index = self._section_view("hash_index", "I")
+        self._mask = len(self._index) - 1
+        if self.value_kind == "str":
+            self._val_offsets = self._section_view("val_offsets", "I")
+            self._val_blob = self._section_view("val_blob", "B")
+        elif self.value_kind == "int":
+            self._values = self._section_view("values", "q")
+
+    def _section_view(self, name: str, fmt: str) -> memoryview:
+        sec = self.header["sections"][name]
+        size = np.dtype(sec["dtype"]).itemsize * sec["length"]
+        return self._view[sec["offset"]:sec["offset"] + size].cast(fmt)
+
+    def array(self, name: str) -> np.ndarray:
+        """Mengembalikan satu bagian file sebagai array numpy read-only (tanpa salinan)."""
+        sec = self.header["sections"][name]
+        return np.frombuffer(self._mm, dtype=sec["dtype"], count=sec["length"], offset=sec["offset"])
+
+    def index_of(self, key: str) -> int:
+        """
+        Mencari posisi kunci di urutan terurut memakai tabel hash.
+
+        Returns:
+            int: Indeks kunci, atau -1 jika tidak ada.
+        """
+        data = key.encode("utf-8")
+        index, offsets, blob, mask = self._index, self._key_offsets, self._key_blob, self._mask
+        slot = zlib.crc32(data) & mask
+        while True:
+            i = index[slot]
+            if not i:
+                return -1
+            i -= 1
+            if blob[offsets[i]:offsets[i + 1]] == data:
+                return i
+            slot = (slot + 1) & mask
+
+    def key_at(self, i: int) -> str:
+        return bytes(self._key_blob[self._key_offsets[i]:self._key_offsets[i + 1]]).decode("utf-8")
+
+    def value_at(self, i: int):
+        if self.value_kind == "str":
+            return bytes(self._val_blob[self._val_offsets[i]:self._val_offsets[i + 1]]).decode("utf-8")
+        if self.value_kind == "int":
+            return self._values[i]
+        return None
+
+    def __getitem__(self, key):
+        i = self.index_of(key) if isinstance(key, str) else -1
+        if i < 0:
+            raise KeyError(key)
+        return self.value_at(i)
+
+    def get(self, key, default=None):
+        i = self.index_of(key) if isinstance(key, str) else -1
+        return self.value_at(i) if i >= 0 else default
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self.index_of(key) >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self.key_at(i)
+
+    def close(self):
+        """Melepas mmap. Hanya aman dipanggil jika tidak ada pembaca lain yang masih memakainya."""
+        for name in ("_key_offsets", "_key_blob", "_index", "_val_offsets", "_val_blob", "_values", "_view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mm.close()
+
+def read_source(name: str):
+    """
+    Membaca sumber leksikon tanpa meng-import modulnya. File .py di asset/kamus berisi
+    literal besar (dan beberapa punya kode contoh di level modul), jadi literalnya diambil
+    lewat `ast.literal_eval`. File .txt dibaca sebagai satu kata per baris.
+
+    Returns:
+        dict | list: Isi leksikon.
+    """
+    rel, var, _ = LEXICON_SOURCES[name]
+    path = ASSET_DIR / rel
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".txt":
+        return [w.strip() for w in text.splitlines() if w.strip()]
+    for node in ast.parse(text).body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == var for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"Variabel {var} tidak ditemukan di {path}")
+
+def source_digest(name: str) -> str:
+    """Hash BLAKE2b file sumber, disimpan di header untuk mendeteksi hasil kompilasi yang usang."""
+    rel, _, _ = LEXICON_SOURCES[name]
+    return hashlib.blake2b((ASSET_DIR / rel).read_bytes(), digest_size=16).hexdigest()
+
+def compiled_path(name: str, directory: Path | str = COMPILED_DIR) -> Path:
+    return Path(directory) / f"{name}.lex"
+
+def compile_lexicon(name: str, directory: Path | str = COMPILED_DIR) -> Path:
+    """
+    Mengompilasi satu leksikon dari LEXICON_SOURCES ke `<directory>/<name>.lex`.
+
+    Args:
+        name (str): Nama leksikon.
+        directory (Path | str): Folder keluaran.
+
+    Returns:
+        Path: Lokasi file hasil kompilasi.
+    """
+    rel, _, value_kind = LEXICON_SOURCES[name]
+    meta = {"name": name, "source": rel, "source_digest": source_digest(name)}
+    return write_lexicon(compiled_path(name, directory), read_source(name), value_kind, meta)
+
+def is_stale(name: str, directory: Path | str = COMPILED_DIR) -> bool:
+    """True jika file hasil kompilasi tidak ada, rusak, atau dibuat dari sumber yang berbeda."""
+    try:
+        lex = CompiledLexicon(compiled_path(name, directory))
+    except (OSError, ValueError):
+        return True
+    try:
+        return lex.meta.get("source_digest") != source_digest(name)
+    finally:
+        lex.close()
+
+class LexiconStore:
+    """
+    Pemuat leksikon dengan hot reload. Setiap `get` memeriksa (paling sering sekali per
+    `poll_interval` detik) apakah file .lex berganti; jika ya, file baru dibuka lalu
+    referensinya ditukar secara atomik. Pembaca yang masih memegang objek lama tetap aman
+    karena `os.replace` tidak mengubah isi inode lama yang sedang di-mmap.
+    """
+
+    def __init__(self, directory: Path | str = COMPILED_DIR, poll_interval: float = LEXICON_POLL_SECONDS,
+                 auto_compile: bool = True):
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.auto_compile = auto_compile
+        self._lock = Lock()
+        self._loaded = {}  # nama -> (CompiledLexicon, signature file, waktu cek terakhir)
+
+    def _signature(self, path: Path):
+        st = os.stat(path)
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _load(self, name: str):
+        path = compiled_path(name, self.directory)
+        if not path.exists():
+            if not self.auto_compile or name not in LEXICON_SOURCES:
+                raise FileNotFoundError(path)
+            compile_lexicon(name, self.directory)
+        sig = self._signature(path)
+        entry = (CompiledLexicon(path), sig, time.monotonic())
+        self._loaded[name] = entry
+        return entry
+
+    def get(self, name: str) -> CompiledLexicon:
+        """
+        Mengembalikan leksikon terkini. Panggil ulang per batch (jangan disimpan lama)
+        agar pergantian file ikut terpakai.
+        """
+        entry = self._loaded.get(name)
+        if entry is None:
+            with self._lock:
+                entry = self._loaded.get(name) or self._load(name)
+            return entry[0]
+
+        lex, sig, checked = entry
+        now = time.monotonic()
+        if now - checked < self.poll_interval:
+            return lex
+        with self._lock:
+            entry = self._loaded[name]
+            if entry[2] != checked:
+                return entry[0]
+            try:
+                changed = self._signature(lex.path) != sig
+            except OSError:
+                changed = False
+            if changed:
+                return self._load(name)[0]
+            self._loaded[name] = (lex, sig, now)
+            return lex
+
+    def reload(self, name: str | None = None):
+        """Memaksa pemuatan ulang satu atau semua leksikon yang sudah pernah dimuat."""
+        with self._lock:
+            for n in [name] if name else list(self._loaded):
+                self._load(n)
+
+_store_lock = Lock()
+_STORE = None
+
+def get_lexicon_store() -> LexiconStore:
+    """LexiconStore bawaan (folder asset/compiled), dibuat sekali per proses."""
+    global _STORE
+    if _STORE is None:
+        with _store_lock:
+            if _STORE is None:
+                _STORE = LexiconStore()
+    return _STORE
+
+def get_lexicon(name: str) -> CompiledLexicon:
+    """
+    Mengambil leksikon terkompilasi berdasarkan nama (lihat LEXICON_SOURCES). Jika file
+    .lex belum ada, leksikon dikompilasi otomatis.
+
+    Args:
+        name (str): Nama leksikon, misal "kamus_alay" atau "kata_indonesia".
+
+    Returns:
+        CompiledLexicon: Kamus read-only berbasis mmap.
+    """
+    return get_lexicon_store().get(name)
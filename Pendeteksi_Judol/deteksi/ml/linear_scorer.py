@@ -0,0 +1,202 @@
+from __future__ import annotations
+import math
+from collections import Counter
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+_PROBA_LOSSES = ("log_loss", "modified_huber")
+
+# Di bawah jumlah teks ini, jalur per teks lebih cepat daripada menyusun array numpy.
+BATCH_MIN = 16
+
+def _vectorizer_list(pipeline) -> list:
+    """Daftar (nama, vectorizer) sesuai urutan kolom FeatureUnion / Pipeline."""
+    steps = getattr(pipeline, "steps", [])
+    out = []
+    for name, step in steps:
+        if hasattr(step, "vocabulary_"):
+            out.append((name, step))
+        for sub, vect in getattr(step, "transformer_list", []):
+            out.append((sub, vect))
+    return out
+
+def _classifier(pipeline):
+    steps = getattr(pipeline, "steps", [])
+    return steps[-1][1] if steps else None
+
+class _Block:
+    """Satu vectorizer TF-IDF beserta potongan bobot classifier untuk kolom-kolomnya."""
+    __slots__ = ("name", "params", "analyze", "vocab", "idf", "weights", "_idf_items", "_weight_items",
+                 "sublinear_tf", "binary", "norm")
+
+    def __init__(self, name, params, vocab, idf, weights):
+        self.name = name
+        self.params = params
+        self.analyze = TfidfVectorizer(**params).build_analyzer()
+        self.vocab = vocab
+        # Tanpa salinan: untuk model ekspor bersama (shared_model.py) idf/coef tetap view mmap
+        # read-only sehingga halamannya dipakai bersama antar worker.
+        self.idf = np.ascontiguousarray(idf, dtype=np.float64) if idf is not None else None
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        # memoryview: indeks langsung mengembalikan float Python tanpa objek numpy per akses.
+        self._idf_items = memoryview(self.idf) if self.idf is not None else None
+        self._weight_items = memoryview(self.weights)
+        self.sublinear_tf = params.get("sublinear_tf", False)
+        self.binary = params.get("binary", False)
+        self.norm = params.get("norm", "l2")
+
+    def decision(self, doc: str) -> float:
+        get = self.vocab.get
+        idf, weights = self._idf_items, self._weight_items
+        dot = sq = ab = 0.0
+        for term, count in Counter(self.analyze(doc)).items():
+            j = get(term)
+            if j is None:
+                continue
+            tf = 1.0 if self.binary else float(count)
+            if self.sublinear_tf:
+                tf = math.log(tf) + 1.0
+            v = tf * idf[j] if idf is not None else tf
+            dot += v * weights[j]
+            sq += v * v
+            ab += abs(v)
+        if self.norm == "l2":
+            return dot / math.sqrt(sq) if sq > 0.0 else 0.0
+        if self.norm == "l1":
+            return dot / ab if ab > 0.0 else 0.0
+        return dot
+
+    def decision_many(self, docs: list[str]) -> np.ndarray:
+        """
+        Versi batch dari `decision`: hanya pencarian vocabulary yang berjalan per n-gram di
+        Python, sedangkan tf-idf, normalisasi, dan dot product dihitung dengan numpy.
+        """
+        get = self.vocab.get
+        analyze = self.analyze
+        cols, counts, ends = [], [], []
+        for doc in docs:
+            for term, count in Counter(analyze(doc)).items():
+                j = get(term)
+                if j is not None:
+                    cols.append(j)
+                    counts.append(count)
+            ends.append(len(cols))
+
+        out = np.zeros(len(docs), dtype=np.float64)
+        if not cols:
+            return out
+        cols = np.asarray(cols, dtype=np.int64)
+        tf = np.ones(len(cols)) if self.binary else np.asarray(counts, dtype=np.float64)
+        if self.sublinear_tf:
+            tf = np.log(tf) + 1.0
+        v = tf * self.idf[cols] if self.idf is not None else tf
+
+        ends = np.asarray(ends, dtype=np.int64)
+        starts = np.concatenate(([0], ends[:-1]))
+        nonempty = ends > starts
+        row = np.repeat(np.arange(len(docs)), ends - starts)
+        dot = np.bincount(row, weights=v * self.weights[cols], minlength=len(docs))
+        if self.norm == "l2":
+            denom = np.sqrt(np.bincount(row, weights=v * v, minlength=len(docs)))
+        elif self.norm == "l1":
+            denom = np.bincount(row, weights=np.abs(v), minlength=len(docs))
+        else:
+            denom = np.ones(len(docs))
+        ok = nonempty & (denom > 0)
+        out[ok] = dot[ok] / denom[ok]
+        return out
+
+class LinearScorer:
+    """
+    Mesin skor ringan untuk pipeline TF-IDF (word + char) + classifier linear.
+
+    Menghasilkan nilai yang sama dengan `pipeline.predict_proba` (selisih hanya pembulatan
+    floating point), tetapi tanpa validasi input sklearn, pembuatan matriks sparse, dan
+    `hstack` FeatureUnion. Untuk tiap vectorizer, n-gram dari analyzer sklearn yang sama
+    dihitung, dicari indeks kolomnya di vocabulary, dibobot tf (sublinear) * idf, dinormalisasi
+    l2, lalu langsung didot-kan dengan potongan `coef_` yang sesuai.
+    """
+
+    def __init__(self, blocks: list[_Block], intercept: float, loss: str, name: str = ""):
+        self.blocks = blocks
+        self.intercept = float(intercept)
+        self.loss = loss
+        self.name = name
+
+    @staticmethod
+    def supports(pipeline) -> bool:
+        """True jika pipeline berbentuk TF-IDF (tanpa bobot FeatureUnion) + classifier linear biner."""
+        vects = _vectorizer_list(pipeline)
+        clf = _classifier(pipeline)
+        if not vects or clf is None or not hasattr(clf, "coef_") or clf.coef_.shape[0] != 1:
+            return False
+        for step in getattr(pipeline, "steps", []):
+            if getattr(step[1], "transformer_weights", None):
+                return False
+        return all(isinstance(v, TfidfVectorizer) and v.analyzer in ("word", "char", "char_wb") for _, v in vects)
+
+    @classmethod
+    def from_pipeline(cls, pipeline, name: str = "") -> "LinearScorer":
+        """
+        Membangun scorer dari pipeline yang sudah di-fit.
+
+        Args:
+            pipeline: Pipeline sklearn (FeatureUnion TfidfVectorizer + classifier linear).
+            name (str): Nama model (informasi saja).
+
+        Returns:
+            LinearScorer: Scorer dengan vocabulary dan idf yang dipakai bersama pipeline.
+        """
+        if not cls.supports(pipeline):
+            raise ValueError("Pipeline tidak didukung LinearScorer")
+        clf = _classifier(pipeline)
+        coef = np.asarray(clf.coef_[0], dtype=np.float64)
+        blocks, offset = [], 0
+        for vname, vect in _vectorizer_list(pipeline):
+            params = vect.get_params()
+            size = len(vect.vocabulary_)
+            idf = vect.idf_ if vect.use_idf else None
+            blocks.append(_Block(vname, params, vect.vocabulary_, idf, coef[offset:offset + size]))
+            offset += size
+        if offset != coef.shape[0]:
+            raise ValueError(f"Jumlah fitur vectorizer ({offset}) tidak sama dengan coef_ ({coef.shape[0]})")
+        loss = getattr(clf, "loss", "log_loss")
+        return cls(blocks, float(np.ravel(clf.intercept_)[0]), loss, name)
+
+    def decision_one(self, doc: str) -> float:
+        """Skor keputusan (setara `decision_function`) untuk satu teks bersih."""
+        z = self.intercept
+        for block in self.blocks:
+            z += block.decision(doc)
+        return z
+
+    def decision_function(self, docs) -> np.ndarray:
+        """Skor keputusan untuk banyak teks; batch kecil memakai jalur per teks."""
+        docs = list(docs)
+        if len(docs) < BATCH_MIN:
+            return np.fromiter((self.decision_one(d) for d in docs), dtype=np.float64, count=len(docs))
+        z = np.full(len(docs), self.intercept)
+        for block in self.blocks:
+            z += block.decision_many(docs)
+        return z
+
+    @property
+    def has_proba(self) -> bool:
+        return self.loss in _PROBA_LOSSES
+
+    def _to_proba(self, z: np.ndarray) -> np.ndarray:
+        if self.loss == "modified_huber":
+            return (np.clip(z, -1.0, 1.0) + 1.0) / 2.0
+        if self.loss == "log_loss":
+            return 1.0 / (1.0 + np.exp(-z))
+        raise AttributeError(f"probability estimates are not available for loss={self.loss!r}")
+
+    def predict_proba(self, docs) -> np.ndarray:
+        """Probabilitas [non-judol, judol] per teks, sama seperti `pipeline.predict_proba`."""
+        p = self._to_proba(self.decision_function(docs))
+        return np.column_stack([1.0 - p, p])
+
+    def proba_positive(self, docs) -> list[float]:
+        """Probabilitas kelas judol saja, sebagai list float."""
+        return self._to_proba(self.decision_function(docs)).tolist()
@@ -1,78 +1,159 @@
 from __future__ import annotations
-from pathlib import Path
-from threading import Lock
-import joblib
+import time
 
-USE_PREPROCESS = True
-BEST_THR = 0.50
-
-_MODEL_PATH = Path(__file__).resolve().parent / "model" / "judol_pipeline_v16.joblib"
+from .cache import get_text_cache, cache_proba_enabled, text_key
+from .brand import get_brand_matcher
+from .explain import get_explainer
+from .registry import get_active_model
+from .shadow import get_shadow
+from .thresholds import DEFAULT_THRESHOLD, get_threshold_policy
+from . import cascade
 
-_lock = Lock()
-_PIPE = None
+USE_PREPROCESS = True
+BEST_THR = DEFAULT_THRESHOLD
 
 if USE_PREPROCESS:
-    from .preprocess import preprocess
+    from .preprocess import preprocess, preprocess_many, PREPROCESS_TAG
+    _CLEAN_TAG = PREPROCESS_TAG
+else:
+    _CLEAN_TAG = "raw"
 
-def _lazy_load():
+def _safe_preprocess(text: str) -> str:
+    """Menjalankan preprocessing; jika gagal, teks mentah dikembalikan apa adanya."""
+    try:
+        return preprocess(text) if USE_PREPROCESS else text
+    except Exception:
+        return text
+
+def _clean_many(texts_by_key: dict, cache) -> dict:
     """
-    Memuat model secara lazy (hanya saat pertama kali dibutuhkan).
-    Menggunakan mekanisme Thread Lock untuk keamanan concurrency.
+    Mengambil teks bersih dari cache, lalu mem-preprocess sisanya dalam satu batch.
+
+    Args:
+        texts_by_key (dict): Peta kunci konten -> teks mentah (sudah unik).
+        cache: Backend cache teks.
+
+    Returns:
+        dict: Peta kunci konten -> teks bersih.
     """
-    global _PIPE
-    if _PIPE is not None:
-        return
-    with _lock:
-        if _PIPE is None:
-            blob = joblib.load(_MODEL_PATH)
-            _PIPE = blob["pipeline"]
+    if not USE_PREPROCESS:
+        return dict(texts_by_key)
 
-def predict_comment(raw_text: str) -> dict:
+    cache_keys = {k: f"clean:{_CLEAN_TAG}:{k}" for k in texts_by_key}
+    hit = cache.get_many(cache_keys.values())
+    cleans = {k: hit[ck] for k, ck in cache_keys.items() if ck in hit}
+
+    missing = [k for k in texts_by_key if k not in cleans]
+    if missing:
+        fresh = preprocess_many([texts_by_key[k] for k in missing])
+        cleans.update(zip(missing, fresh))
+        cache.set_many({cache_keys[k]: cleans[k] for k in missing})
+    return cleans
+
+def predict_comments(raw_texts: list[str], channel_id: str | None = None,
+                     video_id: str | None = None) -> list[dict]:
     """
-    Melakukan prediksi klasifikasi judi online pada teks komentar tunggal.
+    Melakukan prediksi klasifikasi judi online untuk banyak komentar sekaligus.
+    Preprocessing dijalankan paralel lewat `preprocess_many`, lalu semua teks bersih
+    diskor sekaligus lewat `LoadedModel.proba_positive` (LinearScorer, atau satu panggilan
+    `predict_proba` sklearn), sehingga biaya dispatch hanya dibayar sekali. Jika kaskade
+    aktif (JUDOL_CASCADE), kasus yang jelas diputuskan dulu oleh tahap kamus (lihat
+    `cascade.py`) dan hanya sisanya yang diskor model.
+
+    Komentar duplikat (umum pada kampanye spam) hanya diproses sekali, dan teks mentah
+    berbeda yang menghasilkan teks bersih yang sama hanya diskor sekali. Hasil disimpan
+    di cache berbasis hash konten (dan nama model aktif), sehingga teks yang sudah pernah
+    dilihat melewati normalisasi dan penskoran model sepenuhnya. Model aktif diambil
+    sekali per panggilan dari registry, jadi satu batch selalu diskor oleh model yang sama.
+    Jika JUDOL_SHADOW_MODEL diisi, teks bersih yang baru diskor juga dititipkan ke model
+    kandidat di thread latar (lihat `shadow.py`); hasil yang dikembalikan tetap milik produksi.
+
+    Ambang label dan rentang ragu-ragu diambil dari `ThresholdPolicy` (override per video
+    atau channel, lihat `thresholds.py`), sehingga proba yang di-cache tetap bisa dipakai
+    ulang untuk sumber dengan ambang berbeda.
     
     Args:
-        raw_text (str): Teks komentar mentah.
+        raw_texts (list[str]): Daftar teks komentar mentah.
+        channel_id (str | None): Channel asal komentar (untuk override ambang).
+        video_id (str | None): Video asal komentar (untuk override ambang).
         
     Returns:
-        dict: Dictionary berisi:
-            - 'label': 1 (Judi) atau 0 (Non-Judi)
-            - 'proba': Probabilitas kelas positif (Judi)
-            - 'clean': Teks hasil preprocessing
+        list[dict]: Hasil prediksi yang urutannya sejajar dengan input. Setiap item
+        memiliki kunci yang sama dengan `predict_comment` ('label', 'proba', 'clean', 'brands',
+        'unsure').
     """
-    _lazy_load()
-    text = (raw_text or "")
-    try:
-        clean = preprocess(text) if USE_PREPROCESS else text
-    except Exception:
-        clean = text
+    model = get_active_model()
+    matcher = get_brand_matcher()
+    thresholds = get_threshold_policy().for_source(channel_id, video_id)
+    texts = [raw or "" for raw in raw_texts]
+    keys = [text_key(t) for t in texts]
+    unique = {}
+    for k, t in zip(keys, texts):
+        unique.setdefault(k, t)
 
-    if not clean.strip():
-        return {"label": 0, "proba": 0.0, "clean": clean}
+    cache = get_text_cache()
+    use_pred_cache = cache_proba_enabled()
+    pred_tag = f"{model.tag}:{_CLEAN_TAG}:{cascade.CASCADE_MODE}"
+    pred_keys = {k: f"pred:{pred_tag}:{k}" for k in unique}
+
+    preds = {}
+    if use_pred_cache:
+        hit = cache.get_many(pred_keys.values())
+        preds = {k: hit[pk] for k, pk in pred_keys.items() if pk in hit}
 
-    proba = float(_PIPE.predict_proba([clean])[0, 1])
-    label = int(proba >= BEST_THR)
-    return {"label": label, "proba": proba, "clean": clean}
+    pending = {k: t for k, t in unique.items() if k not in preds}
+    if pending:
+        cleans = _clean_many(pending, cache)
+        to_score = list(dict.fromkeys(c for c in cleans.values() if c.strip()))
+        probas, to_score = cascade.split_by_stage(to_score)
+        if to_score:
+            start = time.perf_counter()
+            scored = dict(zip(to_score, model.proba_positive(to_score)))
+            model_ms = (time.perf_counter() - start) * 1000
+            probas.update(scored)
+            # Kandidat hanya dibandingkan pada teks yang benar-benar diskor model produksi.
+            shadow = get_shadow()
+            if shadow is not None:
+                shadow.submit(model, scored, model_ms, thresholds.threshold)
+        for k in pending:
+            preds[k] = (cleans[k], probas.get(cleans[k], 0.0))
+        if use_pred_cache:
+            cache.set_many({pred_keys[k]: preds[k] for k in pending})
 
-def predict_and_explain(raw_text: str) -> dict:
+    brands = {k: matcher.find(preds[k][0]) for k in unique}
+
+    results = []
+    for k in keys:
+        clean, proba = preds[k]
+        scored = bool(clean.strip())
+        results.append({
+            "label": thresholds.label(proba) if scored else 0,
+            "proba": proba,
+            "clean": clean,
+            "brands": list(brands[k]),
+            "unsure": scored and thresholds.is_unsure(proba),
+        })
+    return results
+
+def predict_comment(raw_text: str) -> dict:
     """
-    Melakukan prediksi teks dan mengembalikan detail koefisien fitur yang berpengaruh (Explainability).
-    Berguna untuk menampilkan alasan di balik keputusan model kepada pengguna.
+    Melakukan prediksi klasifikasi judi online pada teks komentar tunggal.
     
     Args:
         raw_text (str): Teks komentar mentah.
         
     Returns:
-        dict: Dictionary lengkap berisi detail prediksi, probabilitas, dan daftar fitur (token)
-              beserta kontribusinya (TF-IDF * Koefisien).
+        dict: Dictionary berisi:
+            - 'label': 1 (Judi) atau 0 (Non-Judi)
+            - 'proba': Probabilitas kelas positif (Judi)
+            - 'clean': Teks hasil preprocessing
+            - 'brands': Brand/istilah judi online yang terdeteksi di teks bersih
+            - 'unsure': True jika proba berada di rentang ragu-ragu
     """
-    _lazy_load()
-    text = (raw_text or "")
-    try:
-        clean = preprocess(text) if USE_PREPROCESS else text
-    except Exception:
-        clean = text
+    return predict_comments([raw_text])[0]
 
+def _explain_result(text: str, clean: str, proba: float, features: list, model_name: str,
+                    thresholds) -> dict:
     if not clean.strip():
         return {
             "text": text,
@@ -82,72 +163,80 @@ def predict_and_explain(raw_text: str) -> dict:
             "proba": 0.0,
             "proba_judol_pct": 0.0,
             "proba_non_pct": 100.0,
-            "features": []
+            "features": [],
+            "model": model_name,
         }
-
-    probs = _PIPE.predict_proba([clean])[0]  
-    prediction = 1 if probs[1] >= BEST_THR else 0
-    
-    vect = None
-    clf = None
-    
-    for name, step in _PIPE.named_steps.items():
-        if "tfidf" in name.lower() or "vect" in name.lower():
-            vect = step
-        if "clf" in name.lower() or "svm" in name.lower() or "log" in name.lower() or "saga" in name.lower():
-            clf = step
-            
-    if vect is None or clf is None:
-        for name, step in _PIPE.named_steps.items():
-            if hasattr(step, "transform") and hasattr(step, "get_feature_names_out") and vect is None:
-                vect = step
-            if hasattr(step, "coef_") and clf is None:
-                clf = step
-
-    active_features = []
-    
-    if vect and clf:
-        try:
-            text_tfidf = vect.transform([clean])
-            
-            feature_names = vect.get_feature_names_out()
-            coefs = clf.coef_[0]
-            
-            row_indices = text_tfidf.nonzero()[1]
-            
-            for idx in row_indices:
-                feat_name = feature_names[idx]
-                tfidf_val = text_tfidf[0, idx]
-                
-                if idx < len(coefs):
-                    coeff_val = coefs[idx]
-                    contribution = tfidf_val * coeff_val
-                    
-                    if "char__" in feat_name:
-                         continue
-
-                    display_name = feat_name.replace("word__", "")
-
-                    active_features.append({
-                        "feature": display_name,
-                        "tfidf": float(tfidf_val),
-                        "coefficient": float(coeff_val),
-                        "contribution": float(contribution)
-                    })
-            
-            active_features.sort(key=lambda x: abs(x["contribution"]), reverse=True)
-            
-        except Exception as e:
-            print(f"Error extracting features: {e}")
-            pass
-
+    prediction = thresholds.label(proba)
     return {
         "text": text,
         "clean": clean,
         "label": prediction,
         "label_desc": "JUDOL" if prediction == 1 else "NON-JUDOL",
-        "proba_judol": float(probs[1]),
-        "proba_non": float(probs[0]),
-        "proba_judol_pct": float(probs[1]) * 100,
-        "features": active_features
+        "proba_judol": float(proba),
+        "proba_non": 1.0 - float(proba),
+        "proba_judol_pct": float(proba) * 100,
+        "features": features,
+        "model": model_name,
+        "unsure": thresholds.is_unsure(proba),
     }
+
+def explain_comments(raw_texts: list[str], channel_id: str | None = None,
+                     video_id: str | None = None) -> list[dict]:
+    """
+    Versi batch dari `predict_and_explain`: semua komentar di-preprocess (memakai cache teks
+    bersih), diskor, dan dijelaskan sekaligus. Nama fitur dan koefisien diambil dari
+    `ModelExplainer` yang di-cache per model, dan kontribusi dihitung dari satu matriks
+    sparse untuk seluruh batch.
+
+    Label dan proba mengikuti jalur yang sama dengan `predict_comments` (tahap kaskade lalu
+    model, ambang dari `ThresholdPolicy` untuk sumbernya), sehingga modal detail sama dengan
+    baris tabel untuk komentar yang sama.
+
+    Args:
+        raw_texts (list[str]): Daftar teks komentar mentah.
+        channel_id (str | None): Channel asal komentar (untuk override ambang).
+        video_id (str | None): Video asal komentar (untuk override ambang).
+
+    Returns:
+        list[dict]: Hasil yang urutannya sejajar dengan input, dengan kunci yang sama
+        seperti `predict_and_explain`.
+    """
+    model = get_active_model()
+    thresholds = get_threshold_policy().for_source(channel_id, video_id)
+    texts = [raw or "" for raw in raw_texts]
+    keys = [text_key(t) for t in texts]
+    try:
+        cleans_by_key = _clean_many(dict(zip(keys, texts)), get_text_cache())
+        cleans = [cleans_by_key[k] for k in keys]
+    except Exception:
+        cleans = [_safe_preprocess(t) for t in texts]
+
+    unique = list(dict.fromkeys(c for c in cleans if c.strip()))
+    probas, features = {}, {}
+    if unique:
+        probas, to_score = cascade.split_by_stage(unique)
+        if to_score:
+            probas.update(zip(to_score, model.proba_positive(to_score)))
+        features = dict(zip(unique, get_explainer(model).explain_many(unique)))
+
+    return [
+        _explain_result(t, c, probas.get(c, 0.0), [dict(f) for f in features.get(c, [])], model.name,
+                        thresholds)
+        for t, c in zip(texts, cleans)
+    ]
+
+def predict_and_explain(raw_text: str, channel_id: str | None = None, video_id: str | None = None) -> dict:
+    """
+    Melakukan prediksi teks dan mengembalikan detail koefisien fitur yang berpengaruh (Explainability).
+    Berguna untuk menampilkan alasan di balik keputusan model kepada pengguna.
+    
+    Args:
+        raw_text (str): Teks komentar mentah.
+        channel_id (str | None): Channel asal komentar (untuk override ambang).
+        video_id (str | None): Video asal komentar (untuk override ambang).
+        
+    Returns:
+        dict: Dictionary lengkap berisi detail prediksi, probabilitas, dan daftar fitur (token)
+              beserta kontribusinya (TF-IDF * Koefisien).
+    """
+    return explain_comments([raw_text], channel_id=channel_id, video_id=video_id)[0]
@@ -1,9 +1,21 @@
+import os
 import re
+import sys
+import atexit
+import multiprocessing
 import unicodedata
-import difflib
+from threading import Lock
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Optional
 from unidecode import unidecode
 from functools import lru_cache
+from types import MappingProxyType
+
+from .fuzzy import DomainMatcher
+from .brand import load_brand_terms
+from .lexicon import get_lexicon
+from .asset.kamus.kamus_emoji import EMOJI_MAP, UNICODE_VERSION as EMOJI_MAP_UNICODE_VERSION
 
 _RE_DASHES = re.compile(r"[\u2010\u2011\u2012\u2013\u2014\u2015\u2212]")
 _RE_APOS = re.compile(r"[\u2018\u2019\u02BC]")
@@ -20,6 +32,39 @@ COEN = "\u20E3"
 HARD_SEPARATORS = r"/|\\:;~_.,\-!()\[\]{}<>=+\"'"
 VOWELS = set("aiueo")
 
+def default_workers(cpus: Optional[int] = None) -> int:
+    """
+    Jumlah worker pool preprocessing bawaan. Perintah offline memakai semua core. Di bawah
+    gunicorn core dibagi rata antar worker web (WEB_CONCURRENCY, sumber jumlah worker bawaan
+    gunicorn), sehingga total proses tetap sekitar satu per core dan scan channel besar tetap
+    memakai beberapa core; hasil 1 berarti serial.
+
+    Args:
+        cpus (int, optional): Jumlah core (default os.cpu_count()).
+
+    Returns:
+        int: Jumlah worker process.
+    """
+    cpus = cpus or os.cpu_count() or 1
+    if "gunicorn" not in sys.modules:
+        return cpus
+    try:
+        web_workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    except ValueError:
+        web_workers = 1
+    return max(1, cpus // max(1, web_workers))
+
+# Pool hanya dibuat saat batch pertama >= PARALLEL_MIN_BATCH; batch kecil selalu serial.
+PREPROCESS_WORKERS = int(os.getenv("PREPROCESS_WORKERS", "0")) or default_workers()
+PARALLEL_MIN_BATCH = 256
+PARALLEL_MIN_CHUNK = 64
+
+# Tahap normalisasi bahasa alay/gaul (kamus_alay + lexicon_alay) di normalize_plesetan.
+# Default mati karena model produksi dilatih tanpa tahap ini; ukur dulu dengan
+# `python manage.py bench_slang` sebelum menyalakannya (PREPROCESS_SLANG=1).
+USE_SLANG = os.getenv("PREPROCESS_SLANG", "0") == "1"
+SLANG_SOURCES = ("kamus_alay", "lexicon_alay")
+
 LEET_MAP_TABLE = {
     '0': 'o', '1': 'i', '3': 'e', '4': 'a', 
     '6': 'g', '5': 's', '@': 'a', '9': 'g'
@@ -322,35 +367,42 @@ def _emoji_digit_word_to_int(name: str) -> Optional[int]:
             return words_to_num.get(parts[i+1])
     return None
 
-def emoji_letter_digit_to_ascii(s: str) -> str:
-    """Mengonversi emoji huruf dan angka menjadi karakter ASCII yang setara."""
-    out = []
-    for ch in s:
+def emoji_char_to_ascii(ch: str) -> str:
+    """
+    Aturan dasar per karakter berbasis nama Unicode (DAGGER, REGIONAL INDICATOR, SQUARED,
+    KEYCAP, nilai numerik). Dipakai untuk membangkitkan EMOJI_MAP, bukan di jalur utama.
+    """
+    try:
+        name = unicodedata.name(ch)
+    except ValueError:
+        return ch
+
+    if "DAGGER" in name:
+        return "t"
+    elif "REGIONAL INDICATOR SYMBOL LETTER" in name:
+        return name.split()[-1]
+    elif "LATIN CAPITAL LETTER" in name and any(x in name for x in ["SQUARED", "CIRCLED", "NEGATIVE CIRCLED", "BUTTON"]):
+        return name.split()[-1]
+    elif "KEYCAP" in name and "DIGIT" in name:
+        n = _emoji_digit_word_to_int(name)
+        return str(n) if n is not None else ch
+    else:
         try:
-            name = unicodedata.name(ch)
-        except ValueError:
-            out.append(ch)
-            continue
+            val = unicodedata.numeric(ch)
+            if float(val).is_integer() and 0 <= int(val) <= 9:
+                return str(int(val))
+        except Exception:
+            pass
+        return ch
 
-        if "DAGGER" in name:
-            out.append("t")
-        elif "REGIONAL INDICATOR SYMBOL LETTER" in name:
-            out.append(name.split()[-1])
-        elif "LATIN CAPITAL LETTER" in name and any(x in name for x in ["SQUARED", "CIRCLED", "NEGATIVE CIRCLED", "BUTTON"]):
-            out.append(name.split()[-1])
-        elif "KEYCAP" in name and "DIGIT" in name:
-            n = _emoji_digit_word_to_int(name)
-            out.append(str(n) if n is not None else ch)
-        else:
-            try:
-                val = unicodedata.numeric(ch)
-                if float(val).is_integer() and 0 <= int(val) <= 9:
-                    out.append(str(int(val)))
-                    continue
-            except Exception:
-                pass
-            out.append(ch)
-    return "".join(out)
+def emoji_letter_digit_to_ascii(s: str) -> str:
+    """
+    Mengonversi emoji huruf dan angka menjadi karakter ASCII yang setara.
+    Memakai tabel EMOJI_MAP hasil generate; input ASCII murni langsung dikembalikan.
+    """
+    if s.isascii():
+        return s
+    return s.translate(EMOJI_MAP)
 
 def normalize_emoji_text(s: str) -> str:
     """Normalisasi teks yang mengandung emoji, mengubahnya menjadi bentuk ASCII jika memungkinkan."""
@@ -389,6 +441,112 @@ def safe_unidecode(text: str) -> str:
         out.append(unidecode(ch) if ch.isalpha() or ch.isdigit() else ch)
     return "".join(out)
 
+class _LazyCharTable(dict):
+    """
+    Tabel translasi code point -> pengganti untuk `str.translate`.
+    Entri yang belum ada dihitung sekali lewat `rule` lalu disimpan (memoized),
+    sehingga setiap karakter unik hanya melewati logika Python satu kali.
+    """
+
+    def __init__(self, rule, seed=()):
+        super().__init__()
+        self.rule = rule
+        for ch in seed:
+            self[ord(ch)] = rule(ch)
+
+    def __missing__(self, cp: int):
+        value = self.rule(chr(cp))
+        if len(self) < _CHAR_TABLE_MAX:
+            self[cp] = value
+        return value
+
+_CHAR_TABLE_MAX = 200_000
+_TABLE_SEED = [chr(cp) for cp in range(0x250)] + list(HOMO_MAP)
+
+def _decompose_rule(ch: str):
+    """Aturan per karakter: hapus selector, emoji huruf/angka -> ASCII, NFKD, buang tanda Mn."""
+    if ch in (VS16, COEN):
+        return None
+    text = unicodedata.normalize("NFKD", emoji_letter_digit_to_ascii(ch))
+    return "".join(c for c in text if unicodedata.category(c) != "Mn")
+
+def _fold_rule(ch: str) -> str:
+    """Aturan per karakter setelah NFKC: ganti homoglyph lalu normalisasi tanda baca."""
+    return normalize_punct(ch.translate(_HOMO_TRANS))
+
+def _ascii_fold_rule(ch: str):
+    """Aturan per karakter: buang simbol/kontrol, unidecode huruf/angka, lalu lowercase."""
+    if unicodedata.category(ch).startswith(('S', 'C')):
+        return None
+    return safe_unidecode(ch).lower()
+
+_DECOMPOSE_TABLE = _LazyCharTable(_decompose_rule, _TABLE_SEED)
+_FOLD_TABLE = _LazyCharTable(_fold_rule, _TABLE_SEED)
+_ASCII_FOLD_TABLE = _LazyCharTable(_ascii_fold_rule, _TABLE_SEED)
+
+# Tanda gabung (combining) non-Mn dengan combining class != 0. Bila muncul, urutan kanonik
+# hasil NFKD satu string bisa berbeda dari dekomposisi per karakter, jadi dipakai jalur lama.
+_RE_REORDER_RISK = re.compile("[%s]" % "".join(
+    re.escape(chr(cp)) for cp in range(0x20000)
+    if not 0xD800 <= cp <= 0xDFFF
+    and unicodedata.combining(chr(cp)) and unicodedata.category(chr(cp)) != "Mn"
+))
+
+_ASCII_HOMO_TRANS = str.maketrans({k: v for k, v in HOMO_MAP.items() if k.isascii()})
+_ASCII_FOLD_TRANS = str.maketrans({
+    chr(cp): None for cp in range(128) if unicodedata.category(chr(cp)).startswith(('S', 'C'))
+})
+
+_path_lock = Lock()
+_PATH_COUNTS = {"ascii": 0, "unicode": 0}
+
+def _record_paths(ascii_count: int, unicode_count: int):
+    """Menambah penghitung jalur preprocess (ASCII cepat vs Unicode penuh)."""
+    with _path_lock:
+        _PATH_COUNTS["ascii"] += ascii_count
+        _PATH_COUNTS["unicode"] += unicode_count
+
+def get_preprocess_stats() -> dict:
+    """
+    Statistik jalur preprocess di proses ini (termasuk hasil dari worker preprocess_many).
+
+    Returns:
+        dict: {'ascii': int, 'unicode': int, 'total': int, 'ascii_ratio': float}
+    """
+    with _path_lock:
+        ascii_count, unicode_count = _PATH_COUNTS["ascii"], _PATH_COUNTS["unicode"]
+    total = ascii_count + unicode_count
+    return {
+        "ascii": ascii_count,
+        "unicode": unicode_count,
+        "total": total,
+        "ascii_ratio": ascii_count / total if total else 0.0,
+    }
+
+def reset_preprocess_stats():
+    """Mereset penghitung jalur preprocess."""
+    with _path_lock:
+        _PATH_COUNTS["ascii"] = _PATH_COUNTS["unicode"] = 0
+
+def normalize_unicode_fast(text: str) -> str:
+    """
+    Tahap normalisasi terkompilasi, setara dengan
+    `normalize_punct(normalize_chars(normalize_emoji_text(text)))`.
+    Memakai dua `str.translate` berbasis tabel dan satu NFKC di level C,
+    alih-alih beberapa loop Python per karakter.
+    """
+    if _RE_REORDER_RISK.search(text):
+        return normalize_punct(normalize_chars(normalize_emoji_text(text)))
+    text = unicodedata.normalize("NFKC", text.translate(_DECOMPOSE_TABLE))
+    return text.translate(_FOLD_TABLE)
+
+def fold_to_ascii(text: str) -> str:
+    """
+    Tahap terkompilasi yang setara dengan `safe_unidecode(strip_symbol_chars(text)).lower()`,
+    dijalankan dengan satu `str.translate`.
+    """
+    return text.translate(_ASCII_FOLD_TABLE)
+
 def remove_urls_mentions_hashtags(text: str) -> str:
     """Menghapus URL dan mention pengguna dari teks."""
     text = _RE_URLS.sub(" ", text)
@@ -481,14 +639,24 @@ def map_chars(tok: str) -> str:
         i += 1
     return ''.join(out)
 
-@lru_cache(maxsize=1024)
-def _find_best_match(letters_only: str) -> tuple:
-    best, best_ratio = None, 0.0
-    for cand in DOMAIN_WORDS:
-        r = difflib.SequenceMatcher(None, letters_only, cand).ratio()
-        if r > best_ratio:
-            best, best_ratio = cand, r
-    return best, best_ratio
+def _domain_vocabulary() -> list[str]:
+    """
+    Kosakata pencocokan fuzzy: DOMAIN_WORDS ditambah brand/istilah dari kamus brand.
+
+    Istilah yang mengandung angka (mis. "aero88") dilewati karena query hanya berisi huruf.
+
+    Returns:
+        list[str]: DOMAIN_WORDS (urut abjad) lalu istilah kamus sesuai urutan file.
+    """
+    words = sorted(DOMAIN_WORDS)
+    words += [t for t, _ in load_brand_terms() if t.isascii() and t.isalpha() and t not in DOMAIN_WORDS]
+    return words
+
+_DOMAIN_MATCHER = DomainMatcher(_domain_vocabulary())
+
+@lru_cache(maxsize=8192)
+def _find_best_match(letters_only: str, cutoff: float) -> tuple:
+    return _DOMAIN_MATCHER.best_match(letters_only, cutoff)
 
 def fix_infix_digits_with_domain(tok: str, thr: float = 0.80) -> str:
     """Memperbaiki kata yang mengandung angka di tengah menggunakan pencocokan fuzzy domain."""
@@ -500,7 +668,7 @@ def fix_infix_digits_with_domain(tok: str, thr: float = 0.80) -> str:
     if len(letters_only) < 3:
         return tok
 
-    best, best_ratio = _find_best_match(letters_only)
+    best, best_ratio = _find_best_match(letters_only, thr)
 
     if best and best_ratio >= thr:
         if letters_only[0] == best[0] or letters_only[-2:] == best[-2:]:
@@ -521,8 +689,59 @@ def squeeze_repeats(token: str, max_repeat: int = 2) -> str:
             out.append(ch)
     return ''.join(out)
 
-def normalize_plesetan(tokens: List[str]) -> List[str]:
-    """Melakukan normalisasi kata-kata plesetan atau bahasa gaul dalam list token."""
+_RE_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+def build_slang_map(sources=SLANG_SOURCES) -> MappingProxyType:
+    """
+    Menggabungkan kamus alay menjadi satu peta token -> bentuk baku yang beku (read-only).
+
+    Sumber dibaca dari leksikon terkompilasi (lihat `deteksi.ml.lexicon`); sumber yang
+    lebih akhir menimpa yang lebih awal. Entri disanitasi agar cocok dengan token hasil
+    preprocess: kunci yang mengandung karakter selain a-z0-9 dibuang (tidak mungkin muncul
+    sebagai token), huruf berulang diringkas seperti `squeeze_repeats`, nilai diubah ke
+    huruf kecil dengan simbol menjadi spasi, dan entri identitas dibuang. Kunci yang sudah
+    ditangani SUBS, kosakata domain, atau kamus brand judi juga dibuang agar sinyal judi
+    tidak hilang (misal "bet" tidak diubah menjadi "banget").
+
+    Args:
+        sources (tuple[str]): Nama leksikon sumber, urut dari prioritas terendah.
+
+    Returns:
+        MappingProxyType: Peta token -> pengganti (bisa berisi spasi untuk multi-kata).
+    """
+    protected = set(SUBS) | set(SUBS.values()) | DOMAIN_WORDS | {t for t, _ in load_brand_terms()}
+    merged = {}
+    for name in sources:
+        for key, value in get_lexicon(name).items():
+            key = key.strip().lower()
+            if not key or _RE_NON_ALNUM.search(key):
+                continue
+            key = squeeze_repeats(key)
+            value = " ".join(_RE_NON_ALNUM.sub(" ", value.lower()).split())
+            if key in protected or not value or value == key:
+                continue
+            merged[key] = value
+    return MappingProxyType(merged)
+
+SLANG_MAP = build_slang_map() if USE_SLANG else MappingProxyType({})
+
+# Penanda varian preprocessing, dipakai sebagai bagian kunci cache teks bersih.
+PREPROCESS_TAG = "slang" if USE_SLANG else "base"
+
+def normalize_plesetan(tokens: List[str], slang: Optional[MappingProxyType] = None) -> List[str]:
+    """
+    Melakukan normalisasi kata-kata plesetan atau bahasa gaul dalam list token.
+
+    Args:
+        tokens (list[str]): Token hasil tokenisasi.
+        slang (MappingProxyType | None): Peta bahasa alay; default SLANG_MAP (kosong jika
+            USE_SLANG mati). Biayanya satu lookup hash per token.
+
+    Returns:
+        list[str]: Token yang sudah dinormalisasi.
+    """
+    slang = SLANG_MAP if slang is None else slang
+    slang_get = slang.get if slang else None
     out = []
     for t in tokens:
         t = t.lower()
@@ -544,6 +763,8 @@ def normalize_plesetan(tokens: List[str]) -> List[str]:
         t = squeeze_repeats(t)        
         t = fix_infix_digits_with_domain(t)
         t = SUBS.get(t, t)             
+        if slang_get is not None:
+            t = slang_get(t, t)
         
         out.append(t)
     return out
@@ -567,18 +788,25 @@ def preprocess(text: str) -> str:
     if not isinstance(text, str) or not text:
         return ""
 
-    text = normalize_emoji_text(text)
-    text = normalize_chars(text)    
-    text = normalize_punct(text)
+    is_ascii = text.isascii()
+    _record_paths(int(is_ascii), int(not is_ascii))
+
+    # Jalur cepat ASCII: emoji, NFKD/NFKC, tanda baca Unicode, dan unidecode tidak
+    # mengubah apa pun, jadi cukup homoglyph ASCII, hapus simbol/kontrol, dan lowercase.
+    if is_ascii:
+        text = text.translate(_ASCII_HOMO_TRANS)
+    else:
+        text = normalize_unicode_fast(text)
     
     text = remove_urls_mentions_hashtags(text)
     text = remove_timestamps(text)
     text = remove_bracket(text)
     
     text = handle_intraword_symbols(text)
-    text = strip_symbol_chars(text)
-    text = safe_unidecode(text)
-    text = text.lower()
+    if is_ascii:
+        text = text.translate(_ASCII_FOLD_TRANS).lower()
+    else:
+        text = fold_to_ascii(text)
     
     text = keep_alnum_and_space(text)
     text = squeeze_spaces(text)
@@ -589,4 +817,87 @@ def preprocess(text: str) -> str:
     # tokens = remove_stopwords_fast(tokens, STOPWORDS_ID)  
 
     final_text = " ".join(tokens)
-    return final_text
\ No newline at end of file
+    return final_text
+
+def _preprocess_or_raw(text: str) -> str:
+    """Menjalankan preprocess; jika gagal, teks mentah dikembalikan apa adanya."""
+    try:
+        return preprocess(text)
+    except Exception:
+        return text if isinstance(text, str) else ""
+
+def _preprocess_chunk(texts: List[str]) -> List[str]:
+    """Memproses satu potongan (chunk) teks secara serial."""
+    return [_preprocess_or_raw(t) for t in texts]
+
+def _preprocess_chunk_counted(texts: List[str]) -> tuple:
+    """Versi untuk worker process: ikut mengembalikan selisih penghitung jalur ASCII/Unicode."""
+    before = dict(_PATH_COUNTS)
+    out = _preprocess_chunk(texts)
+    return out, _PATH_COUNTS["ascii"] - before["ascii"], _PATH_COUNTS["unicode"] - before["unicode"]
+
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+_pool_lock = Lock()
+_POOL = None
+_POOL_WORKERS = 0
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Mengembalikan process pool yang sudah hangat (warm) agar bisa dipakai ulang antar request.
+    Pool dibuat ulang hanya jika jumlah worker yang diminta berubah.
+
+    Proses pool dibuat dengan konteks "forkserver" (atau "spawn"), bukan fork dari proses
+    pemanggil yang mungkin sudah punya thread (request, swap model, shadow) dan lock terkunci.
+    """
+    global _POOL, _POOL_WORKERS
+    with _pool_lock:
+        if _POOL is None or _POOL_WORKERS != workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(_START_METHOD))
+            _POOL_WORKERS = workers
+        return _POOL
+
+def _reset_pool():
+    """Mematikan process pool (misalnya saat pool rusak atau proses berakhir)."""
+    global _POOL, _POOL_WORKERS
+    with _pool_lock:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL, _POOL_WORKERS = None, 0
+
+atexit.register(_reset_pool)
+
+def preprocess_many(texts: List[str], workers: Optional[int] = None) -> List[str]:
+    """
+    Menjalankan preprocess untuk banyak teks sekaligus menggunakan process pool.
+    
+    Teks dibagi menjadi beberapa chunk dan diproses paralel, urutan hasil tetap sama
+    dengan input. Batch kecil (di bawah PARALLEL_MIN_BATCH) atau workers <= 1 diproses
+    secara serial karena overhead antar-proses lebih besar dari manfaatnya.
+    Teks yang gagal diproses dikembalikan dalam bentuk mentah.
+    
+    Args:
+        texts (List[str]): Daftar teks mentah.
+        workers (int, optional): Jumlah worker process. Default PREPROCESS_WORKERS.
+        
+    Returns:
+        List[str]: Daftar teks hasil preprocessing, sejajar dengan input.
+    """
+    texts = list(texts)
+    workers = PREPROCESS_WORKERS if workers is None else workers
+    if workers <= 1 or len(texts) < PARALLEL_MIN_BATCH:
+        return _preprocess_chunk(texts)
+
+    chunk_size = max(PARALLEL_MIN_CHUNK, -(-len(texts) // (workers * 4)))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    try:
+        pool = _get_pool(workers)
+        out = []
+        for part, ascii_count, unicode_count in pool.map(_preprocess_chunk_counted, chunks):
+            out.extend(part)
+            _record_paths(ascii_count, unicode_count)
+        return out
+    except (BrokenProcessPool, RuntimeError):
+        _reset_pool()
+        return _preprocess_chunk(texts)
@@ -0,0 +1,369 @@
+from __future__ import annotations
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock, Thread
+from types import MappingProxyType
+
+import joblib
+
+from .lexicon import publish_mode
+
+MODEL_DIR = Path(__file__).resolve().parent / "model"
+MODEL_PREFIX = "judol_pipeline_"
+DEFAULT_MODEL = "v16"
+
+# Urutan penentuan model aktif: env JUDOL_MODEL, lalu isi file penunjuk (diubah dengan
+# `python manage.py switch_model`), lalu DEFAULT_MODEL.
+ACTIVE_POINTER = Path(os.environ.get("JUDOL_MODEL_POINTER", MODEL_DIR / "ACTIVE"))
+POINTER_POLL_SECONDS = float(os.environ.get("JUDOL_MODEL_POLL_SECONDS", 5))
+
+# Jika aktif, model dimuat dari ekspor mmap (lihat shared_model.py) sehingga vocabulary dan
+# koefisien dibagi antar worker lewat page cache. Ekspor dibuat otomatis bila belum ada/usang.
+SHARED_MODELS = os.environ.get("JUDOL_SHARED_MODEL", "0") == "1"
+
+# Jika aktif, penskoran memakai LinearScorer (lihat linear_scorer.py) bila pipeline didukung;
+# hasilnya sama dengan predict_proba sklearn hingga pembulatan floating point.
+LINEAR_SCORER = os.environ.get("JUDOL_LINEAR_SCORER", "1") == "1"
+
+# Jika aktif dan ada tabel kalibrasi untuk model (lihat calibration.py, `calibrate_model`),
+# proba yang dikembalikan adalah proba terkalibrasi. Mati secara bawaan: tabel hanya layak
+# dipakai bila di-fit pada data held-out, dan ambang BEST_THR disetel untuk proba mentah.
+CALIBRATION = os.environ.get("JUDOL_CALIBRATION", "0") == "1"
+
+@dataclass(frozen=True)
+class ModelInfo:
+    """Informasi file model tanpa memuatnya."""
+    name: str
+    path: Path
+    size_bytes: int
+    modified: float
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """
+    Model yang sudah dimuat dan tidak berubah lagi. Pemanggil cukup mengambil satu
+    referensi per request/batch; penggantian model aktif tidak memengaruhi objek ini.
+    """
+    name: str
+    path: Path
+    pipeline: object = field(repr=False)
+    meta: MappingProxyType = field(repr=False)
+    load_seconds: float = 0.0
+    scorer: object = field(default=None, repr=False)
+    calibration: object = field(default=None, repr=False)
+
+    @property
+    def tag(self) -> str:
+        """Penanda model untuk kunci cache (nama file tanpa ekstensi, plus tabel kalibrasi)."""
+        if self.calibration is not None:
+            return f"{self.path.stem}+cal{self.calibration.digest}"
+        return self.path.stem
+
+    def raw_scores(self, texts: list[str]):
+        """
+        Skor mentah model tanpa kalibrasi: proba judol jika classifier mendukungnya,
+        jika tidak (misal SGD hinge) nilai `decision_function`.
+        """
+        if self.scorer is not None:
+            return self.scorer.proba_positive(texts) if self.scorer.has_proba else self.scorer.decision_function(texts)
+        if hasattr(self.pipeline, "predict_proba"):
+            return self.pipeline.predict_proba(texts)[:, 1].tolist()
+        return self.pipeline.decision_function(texts)
+
+    def proba_positive(self, texts: list[str]) -> list[float]:
+        """
+        Probabilitas kelas judol untuk daftar teks bersih. Memakai LinearScorer jika
+        tersedia, jika tidak `pipeline.predict_proba`. Jika model punya tabel kalibrasi,
+        skor mentah dipetakan lewat interpolasi tabel tersebut.
+        """
+        if self.calibration is not None:
+            return self.calibration(self.raw_scores(texts)).tolist()
+        if self.scorer is not None and self.scorer.has_proba:
+            return self.scorer.proba_positive(texts)
+        return self.pipeline.predict_proba(texts)[:, 1].tolist()
+
+def _version_key(name: str):
+    """Kunci pengurutan alami: v2 < v10, lalu sufiks."""
+    m = re.match(r"v(\d+)(.*)", name)
+    return (int(m.group(1)), m.group(2)) if m else (float("inf"), name)
+
+def _read_joblib(path: Path):
+    """Membaca blob joblib; mengembalikan (pipeline, metadata lain)."""
+    blob = joblib.load(path)
+    if isinstance(blob, dict):
+        meta = {k: v for k, v in blob.items() if k != "pipeline"}
+        if "compact" in meta:
+            from .compact import restore_compact
+            return restore_compact(blob["pipeline"], meta), meta
+        return blob["pipeline"], meta
+    return blob, {}
+
+def save_model_blob(blob: dict, name: str, model_dir: Path | str = MODEL_DIR) -> Path:
+    """
+    Menyimpan blob model ({"pipeline", "version", "notes", "env", ...}) sebagai
+    `judol_pipeline_<name>.joblib` secara atomik (file sementara + `os.replace`), sehingga
+    worker yang sedang memuat tidak pernah membaca file setengah jadi.
+    """
+    model_dir = Path(model_dir)
+    path = model_dir / f"{MODEL_PREFIX}{name}.joblib"
+    fd, tmp = tempfile.mkstemp(dir=model_dir, prefix=path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(blob, tmp, compress=3)
+        publish_mode(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+def describe_pipeline(pipeline) -> dict:
+    """
+    Merangkum isi pipeline (vectorizer dan classifier) untuk ditampilkan di daftar model.
+
+    Args:
+        pipeline: Pipeline sklearn hasil `joblib.load`.
+
+    Returns:
+        dict: Nama classifier, jumlah fitur, dan parameter tiap vectorizer.
+    """
+    steps = dict(getattr(pipeline, "named_steps", {}))
+    clf = steps.get("clf") or next((s for s in steps.values() if hasattr(s, "coef_")), None)
+    features = steps.get("features")
+    vectorizers = getattr(features, "transformer_list", None) or [
+        (n, s) for n, s in steps.items() if hasattr(s, "vocabulary_")
+    ]
+    info = {
+        "classifier": type(clf).__name__ if clf is not None else None,
+        "loss": getattr(clf, "loss", None),
+        "n_features": int(clf.coef_.shape[1]) if hasattr(clf, "coef_") else None,
+        "vectorizers": {},
+    }
+    for name, vect in vectorizers:
+        n_hashed = None
+        if hasattr(vect, "steps"):
+            # Blok hashing (lihat hashing.py): HashingVectorizer + TfidfTransformer.
+            vect = vect.steps[0][1]
+            n_hashed = getattr(vect, "n_features", None)
+        info["vectorizers"][name] = {
+            "analyzer": getattr(vect, "analyzer", None),
+            "ngram_range": list(getattr(vect, "ngram_range", ()) or ()),
+            "vocabulary": len(getattr(vect, "vocabulary_", {}) or {}),
+            "sublinear_tf": getattr(vect, "sublinear_tf", None),
+            "hashed_features": n_hashed,
+        }
+    return info
+
+class ModelRegistry:
+    """
+    Daftar pipeline di `deteksi/ml/model/` beserta model aktif yang bisa ditukar tanpa restart.
+
+    `active()` tidak pernah mengunci di jalur normal: ia hanya membaca satu atribut.
+    Perubahan file penunjuk diperiksa paling sering sekali per `poll_interval`; jika model
+    aktif berganti, model baru dimuat di thread latar lalu referensinya ditukar, sementara
+    request yang sedang berjalan tetap memakai model lama. Hanya pemuatan pertama (worker
+    yang belum di-preload) yang menunggu.
+    """
+
+    def __init__(self, model_dir: Path | str = MODEL_DIR, pointer: Path | str = ACTIVE_POINTER,
+                 poll_interval: float = POINTER_POLL_SECONDS, shared: bool = SHARED_MODELS,
+                 linear_scorer: bool = LINEAR_SCORER, calibration: bool = CALIBRATION):
+        self.model_dir = Path(model_dir)
+        self.pointer = Path(pointer)
+        self.poll_interval = poll_interval
+        self.shared = shared
+        self.linear_scorer = linear_scorer
+        self.calibration = calibration
+        self._active = None
+        self._next_check = 0.0
+        self._pointer_sig = None
+        self._swapping = False
+        self._load_lock = Lock()
+        self._swap_lock = Lock()
+
+    def path_for(self, name: str) -> Path:
+        return self.model_dir / f"{MODEL_PREFIX}{name}.joblib"
+
+    def available(self) -> list[ModelInfo]:
+        """
+        Daftar model yang tersedia (tanpa memuat file), urut versi.
+
+        Returns:
+            list[ModelInfo]: Nama versi, lokasi, ukuran, dan waktu modifikasi.
+        """
+        infos = []
+        for path in self.model_dir.glob(f"{MODEL_PREFIX}*.joblib"):
+            st = path.stat()
+            name = path.stem[len(MODEL_PREFIX):]
+            infos.append(ModelInfo(name, path, st.st_size, st.st_mtime))
+        return sorted(infos, key=lambda i: _version_key(i.name))
+
+    def load(self, name: str) -> LoadedModel:
+        """
+        Memuat satu versi model dari disk (selalu membaca ulang file).
+
+        Args:
+            name (str): Nama versi, misal "v16" atau "v17_sdg".
+
+        Returns:
+            LoadedModel: Model siap pakai.
+        """
+        path = self.path_for(name)
+        if not path.exists():
+            raise FileNotFoundError(f"Model {name!r} tidak ditemukan di {self.model_dir}")
+        start = time.perf_counter()
+        if self.shared:
+            pipeline, meta = self._load_shared(name, path)
+        else:
+            pipeline, meta = _read_joblib(path)
+        scorer = None
+        if self.linear_scorer:
+            from .linear_scorer import LinearScorer
+            if LinearScorer.supports(pipeline):
+                scorer = LinearScorer.from_pipeline(pipeline, name)
+        calibration = None
+        if self.calibration:
+            from .calibration import CALIBRATION_DIR, load_calibrator
+            calibration = load_calibrator(name, path, self.model_dir / CALIBRATION_DIR.name)
+        return LoadedModel(name, path, pipeline, MappingProxyType(meta), time.perf_counter() - start, scorer,
+                           calibration)
+
+    def _load_shared(self, name: str, path: Path):
+        from .shared_model import export_shared_model, is_export_stale, load_shared_pipeline, shared_dir_for
+
+        folder = shared_dir_for(name)
+        if is_export_stale(path, folder):
+            pipeline, meta = _read_joblib(path)
+            export_shared_model(LoadedModel(name, path, pipeline, MappingProxyType(meta)))
+        return load_shared_pipeline(folder)
+
+    def describe(self, name: str) -> dict:
+        """Memuat model lalu mengembalikan metadata file dan ringkasan pipeline-nya."""
+        model = self.load(name)
+        return {
+            "name": name,
+            "path": str(model.path),
+            "size_bytes": model.path.stat().st_size,
+            "load_seconds": model.load_seconds,
+            **{k: v for k, v in model.meta.items()},
+            **describe_pipeline(model.pipeline),
+        }
+
+    def _read_pointer(self):
+        """Membaca file penunjuk; mengembalikan (nama atau None, signature file)."""
+        try:
+            st = os.stat(self.pointer)
+            sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+            name = self.pointer.read_text(encoding="utf-8").strip()
+            return name or None, sig
+        except OSError:
+            return None, None
+
+    def configured_name(self) -> str:
+        """Nama model yang seharusnya aktif menurut env, file penunjuk, atau default."""
+        env = os.environ.get("JUDOL_MODEL", "").strip()
+        if env:
+            return env
+        name, _ = self._read_pointer()
+        return name or DEFAULT_MODEL
+
+    def active(self) -> LoadedModel:
+        """
+        Mengembalikan model aktif. Di jalur normal hanya membaca satu referensi; pemeriksaan
+        file penunjuk dilakukan berkala dan penggantian model berjalan di thread latar.
+        """
+        model = self._active
+        if model is None:
+            return self.preload()
+        if time.monotonic() >= self._next_check:
+            self._poll_pointer(model)
+        return model
+
+    def preload(self) -> LoadedModel:
+        """Memuat model aktif secara sinkron (dipanggil saat worker boot)."""
+        with self._load_lock:
+            if self._active is None:
+                _, self._pointer_sig = self._read_pointer()
+                self._active = self.load(self.configured_name())
+                self._next_check = time.monotonic() + self.poll_interval
+        return self._active
+
+    def _poll_pointer(self, current: LoadedModel):
+        if not self._swap_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = time.monotonic() + self.poll_interval
+            if self._swapping:
+                return
+            _, sig = self._read_pointer()
+            if sig == self._pointer_sig:
+                return
+            name = self.configured_name()
+            if name == current.name:
+                self._pointer_sig = sig
+                return
+            self._swapping = True
+        finally:
+            self._swap_lock.release()
+        Thread(target=self._background_swap, args=(name, sig), daemon=True, name="model-swap").start()
+
+    def _background_swap(self, name: str, sig):
+        # Signature penunjuk baru dicatat setelah model berhasil dimuat; jika gagal, pemeriksaan
+        # berikutnya mencoba lagi alih-alih menganggap penunjuk itu sudah diterapkan.
+        try:
+            self.activate(name)
+            self._pointer_sig = sig
+        except Exception as e:
+            print(f"Gagal mengganti model ke {name!r}: {e}")
+        finally:
+            self._swapping = False
+
+    def activate(self, name: str) -> LoadedModel:
+        """
+        Memuat model `name` lalu menjadikannya model aktif di proses ini. Referensi ditukar
+        sekali setelah model selesai dimuat, sehingga request lain tidak pernah menunggu.
+        """
+        model = self.load(name)
+        with self._load_lock:
+            self._active = model
+        return model
+
+    def set_pointer(self, name: str):
+        """
+        Menulis file penunjuk secara atomik (file sementara + `os.replace`) sehingga semua
+        worker berpindah ke model `name` pada pemeriksaan berikutnya.
+        """
+        if not self.path_for(name).exists():
+            raise FileNotFoundError(f"Model {name!r} tidak ditemukan di {self.model_dir}")
+        self.pointer.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.pointer.parent, prefix=self.pointer.name, suffix=".tmp")
+        publish_mode(fd)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(name + "\n")
+        os.replace(tmp, self.pointer)
+
+_registry_lock = Lock()
+_REGISTRY = None
+
+def get_registry() -> ModelRegistry:
+    """ModelRegistry bawaan, dibuat sekali per proses."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _registry_lock:
+            if _REGISTRY is None:
+                _REGISTRY = ModelRegistry()
+    return _REGISTRY
+
+def get_active_model() -> LoadedModel:
+    """
+    Mengambil model aktif. Ambil sekali per request/batch dan pakai referensi yang sama
+    untuk seluruh pemrosesan agar hasilnya konsisten meski model sedang diganti.
+
+    Returns:
+        LoadedModel: Model aktif (nama, pipeline, metadata).
+    """
+    return get_registry().active()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+import json
+import multiprocessing
+import os
+import queue
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+
+from .registry import get_registry
+
+# Model kandidat yang ikut menskor trafik asli di latar (kosong = nonaktif), misal "v20_final".
+SHADOW_MODEL = os.environ.get("JUDOL_SHADOW_MODEL", "").strip()
+# Porsi batch yang ikut dinilai kandidat (0..1).
+SHADOW_SAMPLE = float(os.environ.get("JUDOL_SHADOW_SAMPLE", 1.0))
+# Batas batch yang menunggu; jika penuh batch dibuang, request tidak pernah menunggu.
+SHADOW_QUEUE = int(os.environ.get("JUDOL_SHADOW_QUEUE", 64))
+# Nilai nice proses kandidat, agar kalah prioritas CPU dari worker yang melayani request.
+SHADOW_NICE = int(os.environ.get("JUDOL_SHADOW_NICE", 10))
+
+BASE_APP_DIR = Path(__file__).resolve().parents[1]
+SHADOW_LOG_DIR = Path(os.environ.get("JUDOL_SHADOW_LOG_DIR", BASE_APP_DIR / "shadow_logs"))
+
+# Panjang maksimum teks bersih yang dicatat untuk setiap ketidaksepakatan.
+_MAX_TEXT = 200
+
+# Penghitung yang diperbarui proses kandidat (indeks di Array bersama).
+_CHILD_STATS = ("batches", "comments", "disagreements", "errors")
+
+class ShadowScorer:
+    """
+    Menskor teks bersih yang sama dengan model kandidat di proses terpisah, lalu mencatat
+    latensi dan ketidaksepakatan label ke file JSONL append-only (satu baris per batch).
+
+    Kandidat berjalan di satu proses anak per worker (konteks "spawn", dengan nice
+    SHADOW_NICE), sehingga penskorannya tidak berebut GIL dengan thread request. Biaya di
+    worker hanya `put_nowait` ke antrean terbatas plus pickling batch oleh thread feeder
+    multiprocessing; jika antrean penuh batch dihitung sebagai "dropped". Model kandidat
+    dimuat di proses anak saat proses itu dinyalakan.
+    """
+
+    def __init__(self, candidate: str, log_dir: Path | str = SHADOW_LOG_DIR, sample: float = SHADOW_SAMPLE,
+                 max_pending: int = SHADOW_QUEUE):
+        self.candidate = candidate
+        self.log_dir = Path(log_dir)
+        self.sample = sample
+        self.max_pending = max_pending
+        self._queue = None
+        self._process = None
+        self._counters = None
+        self._pid = None
+        self._start_lock = Lock()
+        self._stats_lock = Lock()
+        self._stats = {"submitted": 0, "dropped": 0}
+
+    def log_path(self, production: str) -> Path:
+        return _log_path(self.log_dir, production, self.candidate)
+
+    def start(self):
+        """Menyalakan proses kandidat untuk proses ini (aman dipanggil ulang, juga setelah fork)."""
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid != os.getpid():
+                ctx = multiprocessing.get_context("spawn")
+                self._queue = ctx.Queue(maxsize=self.max_pending)
+                self._counters = ctx.Array("q", len(_CHILD_STATS))
+                self._process = ctx.Process(
+                    target=_run_candidate,
+                    args=(self.candidate, str(self.log_dir), self._queue, self._counters, os.getpid()),
+                    daemon=True, name="shadow-scorer",
+                )
+                self._process.start()
+                self._pid = os.getpid()
+
+    def stop(self, timeout: float = 5.0):
+        """Menghentikan proses kandidat milik proses ini (batch yang belum dinilai dibuang)."""
+        with self._start_lock:
+            if self._pid != os.getpid():
+                return
+            self._process.terminate()
+            self._process.join(timeout)
+            self._queue.close()
+            self._pid = None
+
+    def submit(self, production, probas: dict, production_ms: float, threshold: float) -> bool:
+        """
+        Menitipkan satu batch untuk dinilai kandidat.
+
+        Args:
+            production (LoadedModel): Model produksi yang menghasilkan `probas`.
+            probas (dict): Peta teks bersih -> proba judol dari model produksi (hanya teks yang
+                benar-benar diskor model, bukan yang diputuskan tahap kaskade).
+            production_ms (float): Waktu penskoran model produksi untuk batch ini (ms).
+            threshold (float): Ambang label untuk sumber batch ini (dari ThresholdPolicy).
+
+        Returns:
+            bool: True jika batch masuk antrean.
+        """
+        if not probas or production.name == self.candidate or random.random() >= self.sample:
+            return False
+        self.start()
+        try:
+            self._queue.put_nowait((production.name, probas, production_ms, threshold))
+        except queue.Full:
+            self._bump(dropped=1)
+            return False
+        self._bump(submitted=1)
+        return True
+
+    def _bump(self, **counts):
+        with self._stats_lock:
+            for k, v in counts.items():
+                self._stats[k] += v
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            out = {"candidate": self.candidate, **self._stats}
+        counters = list(self._counters) if self._counters is not None else [0] * len(_CHILD_STATS)
+        return {**out, **dict(zip(_CHILD_STATS, counters))}
+
+def _log_path(log_dir: Path, production: str, candidate: str) -> Path:
+    return Path(log_dir) / f"shadow_{production}__{candidate}.jsonl"
+
+def _run_candidate(candidate: str, log_dir: str, q, counters, parent_pid: int):
+    """Loop proses kandidat: memuat model sekali, lalu menilai batch dari antrean."""
+    try:
+        os.nice(SHADOW_NICE)
+    except OSError:
+        pass
+    model = None
+    while True:
+        try:
+            item = q.get(timeout=5)
+        except queue.Empty:
+            # Worker induk mati tanpa sempat menghentikan proses ini.
+            if os.getppid() != parent_pid:
+                return
+            continue
+        try:
+            if model is None:
+                model = get_registry().load(candidate)
+            _score(model, Path(log_dir), counters, *item)
+        except Exception as e:
+            with counters.get_lock():
+                counters[_CHILD_STATS.index("errors")] += 1
+            print(f"Shadow scoring {candidate!r} gagal: {e}")
+
+def _score(model, log_dir: Path, counters, production: str, probas: dict, production_ms: float, threshold: float):
+    texts = list(probas)
+    start = time.perf_counter()
+    candidate = model.proba_positive(texts)
+    candidate_ms = (time.perf_counter() - start) * 1000
+
+    disagreements = [
+        [t[:_MAX_TEXT], round(probas[t], 4), round(c, 4)]
+        for t, c in zip(texts, candidate)
+        if (probas[t] >= threshold) != (c >= threshold)
+    ]
+    entry = {
+        "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "prod": production,
+        "cand": model.name,
+        "n": len(texts),
+        "thr": threshold,
+        "prod_ms": round(production_ms, 3),
+        "cand_ms": round(candidate_ms, 3),
+        "pos_prod": sum(1 for t in texts if probas[t] >= threshold),
+        "pos_cand": sum(1 for c in candidate if c >= threshold),
+        "diff": disagreements,
+    }
+    _append(_log_path(log_dir, production, model.name), entry)
+    with counters.get_lock():
+        for key, value in (("batches", 1), ("comments", len(texts)), ("disagreements", len(disagreements))):
+            counters[_CHILD_STATS.index(key)] += value
+
+def _append(path: Path, entry: dict):
+    # Satu os.write per baris dengan O_APPEND: baris dari beberapa worker tidak bercampur.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+_shadow_lock = Lock()
+_SHADOW = None
+
+def get_shadow() -> ShadowScorer | None:
+    """ShadowScorer bawaan dari JUDOL_SHADOW_MODEL, atau None jika shadow scoring nonaktif."""
+    global _SHADOW
+    if not SHADOW_MODEL:
+        return None
+    if _SHADOW is None:
+        with _shadow_lock:
+            if _SHADOW is None:
+                _SHADOW = ShadowScorer(SHADOW_MODEL)
+    return _SHADOW
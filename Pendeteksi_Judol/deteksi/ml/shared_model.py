@@ -0,0 +1,224 @@
+from __future__ import annotations
+import copy
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+from .lexicon import COMPILED_DIR, CompiledLexicon, publish_mode, write_lexicon
+
+SHARED_DIR = COMPILED_DIR / "models"
+SHARED_FORMAT = 1
+
+# Array classifier yang lebih kecil dari ini tetap disimpan di skeleton (intercept_, classes_).
+_MIN_SHARED_ARRAY = 1024
+
+# Batas memo n-gram per vocabulary per proses; kecil dibanding vocabulary penuh (50-100 ribu).
+VOCAB_MEMO_SIZE = int(os.environ.get("JUDOL_VOCAB_MEMO", 20_000))
+
+class MmapVocabulary(CompiledLexicon):
+    """
+    Vocabulary TF-IDF (term -> indeks kolom) berbasis file .lex yang di-mmap. Bisa dipasang
+    langsung sebagai `vocabulary_` vectorizer sklearn (dibaca lewat `vocabulary[term]`),
+    dan halaman datanya dibagi semua worker lewat page cache, bukan dict string per worker.
+    """
+
+    def __init__(self, path: Path | str, memo_size: int = VOCAB_MEMO_SIZE):
+        super().__init__(path)
+        if self.value_kind != "int":
+            raise ValueError(f"{path} bukan vocabulary (value_kind={self.value_kind!r})")
+        self.memo_size = memo_size
+        self._memo = {}
+
+    def _lookup(self, key) -> int:
+        try:
+            data = key.encode("utf-8")
+        except AttributeError:
+            return -1
+        index, offsets, blob, mask = self._index, self._key_offsets, self._key_blob, self._mask
+        slot = zlib.crc32(data) & mask
+        while True:
+            i = index[slot]
+            if not i:
+                return -1
+            i -= 1
+            if blob[offsets[i]:offsets[i + 1]] == data:
+                return self._values[i]
+            slot = (slot + 1) & mask
+
+    def __getitem__(self, key):
+        # Jalur panas CountVectorizer._count_vocab: dipanggil sekali per n-gram. N-gram yang
+        # sering muncul disimpan di memo kecil per proses (dikosongkan saat penuh).
+        idx = self._memo.get(key)
+        if idx is None:
+            idx = self._lookup(key)
+            if len(self._memo) >= self.memo_size:
+                self._memo.clear()
+            self._memo[key] = idx
+        if idx < 0:
+            raise KeyError(key)
+        return idx
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, -1) >= 0
+
+    def lookup_many(self, terms) -> np.ndarray:
+        """Indeks kolom untuk banyak term sekaligus (-1 untuk term di luar vocabulary)."""
+        get = self.get
+        return np.fromiter((get(t, -1) for t in terms), dtype=np.int64)
+
+    def __reduce__(self):
+        return (MmapVocabulary, (str(self.path), self.memo_size))
+
+def _vectorizers(pipeline):
+    """Menghasilkan (jalur, vectorizer) untuk setiap vectorizer ber-vocabulary di pipeline."""
+    for name, step in getattr(pipeline, "steps", []):
+        if hasattr(step, "vocabulary_"):
+            yield name, step
+        for sub, vect in getattr(step, "transformer_list", []):
+            if hasattr(vect, "vocabulary_"):
+                yield f"{name}.{sub}", vect
+
+def _classifier(pipeline):
+    for name, step in getattr(pipeline, "steps", []):
+        if hasattr(step, "coef_"):
+            return name, step
+    return None, None
+
+def source_signature(path: Path) -> str:
+    """Penanda file model sumber (hash isi) untuk mendeteksi ekspor yang usang."""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+def shared_dir_for(name: str, directory: Path | str = SHARED_DIR) -> Path:
+    return Path(directory) / name
+
+def export_shared_model(model, directory: Path | str = SHARED_DIR) -> Path:
+    """
+    Mengekspor pipeline menjadi tata letak yang bisa di-mmap bersama oleh banyak proses.
+
+    Isi folder `<directory>/<nama model>/`:
+        - `<vectorizer>.vocab.lex`: vocabulary dalam format leksikon terkompilasi (int).
+        - `<vectorizer>.idf.npy`, `clf.<atribut>.npy`: array besar, dimuat dengan mmap_mode="r".
+        - `skeleton.joblib`: pipeline tanpa vocabulary/array besar (beberapa KB).
+        - `manifest.json`: daftar file dan penanda model sumber.
+    Folder ditulis di lokasi sementara lalu ditukar, sehingga pemuat tidak melihat ekspor setengah jadi.
+
+    Args:
+        model (LoadedModel): Model hasil `ModelRegistry.load`.
+        directory (Path | str): Folder induk hasil ekspor.
+
+    Returns:
+        Path: Folder hasil ekspor.
+    """
+    target = shared_dir_for(model.name, directory)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{model.name}-"))
+    try:
+        skeleton = copy.deepcopy(model.pipeline)
+        manifest = {
+            "format": SHARED_FORMAT,
+            "model": model.name,
+            "source": model.path.name,
+            "source_signature": source_signature(model.path),
+            "vectorizers": {},
+            "classifier": {},
+        }
+        for path, vect in _vectorizers(skeleton):
+            write_lexicon(tmp / f"{path}.vocab.lex", vect.vocabulary_, "int", {"model": model.name, "vectorizer": path})
+            entry = {"vocab": f"{path}.vocab.lex"}
+            vect.vocabulary_ = {}
+            tfidf = getattr(vect, "_tfidf", None)
+            if tfidf is not None and hasattr(tfidf, "idf_"):
+                np.save(tmp / f"{path}.idf.npy", np.ascontiguousarray(tfidf.idf_))
+                entry["idf"] = f"{path}.idf.npy"
+                tfidf.idf_ = np.empty(0)
+            manifest["vectorizers"][path] = entry
+
+        clf_name, clf = _classifier(skeleton)
+        if clf is not None:
+            manifest["classifier_step"] = clf_name
+            for attr, value in list(vars(clf).items()):
+                if isinstance(value, np.ndarray) and value.size >= _MIN_SHARED_ARRAY:
+                    np.save(tmp / f"clf.{attr}.npy", np.ascontiguousarray(value))
+                    manifest["classifier"][attr] = f"clf.{attr}.npy"
+                    setattr(clf, attr, np.empty(0))
+
+        joblib.dump({**dict(model.meta), "pipeline": skeleton}, tmp / "skeleton.joblib")
+        (tmp / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        publish_mode(tmp, directory=True)
+
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    # Proses yang masih me-mmap file lama tetap aman: file hanya dipindah lalu di-unlink.
+    trash = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{model.name}-old-"))
+    try:
+        if target.exists():
+            os.replace(target, trash / "old")
+        os.replace(tmp, target)
+    except OSError:
+        # Worker lain menyelesaikan ekspor yang sama lebih dulu; pakai hasil miliknya.
+        if read_manifest(target) is None:
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(trash, ignore_errors=True)
+    return target
+
+def read_manifest(folder: Path | str) -> dict | None:
+    try:
+        return json.loads((Path(folder) / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def is_export_stale(model_path: Path, folder: Path | str) -> bool:
+    """True jika ekspor tidak ada, formatnya lain, atau dibuat dari file model yang berbeda."""
+    manifest = read_manifest(folder)
+    return (
+        manifest is None
+        or manifest.get("format") != SHARED_FORMAT
+        or manifest.get("source_signature") != source_signature(model_path)
+    )
+
+def load_shared_pipeline(folder: Path | str):
+    """
+    Memuat pipeline dari hasil `export_shared_model`: skeleton di-unpickle, lalu vocabulary
+    dan array besar dipasang sebagai mmap read-only.
+
+    Args:
+        folder (Path | str): Folder hasil ekspor satu model.
+
+    Returns:
+        tuple: (pipeline, metadata) dengan bentuk yang sama seperti blob joblib biasa.
+    """
+    folder = Path(folder)
+    manifest = read_manifest(folder)
+    if manifest is None:
+        raise FileNotFoundError(f"Ekspor model tidak ditemukan di {folder}")
+    blob = joblib.load(folder / "skeleton.joblib")
+    pipeline = blob.pop("pipeline")
+
+    vects = dict(_vectorizers(pipeline))
+    for path, entry in manifest["vectorizers"].items():
+        vect = vects[path]
+        vect.vocabulary_ = MmapVocabulary(folder / entry["vocab"])
+        if "idf" in entry:
+            vect._tfidf.idf_ = np.load(folder / entry["idf"], mmap_mode="r")
+
+    _, clf = _classifier(pipeline)
+    for attr, fname in manifest["classifier"].items():
+        setattr(clf, attr, np.load(folder / fname, mmap_mode="r"))
+    return pipeline, blob
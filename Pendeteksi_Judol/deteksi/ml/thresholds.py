@@ -0,0 +1,121 @@
+from __future__ import annotations
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+ASSET_DIR = Path(__file__).resolve().parent / "asset"
+
+DEFAULT_THRESHOLD = float(os.environ.get("JUDOL_THRESHOLD", 0.50))
+
+def _parse_band(value: str) -> tuple[float, float]:
+    low, high = (float(v) for v in value.split(","))
+    return low, high
+
+# Rentang proba "ragu-ragu" (ditampilkan sebagai komentar yang perlu dicek manual).
+UNSURE_BAND = _parse_band(os.environ.get("JUDOL_UNSURE_BAND", "0.40,0.60"))
+
+# File override ambang per channel/video; dibaca ulang otomatis jika berubah. Format:
+#   {"default": {"threshold": 0.5, "unsure": [0.4, 0.6]},
+#    "channels": {"UCxxxx": {"threshold": 0.7}},
+#    "videos": {"dQw4w9WgXcQ": {"threshold": 0.6, "unsure": [0.5, 0.7]}}}
+# Semua bagian opsional; nilai yang tidak diisi mewarisi "default".
+THRESHOLDS_PATH = Path(os.environ.get("JUDOL_THRESHOLDS", ASSET_DIR / "thresholds.json"))
+THRESHOLDS_POLL_SECONDS = float(os.environ.get("JUDOL_THRESHOLDS_POLL_SECONDS", 5))
+
+@dataclass(frozen=True)
+class Thresholds:
+    """Ambang label dan rentang ragu-ragu yang sudah jadi untuk satu sumber komentar."""
+    threshold: float = DEFAULT_THRESHOLD
+    unsure_low: float = UNSURE_BAND[0]
+    unsure_high: float = UNSURE_BAND[1]
+    source: str = "default"
+
+    def label(self, proba: float) -> int:
+        return int(proba >= self.threshold)
+
+    def is_unsure(self, proba: float) -> bool:
+        return self.unsure_low <= proba <= self.unsure_high
+
+def _merge(base: Thresholds, spec: dict, source: str) -> Thresholds:
+    threshold = float(spec.get("threshold", base.threshold))
+    low, high = (float(v) for v in spec.get("unsure", (base.unsure_low, base.unsure_high)))
+    if not (0.0 <= threshold <= 1.0 and 0.0 <= low <= high <= 1.0):
+        raise ValueError(f"Ambang tidak valid untuk {source}: threshold={threshold}, unsure=[{low}, {high}]")
+    return Thresholds(threshold, low, high, source)
+
+class ThresholdPolicy:
+    """
+    Ambang per channel/video. Semua override digabung dengan default saat file dibaca,
+    sehingga `for_source` hanya berupa pencarian dict tanpa perhitungan per request.
+    File diperiksa paling sering sekali per `poll_interval` dan ditukar secara utuh.
+    """
+
+    def __init__(self, path: Path | str = THRESHOLDS_PATH, poll_interval: float = THRESHOLDS_POLL_SECONDS):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self._lock = Lock()
+        self._sig = None
+        self._next_check = 0.0
+        self._table = (Thresholds(), {}, {})
+
+    def _signature(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _build(self, data: dict):
+        default = _merge(Thresholds(), data.get("default", {}), "default")
+        channels = {k: _merge(default, v, f"channel:{k}") for k, v in data.get("channels", {}).items()}
+        videos = {k: _merge(default, v, f"video:{k}") for k, v in data.get("videos", {}).items()}
+        return default, channels, videos
+
+    def _refresh(self):
+        if time.monotonic() < self._next_check or not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = time.monotonic() + self.poll_interval
+            sig = self._signature()
+            if sig == self._sig:
+                return
+            self._sig = sig
+            if sig is None:
+                self._table = (Thresholds(), {}, {})
+                return
+            try:
+                self._table = self._build(json.loads(self.path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError) as e:
+                print(f"Gagal membaca {self.path}, ambang lama tetap dipakai: {e}")
+        finally:
+            self._lock.release()
+
+    def for_source(self, channel_id: str | None = None, video_id: str | None = None) -> Thresholds:
+        """
+        Ambang untuk sebuah sumber komentar: override video, lalu channel, lalu default.
+
+        Args:
+            channel_id (str | None): ID channel YouTube.
+            video_id (str | None): ID video YouTube.
+
+        Returns:
+            Thresholds: Ambang label dan rentang ragu-ragu.
+        """
+        self._refresh()
+        default, channels, videos = self._table
+        return videos.get(video_id) or channels.get(channel_id) or default
+
+_policy_lock = Lock()
+_POLICY = None
+
+def get_threshold_policy() -> ThresholdPolicy:
+    """ThresholdPolicy bawaan (THRESHOLDS_PATH), dibuat sekali per proses."""
+    global _POLICY
+    if _POLICY is None:
+        with _policy_lock:
+            if _POLICY is None:
+                _POLICY = ThresholdPolicy()
+    return _POLICY
@@ -87,8 +87,9 @@ def generate_insight(url, limit, stats, results_sample_check=None):
 
     DATA INPUT:
     1. Keywords Spam Dominan: {stats['spam_keywords_str'] if stats['spam_keywords_str'] else "-"}
-    2. Sampel Spam (Yakin): {stats['spam_samples_str'] if stats['spam_samples_str'] else "-"}
-    3. Sampel Ragu/Ambigu (Perlu Cek): {stats['unsure_samples_str'] if stats['unsure_samples_str'] else "-"}
+    2. Brand Situs Judi Disebut: {stats.get('brands_str') or "-"}
+    3. Sampel Spam (Yakin): {stats['spam_samples_str'] if stats['spam_samples_str'] else "-"}
+    4. Sampel Ragu/Ambigu (Perlu Cek): {stats['unsure_samples_str'] if stats['unsure_samples_str'] else "-"}
 
     ATURAN FORMATTING (STRICT):
     - DILARANG menggunakan kalimat pembuka.
@@ -96,7 +97,7 @@ def generate_insight(url, limit, stats, results_sample_check=None):
     - Hapus kata sambung tidak perlu.
 
     TEMPLATE OUTPUT (Wajib 4 Poin):
-    * **Pola Deteksi**: (Sebutkan keyword utama dan jika ada teknik penyamaran seperti spasi/simbol)
+    * **Pola Deteksi**: (Sebutkan keyword dan brand situs utama, serta teknik penyamaran seperti spasi/simbol jika ada)
     * **Modus**: (Jelaskan taktiknya: janji maxwin, link di bio, atau spam massal)
     * **Analisis Ambigu**: (Cek 'Sampel Ragu'. JIKA isinya berita/edukasi/curhat kalah judi, tegaskan bahwa itu BUKAN promosi. JIKA kosong/promosi samar, tulis "-")
     * **Kesimpulan Risiko**: (Simpulkan tingkat keparahan: Rendah/Sedang/Tinggi berdasarkan dominasi spam)
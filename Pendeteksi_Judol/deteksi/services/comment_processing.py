@@ -1,26 +1,31 @@
-from ..services.youtube import collect_comments, extract_youtube_video_id
-from ..ml.predict import predict_comment
-from ..ml.utils_text import top_keywords_from_texts
+import os
+import queue
+import threading
+from ..services.youtube import stream_comments, extract_youtube_video_id
+from ..ml.predict import predict_comments
+from ..ml.thresholds import get_threshold_policy
+from ..ml.utils_text import tokenize_simple
+from collections import Counter
 from datetime import datetime
 
-def process_raw_comments(rows):
+# Jumlah halaman komentar yang boleh diambil lebih dulu selagi halaman sebelumnya diskor.
+PREFETCH_PAGES = int(os.environ.get("JUDOL_PREFETCH_PAGES", 2))
+
+def score_rows(rows, channel_id=None, video_id=None):
     """
-    Memproses daftar komentar mentah (list of dict) untuk mendapatkan hasil prediksi judi online 
-    dan statistik terkait.
+    Menskor satu potongan komentar mentah dan menambahkan hasil prediksi ke setiap baris.
     
     Args:
-        rows (list[dict]): Daftar komentar mentah yang diambil dari YouTube.
+        rows (list[dict]): Komentar mentah hasil `collect_comments`/`stream_comments`.
+        channel_id (str, optional): Channel sumber, untuk override ambang per channel.
+        video_id (str, optional): Video sumber, untuk override ambang per video.
         
     Returns:
-        tuple: (results, stats)
-            - results (list): Daftar komentar dengan tambahan prediksi (label, proba, clean text).
-            - stats (dict): Statistik ringkasan (total, judi, clean, keywords, sampel).
+        list[dict]: Baris komentar dengan tambahan label, proba, teks bersih, dan brand.
     """
     results = []
-    
-    for r in rows:
-        pred = predict_comment(r["text"])
-        
+    preds = predict_comments([r["text"] for r in rows], channel_id=channel_id, video_id=video_id)
+    for r, pred in zip(rows, preds):
         pub_at = r.get("published_at")
         if isinstance(pub_at, str):
             try:
@@ -34,65 +39,227 @@ def process_raw_comments(rows):
             "text_clean": pred["clean"],
             "label": pred["label"],
             "proba": pred["proba"],
+            "brands": pred["brands"],
+            "unsure": pred["unsure"],
         })
+    return results
+
+class CommentStats:
+    """
+    Akumulator statistik analisis yang diisi per potongan hasil (`add`), sehingga statistik
+    tidak perlu menunggu semua komentar terkumpul. `finish` menghasilkan dict yang sama
+    persis dengan perhitungan sekaligus atas seluruh hasil (urutan dan pemecah seri sama).
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.judi_count = 0
+        self.keywords = Counter()
+        self.keywords_negative = Counter()
+        self.brands = Counter()
+        self.high_confidence_spam = []
+        self.unsure_comments = []
+        self.sample_clean_comments = []
+
+    def add(self, results):
+        """Menambahkan satu potongan hasil `score_rows` (urutan potongan = urutan komentar)."""
+        spam = []
+        unsure = []
+        for item in results:
+            self.total += 1
+            if item["label"] == 1:
+                self.judi_count += 1
+                spam.append(item)
+                self.keywords.update(tokenize_simple(item["text_clean"]))
+            else:
+                self.keywords_negative.update(tokenize_simple(item["text_clean"]))
+                if len(self.sample_clean_comments) < 3:
+                    self.sample_clean_comments.append(item["text"])
+            if item["unsure"]:
+                unsure.append(item)
+            self.brands.update(item["brands"])
+        # sorted() stabil: seri tetap mengikuti urutan komentar, sama seperti sort sekaligus.
+        self.high_confidence_spam = sorted(self.high_confidence_spam + spam, key=lambda x: x["proba"],
+                                           reverse=True)[:7]
+        self.unsure_comments = sorted(self.unsure_comments + unsure, key=lambda x: x["proba"],
+                                      reverse=True)[:10]
+
+    def snapshot(self) -> dict:
+        """Penghitung berjalan untuk tampilan progresif."""
+        return {"total": self.total, "judi_count": self.judi_count, "clean_count": self.total - self.judi_count}
+
+    def finish(self, thresholds) -> dict:
+        """
+        Menyusun statistik akhir.
+        
+        Args:
+            thresholds (Thresholds): Ambang yang dipakai untuk sumber komentar ini.
+            
+        Returns:
+            dict: Statistik ringkasan (total, judi, clean, keywords, brand, sampel).
+        """
+        top_keywords = self.keywords.most_common(30)
+        top_keywords_negative = self.keywords_negative.most_common(30)
+        top_brands = self.brands.most_common(15)
+        high_confidence_spam = self.high_confidence_spam
+        unsure_comments = self.unsure_comments
+
+        unsure_samples_str = "\n".join([f"- {c['text']} (Probabilitas: {c['proba']:.2%})" for c in unsure_comments])
+        spam_keywords_str = "\n".join([f"- {w}: {c}" for w, c in top_keywords[:15]])
+        clean_keywords_str = "\n".join([f"- {w}: {c}" for w, c in top_keywords_negative[:10]])
+        brands_str = "\n".join([f"- {b}: {c}" for b, c in top_brands])
+        spam_samples_str = "\n".join([f"- {c['text']}" for c in high_confidence_spam])
+        clean_samples_str = "\n".join([f"- {c}" for c in self.sample_clean_comments])
+
+        return {
+            **self.snapshot(),
+            "top_keywords": top_keywords,
+            "top_keywords_negative": top_keywords_negative,
+            "top_brands": top_brands,
+            "spam_keywords_str": spam_keywords_str,
+            "brands_str": brands_str,
+            "clean_keywords_str": clean_keywords_str,
+            "spam_samples_str": spam_samples_str,
+            "clean_samples_str": clean_samples_str,
+            "unsure_samples_str": unsure_samples_str,
+            "high_confidence_spam": high_confidence_spam,
+            "unsure_comments": unsure_comments,
+            "thresholds": {
+                "threshold": thresholds.threshold,
+                "unsure": [thresholds.unsure_low, thresholds.unsure_high],
+                "source": thresholds.source,
+            },
+        }
+
+def prefetch(pages, depth=PREFETCH_PAGES):
+    """
+    Menjalankan generator halaman di thread latar dan menyimpan paling banyak `depth`
+    halaman di antrean, sehingga halaman berikutnya diambil dari jaringan selagi halaman
+    sekarang diproses. Exception dari generator diteruskan ke pemanggil; jika pemanggil
+    berhenti lebih awal, thread latar ikut berhenti setelah halaman yang sedang diambil.
+    
+    Args:
+        pages (iterable): Sumber halaman (misal `stream_comments`).
+        depth (int): Jumlah halaman maksimum yang menunggu diproses.
+        
+    Yields:
+        Halaman dari `pages`, sesuai urutan.
+    """
+    if depth <= 0:
+        yield from pages
+        return
+    q = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        # Antrean bisa penuh selamanya jika pemanggil sudah berhenti; jangan pernah blok tanpa batas.
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
 
-    total_comments = len(results)
-    judi_count = sum(1 for item in results if item["label"] == 1)
-    clean_count = total_comments - judi_count
+    def produce():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
 
-    positive_cleans = [item["text_clean"] for item in results if item["label"] == 1]
-    negative_cleans = [item["text_clean"] for item in results if item["label"] == 0]
+    threading.Thread(target=produce, daemon=True, name="comment-prefetch").start()
+    try:
+        while True:
+            page, error = q.get()
+            if page is done:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        stop.set()
 
-    top_keywords = top_keywords_from_texts(positive_cleans, top_n=30)
-    top_keywords_negative = top_keywords_from_texts(negative_cleans, top_n=30)
+def iter_scored_pages(pages, channel_id=None, video_id=None, stats=None):
+    """
+    Pipeline generator: setiap potongan komentar mentah diskor begitu tiba (pengambilan
+    halaman berikutnya berjalan di latar lewat `prefetch`) dan dimasukkan ke `stats`.
+    
+    Args:
+        pages (iterable): Potongan komentar mentah, misal `stream_comments(...)`.
+        channel_id (str, optional): Channel sumber, untuk override ambang per channel.
+        video_id (str, optional): Video sumber, untuk override ambang per video. Jika kosong
+            (mode channel), dipakai 'video_id' baris pertama potongan (satu potongan = satu video).
+        stats (CommentStats, optional): Akumulator statistik yang ikut diperbarui.
+        
+    Yields:
+        list[dict]: Hasil `score_rows` per potongan.
+    """
+    for rows in prefetch(pages):
+        if not rows:
+            continue
+        results = score_rows(rows, channel_id=channel_id, video_id=video_id or rows[0].get("video_id"))
+        if stats is not None:
+            stats.add(results)
+        yield results
 
-    high_confidence_spam = sorted(
-        [r for r in results if r["label"] == 1], 
-        key=lambda x: x["proba"], 
-        reverse=True)[:7]
+def process_comment_pages(pages, channel_id=None, video_id=None):
+    """
+    Menskor komentar per potongan sambil potongan berikutnya diambil, lalu menyusun
+    statistik secara bertahap.
     
-    unsure_comments = sorted(
-        [r for r in results if 0.40 <= r["proba"] <= 0.60], 
-        key=lambda x: x["proba"], 
-        reverse=True)[:10]
-
-    sample_clean_comments = [r["text"] for r in results if r["label"] == 0][:3]
-
-    unsure_samples_str = "\n".join([f"- {c['text']} (Probabilitas: {c['proba']:.2%})" for c in unsure_comments])
-    spam_keywords_str = "\n".join([f"- {w}: {c}" for w, c in top_keywords[:15]])
-    clean_keywords_str = "\n".join([f"- {w}: {c}" for w, c in top_keywords_negative[:10]])
-    spam_samples_str = "\n".join([f"- {c['text']}" for c in high_confidence_spam])
-    clean_samples_str = "\n".join([f"- {c}" for c in sample_clean_comments])
-
-    stats = {
-        "total": total_comments,
-        "judi_count": judi_count,
-        "clean_count": clean_count,
-        "top_keywords": top_keywords,
-        "top_keywords_negative": top_keywords_negative,
-        "spam_keywords_str": spam_keywords_str,
-        "clean_keywords_str": clean_keywords_str,
-        "spam_samples_str": spam_samples_str,
-        "clean_samples_str": clean_samples_str,
-        "unsure_samples_str": unsure_samples_str,
-        "high_confidence_spam": high_confidence_spam,
-        "unsure_comments": unsure_comments,
-    }
-
-    return results, stats
-
-def process_youtube_comments(url, limit=100):
+    Args:
+        pages (iterable): Potongan komentar mentah.
+        channel_id (str, optional): Channel sumber, untuk override ambang per channel.
+        video_id (str, optional): Video sumber, untuk override ambang per video.
+        
+    Returns:
+        tuple: (results, stats) dengan bentuk yang sama seperti `process_raw_comments`.
+    """
+    stats = CommentStats()
+    results = []
+    for batch in iter_scored_pages(pages, channel_id, video_id, stats):
+        results.extend(batch)
+    return results, stats.finish(get_threshold_policy().for_source(channel_id, video_id))
+
+def process_raw_comments(rows, channel_id=None, video_id=None):
+    """
+    Memproses daftar komentar mentah (list of dict) untuk mendapatkan hasil prediksi judi online 
+    dan statistik terkait.
+    
+    Args:
+        rows (list[dict]): Daftar komentar mentah yang diambil dari YouTube.
+        channel_id (str, optional): Channel sumber, untuk override ambang per channel.
+        video_id (str, optional): Video sumber, untuk override ambang per video.
+        
+    Returns:
+        tuple: (results, stats)
+            - results (list): Daftar komentar dengan tambahan prediksi (label, proba, clean text).
+            - stats (dict): Statistik ringkasan (total, judi, clean, keywords, brand, sampel).
+    """
+    results = score_rows(rows, channel_id=channel_id, video_id=video_id)
+    stats = CommentStats()
+    stats.add(results)
+    return results, stats.finish(get_threshold_policy().for_source(channel_id, video_id))
+
+def process_youtube_comments(url, limit=100, channel_id=None, quota=None):
     """
     Fungsi wrapper untuk mengambil komentar dari satu video YouTube, 
-    kemudian langsung memproses prediksinya.
+    kemudian langsung memproses prediksinya. Setiap halaman komentar diskor selagi
+    halaman berikutnya diambil (lihat `process_comment_pages`).
     
     Args:
         url (str): URL video YouTube.
         limit (int): Batas maksimum komentar yang diambil.
+        channel_id (str, optional): Channel pemilik video, untuk override ambang per channel.
+        quota (QuotaTracker, optional): Penghitung kuota API untuk analisis ini.
         
     Returns:
         tuple: (results, stats) hasil dari process_raw_comments.
     """
-    rows = collect_comments(url, limit=limit)
+    pages = stream_comments(url, limit=limit, quota=quota)
     
-    return process_raw_comments(rows)
+    return process_comment_pages(pages, channel_id=channel_id, video_id=extract_youtube_video_id(url))
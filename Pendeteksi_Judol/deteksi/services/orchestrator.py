@@ -1,83 +1,142 @@
-from .comment_processing import process_youtube_comments, process_raw_comments
+from .comment_processing import CommentStats, iter_scored_pages
 from .youtube import (
     extract_channel_info,
     get_video_info,
     get_channel_info,
     get_channel_uploads_playlist,
     get_videos_from_playlist,
-    collect_comments
+    iter_comments_many,
+    stream_comments,
+    QuotaTracker,
 )
+from ..ml.thresholds import get_threshold_policy
 
-def analyze_content(url, limit=100, video_count=5, comments_per_video=None, user_channel_id=None):
+INVALID_LINK_MSG = "Link tidak valid. Masukkan URL video, Channel ID, atau Handle (@username)."
+INVALID_VIDEO_MSG = "URL Video tidak valid."
+
+def check_source_url(url):
     """
-    Mengorkestrasi pengambilan dan analisis konten YouTube (Video tunggal atau Channel).
-    
+    Validasi cepat input pengguna tanpa memanggil API YouTube.
+
+    Args:
+        url (str): URL YouTube atau handle channel.
+
+    Returns:
+        str | None: Pesan kesalahan, atau None jika input bisa dianalisis.
+    """
+    id_type, identifier = extract_channel_info(url)
+    if id_type == "video" and not identifier:
+        return INVALID_VIDEO_MSG
+    if id_type not in ("video", "handle", "channel_id"):
+        return INVALID_LINK_MSG
+    return None
+
+def iter_analysis(url, limit=100, video_count=5, comments_per_video=None):
+    """
+    Versi bertahap dari `analyze_content`: menghasilkan event selagi analisis berjalan,
+    sehingga pemanggil bisa menampilkan komentar yang sudah diskor sebelum halaman
+    terakhir diambil.
+
     Args:
         url (str): URL YouTube atau handle channel.
         limit (int): Batas maksimum total komentar (digunakan untuk video tunggal atau default).
         video_count (int): Jumlah maksimum video yang diambil jika input adalah channel.
         comments_per_video (int): Batas komentar per video jika input adalah channel.
-        
-    Returns:
-        dict: Dictionary berisi:
-            - 'results': Daftar komentar hasil analisis.
-            - 'stats': Statistik dari analisis.
-            - 'source_info': Informasi tentang sumber video/channel.
-            - 'error_msg': Pesan kesalahan jika terjadi kegagalan.
+
+    Yields:
+        tuple: (event, payload) dengan event:
+            - 'source': Informasi sumber video/channel (bisa None), sekali sebelum komentar.
+            - 'rows': Daftar komentar hasil analisis satu halaman/video.
+            - 'done': dict berisi 'stats', 'source_info', 'error_msg', dan 'quota'; selalu terakhir.
     """
     if comments_per_video is None:
         comments_per_video = limit
-        
+
     id_type, identifier = extract_channel_info(url)
-    
-    results = []
-    stats = {}
-    error_msg = None
+
+    error_msg = check_source_url(url)
     source_info = None
-    
-    if id_type == "video":
-        if not identifier:
-             error_msg = "URL Video tidak valid."
-        else:
-            video_url = f"https://www.youtube.com/watch?v={identifier}"
-            
-            source_info = get_video_info(identifier)
-            if source_info:
-                source_info["type"] = "video"
-            
-            results, stats = process_youtube_comments(video_url, limit=limit)
-        
-    elif id_type in ("handle", "channel_id"):
-        source_info = get_channel_info(identifier, id_type)
+    quota = QuotaTracker()
+    pages = None
+    channel_id = None
+    video_id = None
+
+    if error_msg:
+        pass
+    elif id_type == "video":
+        source_info = get_video_info(identifier, quota=quota)
+        if source_info:
+            source_info["type"] = "video"
+
+        channel_id = source_info.get("channel_id") if source_info else None
+        video_id = identifier
+        pages = stream_comments(f"https://www.youtube.com/watch?v={identifier}", limit=limit, quota=quota)
+
+    else:
+        source_info = get_channel_info(identifier, id_type, quota=quota)
         if source_info:
             source_info["type"] = "channel"
-        
-        playlist_id = get_channel_uploads_playlist(identifier, id_type)
+
+        playlist_id = get_channel_uploads_playlist(identifier, id_type, quota=quota)
         if not playlist_id:
             error_msg = "Channel tidak ditemukan atau tidak memiliki playlist Uploads publik."
         else:
-            video_ids = get_videos_from_playlist(playlist_id, limit=video_count)
-            
+            video_ids = get_videos_from_playlist(playlist_id, limit=video_count, quota=quota)
+
             if not video_ids:
                 error_msg = "Tidak ditemukan video pada channel ini."
             else:
-                all_raw_comments = []
-                for vid in video_ids:
-                    v_url = f"https://www.youtube.com/watch?v={vid}"
-                    batch = collect_comments(v_url, limit=comments_per_video)
-                    all_raw_comments.extend(batch)
-                
-                if not all_raw_comments:
-                    error_msg = f"Tidak ada komentar ditemukan dari {len(video_ids)} video terakhir."
-                else:
-                    results, stats = process_raw_comments(all_raw_comments)
+                # Komentar video pertama sudah diskor selagi video lain masih diambil.
+                channel_id = source_info.get("channel_id") if source_info else None
+                pages = iter_comments_many(video_ids, limit=comments_per_video, quota=quota)
 
-    else:
-        error_msg = "Link tidak valid. Masukkan URL video, Channel ID, atau Handle (@username)."
-        
-    return {
-        "results": results,
+    stats = {}
+    if pages is not None:
+        yield "source", source_info
+        acc = CommentStats()
+        for batch in iter_scored_pages(pages, channel_id, video_id, acc):
+            yield "rows", batch
+
+        if id_type != "video" and not acc.total:
+            error_msg = f"Tidak ada komentar ditemukan dari {len(video_ids)} video terakhir."
+        else:
+            stats = acc.finish(get_threshold_policy().for_source(channel_id, video_id))
+
+    usage = quota.snapshot()
+    if stats:
+        stats["quota"] = usage
+    if usage["units"]:
+        print(f"Analisis {url}: {usage['units']} unit kuota API, {usage['rows']} komentar"
+              + (" (anggaran kuota habis)" if usage["exhausted"] else ""))
+
+    yield "done", {
         "stats": stats,
         "source_info": source_info,
-        "error_msg": error_msg
+        "error_msg": error_msg,
+        "quota": usage,
     }
+
+def analyze_content(url, limit=100, video_count=5, comments_per_video=None, user_channel_id=None):
+    """
+    Mengorkestrasi pengambilan dan analisis konten YouTube (Video tunggal atau Channel).
+
+    Args:
+        url (str): URL YouTube atau handle channel.
+        limit (int): Batas maksimum total komentar (digunakan untuk video tunggal atau default).
+        video_count (int): Jumlah maksimum video yang diambil jika input adalah channel.
+        comments_per_video (int): Batas komentar per video jika input adalah channel.
+
+    Returns:
+        dict: Dictionary berisi:
+            - 'results': Daftar komentar hasil analisis.
+            - 'stats': Statistik dari analisis.
+            - 'source_info': Informasi tentang sumber video/channel.
+            - 'error_msg': Pesan kesalahan jika terjadi kegagalan.
+            - 'quota': Pemakaian kuota API YouTube analisis ini (juga ada di stats['quota']).
+    """
+    results = []
+    for event, payload in iter_analysis(url, limit, video_count, comments_per_video):
+        if event == "rows":
+            results.extend(payload)
+        elif event == "done":
+            return {"results": results, **payload}
@@ -1,4 +1,6 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
 import requests
 from django.conf import settings
@@ -11,6 +13,73 @@ SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")  
 youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
 
+# Jumlah video yang komentarnya diambil bersamaan dalam satu analisis channel.
+FETCH_WORKERS = int(os.getenv("YOUTUBE_FETCH_WORKERS", 4))
+# Jumlah thread komentar yang balasannya diperluas bersamaan dalam satu video.
+REPLY_WORKERS = int(os.getenv("YOUTUBE_REPLY_WORKERS", 4))
+# Batas unit kuota API per analisis (0 = tanpa batas selain kuota harian Google).
+QUOTA_BUDGET = int(os.getenv("YOUTUBE_QUOTA_BUDGET", 0))
+
+_local = threading.local()
+
+def _api_client():
+    """
+    Klien YouTube (API key) milik thread pemanggil. Objek klien googleapiclient memakai
+    koneksi httplib2 yang tidak thread-safe, jadi setiap thread pengambil punya klien sendiri.
+    """
+    client = getattr(_local, "youtube", None)
+    if client is None:
+        client = _local.youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+    return client
+
+class QuotaTracker:
+    """
+    Penghitung unit kuota API YouTube dan baris komentar untuk satu analisis, aman dipakai
+    beberapa thread. Setiap panggilan list() yang dipakai di sini bernilai 1 unit.
+    """
+
+    def __init__(self, budget: int = QUOTA_BUDGET):
+        self.budget = budget
+        self.used = 0
+        self.rows = 0
+        self.exhausted = False
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def spend(self, units: int = 1, endpoint: str = "commentThreads") -> bool:
+        """Mencatat pemakaian `units`; False jika anggaran habis (panggilan API jangan dilakukan)."""
+        with self._lock:
+            if self.exhausted or (self.budget and self.used + units > self.budget):
+                self.exhausted = True
+                return False
+            self.used += units
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            return True
+
+    def record(self, units: int = 1, endpoint: str = ""):
+        """Mencatat panggilan metadata (channel/video/playlist) yang tetap dilakukan meski anggaran habis."""
+        with self._lock:
+            self.used += units
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+
+    def add_rows(self, n: int):
+        with self._lock:
+            self.rows += n
+
+    def mark_exhausted(self):
+        """Dipanggil saat Google menolak karena kuota harian habis; pengambil lain ikut berhenti."""
+        with self._lock:
+            self.exhausted = True
+
+    def snapshot(self) -> dict:
+        """Ringkasan pemakaian untuk statistik analisis."""
+        with self._lock:
+            return {"units": self.used, "budget": self.budget, "exhausted": self.exhausted,
+                    "rows": self.rows, "calls": dict(self.calls)}
+
+def _is_quota_error(e: HttpError) -> bool:
+    return e.resp.status == 403 and b"quotaExceeded" in (e.content or b"")
+
 def extract_youtube_video_id(url: str) -> str | None:
     """
     Mengekstrak ID video dari berbagai format URL YouTube.
@@ -50,127 +119,269 @@ def extract_youtube_video_id(url: str) -> str | None:
     except Exception:
         return None
 
-def fetch_all_comment_threads(video_id: str, max_total: int = 200):
+def iter_comment_thread_pages(video_id: str, max_total: int = 200, quota: QuotaTracker | None = None):
     """
-    Mengambil thread komentar teratas dari sebuah video.
+    Generator halaman `commentThreads` sebuah video. Halaman berikutnya baru diminta saat
+    pemanggil meminta item berikutnya, jadi pemanggil yang berhenti iterasi juga berhenti
+    memakai kuota.
     
     Args:
         video_id (str): ID video YouTube.
-        max_total (int): Batas maksimum jumlah komentar yang diambil.
+        max_total (int): Batas maksimum jumlah thread yang diambil (0 = semua).
+        quota (QuotaTracker, optional): Penghitung kuota; paging berhenti jika anggaran habis.
         
-    Returns:
-        list: Daftar item thread komentar dari API YouTube.
+    Yields:
+        list: Item thread komentar dari satu halaman API YouTube.
     """
-    items, page_token = [], None
+    fetched, page_token = 0, None
     try:
         while True:
-            resp = youtube.commentThreads().list(
+            if quota is not None and not quota.spend():
+                return
+            page_size = 100 if max_total == 0 else min(100, max_total - fetched)
+            resp = _api_client().commentThreads().list(
                 part="id,snippet,replies",
                 videoId=video_id,
-                maxResults=100,
+                maxResults=page_size,
                 pageToken=page_token,
                 order="time",
                 textFormat="plainText",
             ).execute()
             batch = resp.get("items", [])
-            items.extend(batch)
-            if max_total != 0 and len(items) >= max_total:  
-                break
+            fetched += len(batch)
+            if batch:
+                yield batch
+            if max_total != 0 and fetched >= max_total:
+                return
             page_token = resp.get("nextPageToken")
             if not page_token:
-                break
+                return
     except HttpError as e:
+        if _is_quota_error(e):
+            if quota is not None:
+                quota.mark_exhausted()
+            return
+        # 403/404: komentar dinonaktifkan atau video tidak ada.
         if e.resp.status in (403, 404):
-            return []
+            return
         raise
-    return items
 
-def fetch_all_replies(parent_id: str):
+def fetch_all_comment_threads(video_id: str, max_total: int = 200, quota: QuotaTracker | None = None):
+    """
+    Mengambil thread komentar teratas dari sebuah video.
+    
+    Args:
+        video_id (str): ID video YouTube.
+        max_total (int): Batas maksimum jumlah komentar yang diambil.
+        quota (QuotaTracker, optional): Penghitung kuota; paging berhenti jika anggaran habis.
+        
+    Returns:
+        list: Daftar item thread komentar dari API YouTube.
+    """
+    return [item for page in iter_comment_thread_pages(video_id, max_total, quota) for item in page]
+
+def fetch_all_replies(parent_id: str, quota: QuotaTracker | None = None, max_total: int = 0):
     """
     Mengambil semua balasan untuk komentar tertentu.
     
     Args:
         parent_id (str): ID komentar induk.
+        quota (QuotaTracker, optional): Penghitung kuota; paging berhenti jika anggaran habis.
+        max_total (int): Berhenti paging setelah sekian balasan terkumpul (0 = semua).
         
     Returns:
         list: Daftar item balasan komentar.
     """
     replies, page_token = [], None
-    while True:
-        resp = youtube.comments().list(
-            part="id,snippet",
-            parentId=parent_id,
-            maxResults=100,
-            pageToken=page_token,
-            textFormat="plainText",
-        ).execute()
-        replies.extend(resp.get("items", []))
-        page_token = resp.get("nextPageToken")
-        if not page_token:
-            break
+    try:
+        while True:
+            if quota is not None and not quota.spend(endpoint="comments"):
+                break
+            resp = _api_client().comments().list(
+                part="id,snippet",
+                parentId=parent_id,
+                maxResults=100,
+                pageToken=page_token,
+                textFormat="plainText",
+            ).execute()
+            replies.extend(resp.get("items", []))
+            if max_total != 0 and len(replies) >= max_total:
+                break
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                break
+    except HttpError as e:
+        if not _is_quota_error(e):
+            raise
+        if quota is not None:
+            quota.mark_exhausted()
     return replies
 
-def collect_comments(link: str, limit: int = 100):
+def _comment_row(item: dict, snippet: dict, level: str, parent_id: str | None) -> dict:
+    return {
+        "level": level,
+        "comment_id": item["id"],
+        "parent_id": parent_id,
+        "author": snippet.get("authorDisplayName"),
+        "published_at": snippet.get("publishedAt"),
+        "updated_at": snippet.get("updatedAt"),
+        "text": snippet.get("textDisplay") or "",
+    }
+
+def _expand_page(threads: list, limit: int, quota: QuotaTracker | None,
+                 pool: ThreadPoolExecutor | None) -> list[dict]:
+    """
+    Mengubah satu halaman thread menjadi baris komentar (teratas lalu balasannya), paling
+    banyak `limit` baris (0 = tanpa batas). Balasan yang belum lengkap diperluas paralel di
+    `pool` (milik pemanggil, dipakai ulang antar halaman), hanya untuk thread yang masih
+    mungkin masuk ke `limit` baris pertama.
+    """
+    # Per thread: baris yang sudah pasti (teratas + balasan inline), ID induk jika balasan
+    # perlu diperluas, ID balasan inline, dan batas balasan yang masih mungkin terpakai.
+    blocks = []
+    guaranteed = 0
+    for th in threads:
+        top_item = th["snippet"]["topLevelComment"]
+        parent_id = top_item["id"]
+        partial = (th.get("replies", {}) or {}).get("comments", [])
+        rows = [_comment_row(top_item, top_item["snippet"], "top", None)]
+        rows.extend(_comment_row(r, r["snippet"], "reply", parent_id) for r in partial)
+        have = {r["id"] for r in partial}
+        total_replies = th["snippet"].get("totalReplyCount", 0)
+        expand = bool(total_replies) and len(have) < total_replies
+        cap = 0
+        if limit > 0:
+            room = limit - guaranteed - len(rows)
+            expand = expand and room > 0
+            cap = room + len(have)
+        blocks.append((rows, parent_id if expand else None, have, cap))
+        guaranteed += len(rows)
+
+    expanding = [i for i, b in enumerate(blocks) if b[1]]
+    futures = {}
+    if pool is not None and len(expanding) > 1:
+        futures = {i: pool.submit(fetch_all_replies, blocks[i][1], quota, blocks[i][3]) for i in expanding}
+
+    rows = []
+    try:
+        for i, (block_rows, parent_id, have, cap) in enumerate(blocks):
+            if limit > 0 and len(rows) >= limit:
+                break
+            rows.extend(block_rows)
+            if not parent_id:
+                continue
+            fetched = futures[i].result() if i in futures else fetch_all_replies(parent_id, quota, cap)
+            rows.extend(_comment_row(r, r["snippet"], "reply", parent_id) for r in fetched if r["id"] not in have)
+    finally:
+        # Balasan yang tidak lagi dibutuhkan (batas tercapai) tidak perlu diambil.
+        for future in futures.values():
+            future.cancel()
+
+    if limit > 0 and len(rows) > limit:
+        rows = rows[:limit]
+    return rows
+
+def stream_comments(link: str, limit: int = 100, quota: QuotaTracker | None = None,
+                    max_workers: int = REPLY_WORKERS):
+    """
+    Generator komentar (termasuk balasan) sebuah video, satu potongan per halaman
+    `commentThreads`. Jumlah baris yang sudah dikeluarkan dihitung berjalan: begitu `limit`
+    tercapai, paging thread dan perluasan balasan berhenti, sehingga tidak ada panggilan API
+    untuk data yang akan dibuang. Satu thread pool balasan dipakai untuk semua halaman,
+    sehingga klien API per thread (dan koneksinya) dipakai ulang.
+
+    Args:
+        link (str): URL video YouTube.
+        limit (int): Batas maksimum total komentar (0 = semua).
+        quota (QuotaTracker, optional): Penghitung kuota untuk analisis ini.
+        max_workers (int): Batas jumlah thread balasan yang diperluas bersamaan.
+
+    Yields:
+        list[dict]: Baris komentar ternormalisasi dari satu halaman, sesuai urutan (dengan 'video_id').
+    """
+    vid = extract_youtube_video_id(link)
+    emitted = 0
+    # Thread baru dibuat saat dibutuhkan, jadi pool untuk video tanpa balasan tidak berbiaya.
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="yt-replies") if max_workers > 1 else None
+    try:
+        for threads in iter_comment_thread_pages(vid, max_total=limit, quota=quota):
+            rows = _expand_page(threads, limit - emitted if limit > 0 else 0, quota, pool)
+            for row in rows:
+                row["video_id"] = vid
+            if rows:
+                emitted += len(rows)
+                if quota is not None:
+                    quota.add_rows(len(rows))
+                yield rows
+            if limit > 0 and emitted >= limit:
+                return
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+def collect_comments(link: str, limit: int = 100, quota: QuotaTracker | None = None,
+                     max_workers: int = REPLY_WORKERS):
     """
     Mengumpulkan komentar (termasuk balasan) dari sebuah video hingga batas tertentu.
+    Lihat `stream_comments` untuk pengambilan per halaman dengan penghentian dini.
     
     Args:
         link (str): URL video YouTube.
         limit (int): Batas maksimum total komentar.
+        quota (QuotaTracker, optional): Penghitung kuota untuk analisis ini.
+        max_workers (int): Batas jumlah thread balasan yang diperluas bersamaan.
         
     Returns:
         list[dict]: Daftar dictionary berisi data komentar yang telah dinormalisasi.
     """
-    vid = extract_youtube_video_id(link)
-    threads = fetch_all_comment_threads(vid, max_total=limit)
+    return [row for page in stream_comments(link, limit, quota, max_workers) for row in page]
 
-    rows = []
-    for th in threads:
-        top = th["snippet"]["topLevelComment"]["snippet"]
-        rows.append({
-            "level": "top",
-            "comment_id": th["snippet"]["topLevelComment"]["id"],
-            "parent_id": None,
-            "author": top.get("authorDisplayName"),
-            "published_at": top.get("publishedAt"),
-            "updated_at": top.get("updatedAt"),
-            "text": top.get("textDisplay") or "",   
-        })
-
-        total_replies = th["snippet"].get("totalReplyCount", 0)
-        if total_replies:
-            parent_id = th["snippet"]["topLevelComment"]["id"]
-            partial = (th.get("replies", {}) or {}).get("comments", [])
-            have = {r["id"] for r in partial}
-            for r in partial:
-                rs = r["snippet"]
-                rows.append({
-                    "level": "reply",
-                    "comment_id": r["id"],
-                    "parent_id": parent_id,
-                    "author": rs.get("authorDisplayName"),
-                    "published_at": rs.get("publishedAt"),
-                    "updated_at": rs.get("updatedAt"),
-                    "text": rs.get("textDisplay") or "",
-                })
-            if len(have) < total_replies:
-                for r in fetch_all_replies(parent_id):
-                    if r["id"] in have: 
-                        continue
-                    rs = r["snippet"]
-                    rows.append({
-                        "level": "reply",
-                        "comment_id": r["id"],
-                        "parent_id": parent_id,
-                        "author": rs.get("authorDisplayName"),
-                        "published_at": rs.get("publishedAt"),
-                        "updated_at": rs.get("updatedAt"),
-                        "text": rs.get("textDisplay") or "",
-                    })
+def iter_comments_many(video_ids: list[str], limit: int = 100, max_workers: int = FETCH_WORKERS,
+                       quota: QuotaTracker | None = None):
+    """
+    Generator komentar beberapa video yang diambil bersamaan dengan thread pool terbatas.
+    Komentar tiap video dikeluarkan sesuai urutan `video_ids` begitu video itu (dan semua
+    video sebelumnya) selesai, sehingga pemanggil bisa mulai memproses video pertama
+    selagi video lain masih diambil.
+    
+    Args:
+        video_ids (list[str]): Daftar ID video.
+        limit (int): Batas maksimum komentar per video.
+        max_workers (int): Batas jumlah video yang diambil bersamaan untuk permintaan ini.
+        quota (QuotaTracker, optional): Penghitung kuota bersama untuk semua video.
+        
+    Yields:
+        list[dict]: Komentar satu video, sejajar dengan `video_ids`.
+    """
+    links = [f"https://www.youtube.com/watch?v={vid}" for vid in video_ids]
+    workers = max(1, min(max_workers, len(links)))
+    if workers == 1:
+        for link in links:
+            yield collect_comments(link, limit=limit, quota=quota)
+        return
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yt-fetch")
+    try:
+        yield from pool.map(lambda link: collect_comments(link, limit=limit, quota=quota), links)
+    finally:
+        pool.shutdown(cancel_futures=True)
 
-    if limit > 0 and len(rows) > limit:
-        rows = rows[:limit]
-    return rows
+def collect_comments_many(video_ids: list[str], limit: int = 100, max_workers: int = FETCH_WORKERS,
+                          quota: QuotaTracker | None = None) -> list[list[dict]]:
+    """
+    Mengumpulkan komentar beberapa video sekaligus dengan thread pool terbatas.
+    Setiap video tetap diambil oleh `collect_comments` (batas `limit` per video), dan
+    hasilnya dikembalikan sesuai urutan `video_ids`, sama seperti pengambilan berurutan.
+    
+    Args:
+        video_ids (list[str]): Daftar ID video.
+        limit (int): Batas maksimum komentar per video.
+        max_workers (int): Batas jumlah video yang diambil bersamaan untuk permintaan ini.
+        quota (QuotaTracker, optional): Penghitung kuota bersama untuk semua video.
+        
+    Returns:
+        list[list[dict]]: Komentar per video, sejajar dengan `video_ids`.
+    """
+    return list(iter_comments_many(video_ids, limit, max_workers, quota))
 
 def extract_channel_info(input_str: str):
     """
@@ -206,7 +417,7 @@ def extract_channel_info(input_str: str):
 
     return None, None
 
-def get_channel_uploads_playlist(identifier, id_type):
+def get_channel_uploads_playlist(identifier, id_type, quota=None):
     """
     Mendapatkan ID playlist 'Uploads' dari sebuah channel untuk mengambil video-videonya.
     Membutuhkan 1 Unit Biaya Kuota API.
@@ -214,17 +425,22 @@ def get_channel_uploads_playlist(identifier, id_type):
     Args:
         identifier (str): ID Channel atau Handle.
         id_type (str): Tipe identifier ('handle' atau 'channel_id').
+        quota (QuotaTracker, optional): Penghitung kuota analisis.
         
     Returns:
         str | None: ID Playlist Uploads jika ditemukan.
     """
     try:
         if id_type == "handle":
+            if quota is not None:
+                quota.record(endpoint="channels")
             resp = youtube.channels().list(
                 part="contentDetails",
                 forHandle=identifier
             ).execute()
         elif id_type == "channel_id":
+            if quota is not None:
+                quota.record(endpoint="channels")
             resp = youtube.channels().list(
                 part="contentDetails",
                 id=identifier
@@ -240,7 +456,7 @@ def get_channel_uploads_playlist(identifier, id_type):
         print(f"Error fetching channel: {e}")
         return None
 
-def get_videos_from_playlist(playlist_id, limit=5):
+def get_videos_from_playlist(playlist_id, limit=5, quota=None):
     """
     Mengambil daftar ID video dari playlist tertentu.
     Membutuhkan 1 Unit Biaya Kuota API.
@@ -248,12 +464,15 @@ def get_videos_from_playlist(playlist_id, limit=5):
     Args:
         playlist_id (str): ID Playlist.
         limit (int): Jumlah maksimum video yang diambil.
+        quota (QuotaTracker, optional): Penghitung kuota analisis.
         
     Returns:
         list: Daftar Video ID.
     """
     video_ids = []
     try:
+        if quota is not None:
+            quota.record(endpoint="playlistItems")
         resp = youtube.playlistItems().list(
             part="contentDetails",
             playlistId=playlist_id,
@@ -318,7 +537,7 @@ def get_my_latest_videos(yt_creds, limit=6):
         return []
 
 
-def get_channel_info(identifier, id_type):
+def get_channel_info(identifier, id_type, quota=None):
     """
     Mengambil informasi dasar channel seperti nama, avatar, dan statistik.
     Membutuhkan 1 Unit Biaya Kuota API.
@@ -326,17 +545,22 @@ def get_channel_info(identifier, id_type):
     Args:
         identifier (str): ID Channel atau Handle.
         id_type (str): Tipe identifier.
+        quota (QuotaTracker, optional): Penghitung kuota analisis.
         
     Returns:
         dict | None: Informasi channel atau None jika gagal.
     """
     try:
         if id_type == "handle":
+            if quota is not None:
+                quota.record(endpoint="channels")
             resp = youtube.channels().list(
                 part="snippet",
                 forHandle=identifier
             ).execute()
         elif id_type == "channel_id":
+            if quota is not None:
+                quota.record(endpoint="channels")
             resp = youtube.channels().list(
                 part="snippet",
                 id=identifier
@@ -362,18 +586,21 @@ def get_channel_info(identifier, id_type):
         return None
 
 
-def get_video_info(video_id):
+def get_video_info(video_id, quota=None):
     """
     Mengambil informasi detail tentang sebuah video.
     Membutuhkan 1 Unit Biaya Kuota API.
     
     Args:
         video_id (str): ID Video.
+        quota (QuotaTracker, optional): Penghitung kuota analisis.
         
     Returns:
         dict | None: Informasi video atau None jika gagal.
     """
     try:
+        if quota is not None:
+            quota.record(endpoint="videos")
         resp = youtube.videos().list(
             part="snippet",
             id=video_id
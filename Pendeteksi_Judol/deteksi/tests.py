@@ -1,3 +1,1003 @@
-from django.test import TestCase
+import csv
+import difflib
+import json
+import random
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import unicodedata
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
 
-# Create your tests here.
+import numpy as np
+from django.test import SimpleTestCase
+
+from deteksi.ml import preprocess as pp
+from deteksi.ml import cache as text_cache
+from deteksi.ml import cascade
+from deteksi.ml import predict
+from deteksi.ml.brand import AhoCorasick, BrandMatcher
+from deteksi.ml.cache import DjangoTextCache, LRUTextCache, text_key
+from deteksi.ml.calibration import Calibrator, fit_calibrator
+from deteksi.ml.compact import prune_pipeline, write_compact_model
+from deteksi.ml.evaluation import classification_metrics
+from deteksi.ml.explain import ModelExplainer
+from deteksi.ml.fuzzy import DomainMatcher
+from deteksi.ml.hashing import build_hashing_pipeline
+from deteksi.ml.lexicon import CompiledLexicon, LexiconStore, write_lexicon
+from deteksi.ml.linear_scorer import LinearScorer
+from deteksi.ml.registry import ModelRegistry
+from deteksi.ml.shadow import ShadowScorer
+from deteksi.ml.shared_model import MmapVocabulary, export_shared_model, load_shared_pipeline
+from deteksi.ml.thresholds import ThresholdPolicy
+from deteksi import utils as deteksi_utils
+from deteksi.services import comment_processing as cp
+from deteksi.services import youtube as yt
+
+DATASET_PATH = Path(__file__).resolve().parent.parent / "dataset" / "dataset_training.csv"
+
+
+def _legacy_preprocess(text):
+    """Rantai preprocessing per karakter sebelum tahap normalisasi dikompilasi."""
+    if not isinstance(text, str) or not text:
+        return ""
+    text = pp.normalize_emoji_text(text)
+    text = pp.normalize_chars(text)
+    text = pp.normalize_punct(text)
+    text = pp.remove_urls_mentions_hashtags(text)
+    text = pp.remove_timestamps(text)
+    text = pp.remove_bracket(text)
+    text = pp.handle_intraword_symbols(text)
+    text = pp.strip_symbol_chars(text)
+    text = pp.safe_unidecode(text)
+    text = text.lower()
+    text = pp.keep_alnum_and_space(text)
+    text = pp.squeeze_spaces(text)
+    tokens = pp.rejoin_split_letters(text.split())
+    tokens = pp.normalize_plesetan(tokens)
+    return " ".join(tokens)
+
+
+def _current_umask():
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def _synthetic_corpus(n, seed=1234):
+    """Teks acak yang sengaja memuat homoglyph, emoji huruf, tanda gabung, dan karakter kontrol."""
+    rng = random.Random(seed)
+    pools = [
+        "abcdefghijklmnopqrstuvwxyz0123456789 ",
+        "".join(pp.HOMO_MAP),
+        "".join(chr(cp) for cp in range(0x1F1E6, 0x1F200)),
+        "".join(chr(cp) for cp in range(0x1F100, 0x1F1AE)),
+        "".join(chr(cp) for cp in range(0x2460, 0x24FF)),
+        "".join(chr(cp) for cp in range(0x1D400, 0x1D800)),
+        "".join(chr(cp) for cp in range(0xFF01, 0xFF5F)),
+        "".join(chr(cp) for cp in range(0x0300, 0x0370)),
+        "".join(chr(cp) for cp in range(0x1100, 0x1200)),
+        "".join(chr(cp) for cp in range(0x0980, 0x0A00)),
+        "".join(chr(cp) for cp in range(0x1B00, 0x1B80)),
+        "".join(chr(cp) for cp in range(0x00A0, 0x0250)),
+        "⃣️​‍–—’ʼ\t\n\r\x1c\x85　 †‡",
+        "@#:;/.,-_!?()[]{}<>=+\"'$%^&*~|\\",
+        "".join(chr(cp) for cp in range(0x1D165, 0x1D173)) + "〮〯᛿0᭄",
+    ]
+    out = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            pool = rng.choice(pools)
+            parts.append("".join(rng.choice(pool) for _ in range(rng.randint(1, 6))))
+        out.append("".join(parts))
+    return out
+
+
+class CompiledNormalizerTests(SimpleTestCase):
+    """Uji diferensial: tabel normalisasi terkompilasi harus identik dengan rantai lama."""
+
+    def assertSameAsLegacy(self, texts):
+        for text in texts:
+            self.assertEqual(pp.preprocess(text), _legacy_preprocess(text), msg=repr(text))
+
+    def test_dataset_corpus(self):
+        with open(DATASET_PATH, encoding="utf-8") as f:
+            texts = [row["text"] for row in csv.DictReader(f)]
+        self.assertGreater(len(texts), 10_000)
+        self.assertSameAsLegacy(texts)
+
+    def test_synthetic_unicode_corpus(self):
+        self.assertSameAsLegacy(_synthetic_corpus(20_000))
+
+    def test_every_bmp_character(self):
+        chars = [chr(cp) for cp in range(0x10000) if not 0xD800 <= cp <= 0xDFFF]
+        self.assertSameAsLegacy(["a" + ch + "b" for ch in chars])
+
+    def test_ascii_fast_path(self):
+        rng = random.Random(7)
+        texts = ["".join(chr(rng.randrange(128)) for _ in range(rng.randint(1, 40))) for _ in range(20_000)]
+        pp.reset_preprocess_stats()
+        self.assertSameAsLegacy(texts)
+        self.assertEqual(pp.get_preprocess_stats()["ascii"], len(texts))
+
+    def test_stages_match_per_character_chain(self):
+        texts = _synthetic_corpus(5_000, seed=99)
+        texts += [chr(cp) + "x" for cp in range(0x20000) if not 0xD800 <= cp <= 0xDFFF]
+        for text in texts:
+            legacy = pp.normalize_punct(pp.normalize_chars(pp.normalize_emoji_text(text)))
+            self.assertEqual(pp.normalize_unicode_fast(text), legacy, msg=repr(text))
+            legacy = pp.safe_unidecode(pp.strip_symbol_chars(text)).lower()
+            self.assertEqual(pp.fold_to_ascii(text), legacy, msg=repr(text))
+
+
+class PreprocessManyTests(SimpleTestCase):
+    """preprocess_many harus sejajar dengan preprocess per teks, paralel maupun serial."""
+
+    def setUp(self):
+        self.texts = _synthetic_corpus(pp.PARALLEL_MIN_BATCH * 3, seed=5) + ["", "Slot GACOR 88!!"]
+
+    def tearDown(self):
+        pp._reset_pool()
+
+    def test_parallel_preserves_order(self):
+        self.assertEqual(pp.preprocess_many(self.texts, workers=2), [pp.preprocess(t) for t in self.texts])
+        self.assertEqual(pp._POOL_WORKERS, 2)
+
+    def test_serial_fallback(self):
+        pp._reset_pool()
+        expected = [pp.preprocess(t) for t in self.texts]
+        self.assertEqual(pp.preprocess_many(self.texts, workers=1), expected)
+        self.assertEqual(pp.preprocess_many(self.texts[:10], workers=4), expected[:10])
+        self.assertIsNone(pp._POOL)
+
+    def test_gunicorn_default_uses_pool(self):
+        saved = pp.PREPROCESS_WORKERS, os.environ.get("WEB_CONCURRENCY"), sys.modules.get("gunicorn")
+        sys.modules.setdefault("gunicorn", saved[2] or type(sys)("gunicorn"))
+        os.environ["WEB_CONCURRENCY"] = "2"
+        try:
+            self.assertEqual(pp.default_workers(cpus=8), 4)
+            self.assertEqual(pp.default_workers(cpus=2), 1)
+            pp.PREPROCESS_WORKERS = pp.default_workers(cpus=4)
+            pp._reset_pool()
+            self.assertEqual(pp.preprocess_many(self.texts[:10]), [pp.preprocess(t) for t in self.texts[:10]])
+            self.assertIsNone(pp._POOL)
+            self.assertEqual(pp.preprocess_many(self.texts), [pp.preprocess(t) for t in self.texts])
+            self.assertEqual(pp._POOL_WORKERS, 2)
+        finally:
+            pp.PREPROCESS_WORKERS = saved[0]
+            if saved[1] is None:
+                os.environ.pop("WEB_CONCURRENCY", None)
+            else:
+                os.environ["WEB_CONCURRENCY"] = saved[1]
+            if saved[2] is None:
+                sys.modules.pop("gunicorn", None)
+
+    def test_broken_pool_fallback(self):
+        class _BrokenPool:
+            def map(self, fn, chunks):
+                raise BrokenProcessPool("worker mati")
+
+        orig = pp._get_pool
+        pp._get_pool = lambda workers: _BrokenPool()
+        try:
+            out = pp.preprocess_many(self.texts, workers=2)
+        finally:
+            pp._get_pool = orig
+        self.assertEqual(out, [pp.preprocess(t) for t in self.texts])
+        self.assertIsNone(pp._POOL)
+
+
+class DomainMatcherTests(SimpleTestCase):
+    """DomainMatcher harus memberi rasio terbaik yang sama dengan difflib, termasuk seri dan cutoff."""
+
+    def assertSameAsDifflib(self, matcher, queries, cutoffs=(0.0, 0.6, 0.8)):
+        # get_close_matches menskor SequenceMatcher(None, kandidat, query), sedangkan DomainMatcher
+        # (seperti perulangan aslinya) SequenceMatcher(None, query, kandidat). Rasio keduanya bisa
+        # berbeda, jadi pembanding get_close_matches hanya dipakai bila rasionya simetris.
+        compared = 0
+        for query in queries:
+            ratios = [difflib.SequenceMatcher(None, query, w).ratio() for w in matcher.words]
+            symmetric = ratios == [difflib.SequenceMatcher(None, w, query).ratio() for w in matcher.words]
+            top = max(ratios, default=0.0)
+            for cutoff in cutoffs:
+                best, ratio = matcher.best_match(query, cutoff)
+                if top > 0.0 and top >= cutoff:
+                    # Pada rasio seri yang menang kandidat paling awal di `words`.
+                    self.assertEqual((best, ratio), (matcher.words[ratios.index(top)], top), (query, cutoff))
+                else:
+                    self.assertTrue(best is None or ratio < cutoff, (query, cutoff))
+                if not (symmetric and cutoff):
+                    continue
+                compared += 1
+                close = difflib.get_close_matches(query, matcher.words, n=1, cutoff=cutoff)
+                if top >= cutoff:
+                    # Seri di get_close_matches dipecah dengan string terbesar, jadi bandingkan rasionya.
+                    self.assertEqual(ratios[matcher.words.index(close[0])], ratio, (query, cutoff))
+                else:
+                    self.assertEqual(close, [], (query, cutoff))
+        return compared
+
+    def test_random_words(self):
+        rng = random.Random(2024)
+        # Alfabet kecil agar rasio seri sering terjadi.
+        make = lambda: "".join(rng.choice("abcdg01") for _ in range(rng.randint(1, 7)))
+        matcher = DomainMatcher([make() for _ in range(300)])
+        self.assertGreater(self.assertSameAsDifflib(matcher, [make() for _ in range(400)] + [""]), 100)
+
+    def test_domain_words(self):
+        rng = random.Random(7)
+        words = pp._DOMAIN_MATCHER.words
+        queries = []
+        for w in words * 3:
+            chars = list(w)
+            chars[rng.randrange(len(chars))] = rng.choice("aeiou0123")
+            queries.append("".join(chars))
+        self.assertGreater(self.assertSameAsDifflib(pp._DOMAIN_MATCHER, queries), 20)
+
+    def test_large_dictionary_uses_index(self):
+        rng = random.Random(88)
+        make = lambda: "".join(rng.choice("bcdghjklmnprstwy") + rng.choice("aeiou") for _ in range(rng.randint(3, 5)))
+        matcher = DomainMatcher([make() for _ in range(5000)])
+        queries = []
+        for _ in range(40):
+            chars = list(rng.choice(matcher.words))
+            chars[rng.randrange(len(chars))] = rng.choice("aeiou0123")
+            queries.append("".join(chars))
+        queries += [make() for _ in range(20)]
+        sizes = []
+        for query in queries:
+            ratios = [difflib.SequenceMatcher(None, query, w).ratio() for w in matcher.words]
+            top = max(ratios)
+            best, ratio = matcher.best_match(query, 0.8)
+            if top >= 0.8:
+                self.assertEqual((best, ratio), (matcher.words[ratios.index(top)], top), query)
+            else:
+                self.assertTrue(best is None or ratio < 0.8, query)
+            ids = matcher.candidates(query, 0.8)
+            # Setiap kata yang mencapai cutoff harus lolos prefilter.
+            self.assertLessEqual({i for i, r in enumerate(ratios) if r >= 0.8}, set(ids.tolist()), query)
+            sizes.append(len(ids))
+        # Hanya segelintir dari ribuan kata yang sampai ke SequenceMatcher.
+        self.assertLess(sum(sizes) / len(sizes), 0.01 * len(matcher))
+
+    def test_includes_brand_terms(self):
+        words = pp._DOMAIN_MATCHER.words
+        self.assertLessEqual(set(pp.DOMAIN_WORDS), set(words))
+        self.assertIn("arwanatoto", words)
+        self.assertNotIn("aero88", words)
+        self.assertEqual(pp.fix_infix_digits_with_domain("arw4natoto"), "arwanatoto")
+        self.assertEqual(pp.fix_infix_digits_with_domain("pul4uwin"), "pulauwin")
+
+    def test_tie_prefers_earliest(self):
+        matcher = DomainMatcher(["ab", "ba"])
+        self.assertEqual(matcher.best_match("a"), ("ab", 2 / 3))
+        self.assertEqual(difflib.get_close_matches("a", matcher.words, n=1, cutoff=0.6), ["ba"])
+        self.assertEqual(DomainMatcher(["ba", "ab"]).best_match("a"), ("ba", 2 / 3))
+        self.assertEqual(matcher.best_match("zz"), (None, 0.0))
+        self.assertEqual(DomainMatcher([]).best_match("a"), (None, 0.0))
+
+
+class TextCacheTests(SimpleTestCase):
+    """Cache teks bersih: eviksi LRU per entri dan per byte, penghitung, dan adapter Django."""
+
+    def test_lru_evicts_by_entries(self):
+        cache = LRUTextCache(max_entries=3, max_bytes=1 << 20)
+        cache.set_many({"a": "1", "b": "2", "c": "3"})
+        self.assertEqual(cache.get_many(["a"]), {"a": "1"})
+        cache.set_many({"d": "4"})
+        # "b" yang paling lama tidak dipakai ("a" baru saja dibaca).
+        self.assertEqual(cache.get_many(["a", "b", "c", "d"]), {"a": "1", "c": "3", "d": "4"})
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["evictions"], stats["hits"], stats["misses"]), (3, 1, 4, 1))
+
+    def test_lru_evicts_by_bytes(self):
+        value = "x" * 100
+        size = text_cache._entry_size("k1", value)
+        cache = LRUTextCache(max_entries=100, max_bytes=size * 2)
+        cache.set_many({"k1": value, "k2": value})
+        self.assertEqual(cache.stats()["bytes"], size * 2)
+        cache.set_many({"k3": ("bersih", 0.5)})
+        self.assertEqual(set(cache.get_many(["k1", "k2", "k3"])), {"k2", "k3"})
+        # Menimpa kunci yang sama tidak menghitung ukurannya dua kali.
+        cache.set_many({"k3": ("bersih", 0.5)})
+        self.assertEqual(cache.stats()["bytes"], size + text_cache._entry_size("k3", ("bersih", 0.5)))
+        # Entri yang lebih besar dari batas tidak pernah tertahan.
+        cache.set_many({"besar": "y" * (size * 3)})
+        self.assertEqual(cache.stats()["entries"], 0)
+        cache.clear()
+        self.assertEqual(cache.stats(), {"backend": "lru", "hits": 0, "misses": 0, "evictions": 0, "entries": 0,
+                                         "bytes": 0})
+
+    def test_django_adapter(self):
+        cache = DjangoTextCache(alias="default", timeout=60, prefix="judol_text_uji")
+        key = text_key("Slot GACOR")
+        self.assertEqual(cache.get_many([key]), {})
+        cache.set_many({key: ("slot gacor", 0.9)})
+        cache.set_many({})
+        self.assertEqual(cache.get_many([key, text_key("lain")]), {key: ("slot gacor", 0.9)})
+        self.assertEqual(cache.stats(), {"backend": "django:default", "hits": 1, "misses": 2})
+        # Prefix memisahkan isi cache bersama.
+        self.assertEqual(DjangoTextCache(prefix="judol_text_lain").get_many([key]), {})
+        cache.clear()
+        self.assertEqual(cache.stats()["hits"], 0)
+        self.assertEqual(cache.get_many([key]), {key: ("slot gacor", 0.9)})
+        self.assertEqual(len(key), 32)
+        self.assertNotEqual(key, text_key("slot gacor"))
+
+
+class EmojiMapTests(SimpleTestCase):
+    """Tabel EMOJI_MAP hasil generate harus sama dengan aturan berbasis nama Unicode."""
+
+    def test_table_matches_name_based_rule(self):
+        if pp.EMOJI_MAP_UNICODE_VERSION != unicodedata.unidata_version:
+            self.skipTest("EMOJI_MAP dibangkitkan untuk versi Unicode lain")
+        for cp in range(sys.maxunicode + 1):
+            if 0xD800 <= cp <= 0xDFFF:
+                continue
+            ch = chr(cp)
+            self.assertEqual(pp.emoji_letter_digit_to_ascii(ch), pp.emoji_char_to_ascii(ch), msg=hex(cp))
+
+
+class BrandMatcherTests(SimpleTestCase):
+    """Automaton Aho–Corasick harus menemukan kecocokan yang sama dengan pencarian naif."""
+
+    def test_automaton_matches_naive_search(self):
+        rng = random.Random(8)
+        patterns = ["he", "she", "his", "hers", "a", "aa", "abab", "bab"] + [
+            "".join(rng.choice("abhsre") for _ in range(rng.randint(1, 6))) for _ in range(50)
+        ]
+        ac = AhoCorasick(patterns)
+        for _ in range(300):
+            text = "".join(rng.choice("abhsre ") for _ in range(rng.randint(0, 40)))
+            expected = sorted(
+                (i + len(p), pid)
+                for pid, p in enumerate(ac.patterns)
+                for i in range(len(text) - len(p) + 1)
+                if text.startswith(p, i)
+            )
+            self.assertEqual(sorted(ac.iter_matches(text)), expected, msg=text)
+
+    def test_short_terms_match_whole_tokens_only(self):
+        matcher = BrandMatcher([("pulauwin", "brand"), ("jp", "istilah"), ("depo", "istilah")])
+        self.assertEqual(matcher.find("main di kerenpulauwin langsung jp"), ["pulauwin", "jp"])
+        self.assertEqual(matcher.find("foto jpeg dari depok"), [])
+        self.assertTrue(matcher.has_category("mampir pulauwin"))
+        self.assertFalse(matcher.has_category("depo dulu"))
+
+
+class CompiledLexiconTests(SimpleTestCase):
+    """File .lex harus berperilaku seperti dict sumbernya dan bisa ditukar saat runtime."""
+
+    def test_roundtrip(self):
+        rng = random.Random(9)
+        words = {"".join(rng.choice("abcdé2") for _ in range(rng.randint(1, 8))) for _ in range(2000)}
+        with tempfile.TemporaryDirectory() as tmp:
+            for kind, entries in [
+                ("str", {w: w.upper() for w in words}),
+                ("int", {w: i for i, w in enumerate(sorted(words))}),
+                ("none", dict.fromkeys(words)),
+            ]:
+                lex = CompiledLexicon(write_lexicon(os.path.join(tmp, f"{kind}.lex"), entries, kind))
+                self.assertEqual(len(lex), len(entries))
+                self.assertEqual(dict(lex.items()), entries)
+                self.assertNotIn("tidakada", lex)
+                self.assertEqual(lex.get("tidakada", "x"), "x")
+                lex.close()
+            # File terbit dengan izin biasa, bukan 0600 bawaan mkstemp.
+            self.assertEqual(os.stat(os.path.join(tmp, "str.lex")).st_mode & 0o777, 0o644 & ~_current_umask())
+
+    def test_hot_reload_swaps_reference(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            write_lexicon(os.path.join(tmp, "uji.lex"), {"gacor": "gacor"})
+            store = LexiconStore(tmp, poll_interval=0, auto_compile=False)
+            old = store.get("uji")
+            write_lexicon(os.path.join(tmp, "uji.lex"), {"gacor": "gacor", "maxwin": "maxwin"})
+            new = store.get("uji")
+            self.assertIsNot(old, new)
+            self.assertIn("maxwin", new)
+            self.assertNotIn("maxwin", old)
+            self.assertIs(store.get("uji"), new)
+
+
+class SlangMapTests(SimpleTestCase):
+    """Kamus alay gabungan harus cocok dengan bentuk token hasil preprocess dan tidak menghapus sinyal judi."""
+
+    def test_sanitized_and_applied(self):
+        slang = pp.build_slang_map()
+        self.assertTrue(slang)
+        for key, value in slang.items():
+            self.assertRegex(key, r"^[a-z0-9]+$")
+            self.assertEqual(key, pp.squeeze_repeats(key))
+            self.assertNotEqual(key, value)
+        self.assertNotIn("bet", slang)
+        self.assertEqual(pp.normalize_plesetan(["bgt", "gacor"], slang), ["banget", "gacor"])
+        self.assertEqual(pp.normalize_plesetan(["bgt"], pp.MappingProxyType({})), ["bgt"])
+
+
+class ModelRegistryTests(SimpleTestCase):
+    """Pergantian model lewat file penunjuk tidak boleh memblokir pemanggil `active()`."""
+
+    def test_pointer_switch_swaps_in_background(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = ModelRegistry(pointer=os.path.join(tmp, "ACTIVE"), poll_interval=0)
+            registry.set_pointer("v13")
+            self.assertEqual(os.stat(registry.pointer).st_mode & 0o777, 0o644 & ~_current_umask())
+            if os.environ.get("JUDOL_MODEL"):
+                self.skipTest("JUDOL_MODEL mengalahkan file penunjuk")
+            old = registry.preload()
+            self.assertEqual(old.name, "v13")
+
+            registry.set_pointer("v14")
+            self.assertIs(registry.active(), old)
+            deadline = time.monotonic() + 30
+            while registry.active().name != "v14" and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assertEqual(registry.active().name, "v14")
+            self.assertEqual(old.name, "v13")
+            self.assertIn("v16", [i.name for i in registry.available()])
+
+    def test_failed_swap_is_retried(self):
+        if os.environ.get("JUDOL_MODEL"):
+            self.skipTest("JUDOL_MODEL mengalahkan file penunjuk")
+        source = ModelRegistry().path_for("v13")
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = ModelRegistry(model_dir=tmp, pointer=os.path.join(tmp, "ACTIVE"), poll_interval=0,
+                                     shared=False)
+            os.symlink(source, registry.path_for("v13"))
+            registry.set_pointer("v13")
+            registry.preload()
+
+            # Penunjuk ke model yang belum ada: swap gagal, model lama tetap aktif.
+            Path(registry.pointer).write_text("v99\n", encoding="utf-8")
+            registry.active()
+            deadline = time.monotonic() + 30
+            while registry._swapping and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assertEqual(registry.active().name, "v13")
+
+            # File penunjuk tidak berubah, tetapi model kini tersedia: pemeriksaan berikutnya berhasil.
+            os.symlink(source, registry.path_for("v99"))
+            while registry.active().name != "v99" and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assertEqual(registry.active().name, "v99")
+
+
+class SharedModelTests(SimpleTestCase):
+    """Pipeline dari ekspor mmap harus memberi probabilitas yang sama persis dengan joblib aslinya."""
+
+    def test_export_matches_original(self):
+        model = ModelRegistry(shared=False).load("v13")
+        with open(DATASET_PATH, encoding="utf-8") as f:
+            texts = [pp.preprocess(r["text"]) for r, _ in zip(csv.DictReader(f), range(300))]
+        with tempfile.TemporaryDirectory() as tmp:
+            pipeline, _ = load_shared_pipeline(export_shared_model(model, tmp))
+            self.assertEqual(
+                model.pipeline.predict_proba(texts).tolist(), pipeline.predict_proba(texts).tolist()
+            )
+            vocab = pipeline.named_steps["features"].transformer_list[0][1].vocabulary_
+            self.assertIsInstance(vocab, MmapVocabulary)
+            self.assertEqual(dict(pickle.loads(pickle.dumps(vocab)).items()), dict(vocab.items()))
+            # LinearScorer memakai view mmap yang sama, bukan salinan per worker.
+            scorer = LinearScorer.from_pipeline(pipeline, "v13")
+            union = pipeline.named_steps["features"].transformer_list
+            coef = pipeline.named_steps["clf"].coef_
+            for block, (_, vect) in zip(scorer.blocks, union):
+                self.assertTrue(np.shares_memory(block.idf, vect.idf_))
+                self.assertTrue(np.shares_memory(block.weights, coef))
+            expected = pipeline.predict_proba(texts)
+            self.assertLess(abs(scorer.predict_proba(texts) - expected).max(), 1e-12)
+            self.assertLess(abs(scorer.predict_proba(texts[:3]) - expected[:3]).max(), 1e-12)
+
+
+class LinearScorerTests(SimpleTestCase):
+    """LinearScorer harus mereproduksi predict_proba pipeline, baik per teks maupun batch."""
+
+    def test_matches_pipeline(self):
+        with open(DATASET_PATH, encoding="utf-8") as f:
+            texts = [pp.preprocess(r["text"]) for r, _ in zip(csv.DictReader(f), range(400))] + ["", "a"]
+        registry = ModelRegistry(linear_scorer=False)
+        for name in ("v16", "v20_gabungan"):
+            pipe = registry.load(name).pipeline
+            scorer = LinearScorer.from_pipeline(pipe, name)
+            expected = pipe.predict_proba(texts)
+            self.assertLess(abs(scorer.predict_proba(texts) - expected).max(), 1e-12)
+            self.assertLess(abs(scorer.predict_proba(texts[:3]) - expected[:3]).max(), 1e-12)
+
+
+class CascadeTests(SimpleTestCase):
+    """Tahap kamus hanya memutuskan kasus yang jelas; sisanya diserahkan ke model."""
+
+    def test_decisions_and_stats(self):
+        stage = cascade.get_lexicon_stage()
+        self.assertEqual(stage.decide("main di pulauwin pasti maxwin"), 1)
+        self.assertEqual(stage.decide("lagu ini bagus banget"), 0)
+        self.assertIsNone(stage.decide("ga ru da ho ki"))
+        self.assertIsNone(stage.decide("mampir ke voliad"))
+        self.assertIsNone(stage.decide("lagu ini bagus banget", mode="positive"))
+
+        cascade.reset_cascade_stats()
+        decided, remaining = cascade.split_by_stage(["lagu ini bagus banget", "mampir ke voliad"], mode="both")
+        self.assertEqual(decided, {"lagu ini bagus banget": 0.0})
+        self.assertEqual(remaining, ["mampir ke voliad"])
+        stats = cascade.get_cascade_stats()
+        self.assertEqual((stats["lexicon_negative"], stats["model"]), (1, 1))
+        with self.assertRaises(ValueError):
+            cascade.split_by_stage([], mode="semua")
+
+    def test_lexicons_fetched_per_batch(self):
+        # Leksikon yang di-hot-reload langsung dipakai oleh stage yang sudah dibangun.
+        stage = cascade.get_lexicon_stage()
+        orig = cascade.get_lexicon
+        try:
+            cascade.get_lexicon = lambda name: frozenset()
+            self.assertEqual(cascade.split_by_stage(["qwzx bagus"], mode="negative"), ({}, ["qwzx bagus"]))
+            cascade.get_lexicon = lambda name: frozenset({"qwzx", "bagus"})
+            self.assertEqual(cascade.split_by_stage(["qwzx bagus"], mode="negative"), ({"qwzx bagus": 0.0}, []))
+        finally:
+            cascade.get_lexicon = orig
+        self.assertIs(cascade.get_lexicon_stage(), stage)
+
+
+class ModelExplainerTests(SimpleTestCase):
+    """Kontribusi batch harus sama dengan perhitungan per fitur dari transform FeatureUnion."""
+
+    def test_matches_union_transform(self):
+        pipe = ModelRegistry(shared=False).load("v13").pipeline
+        texts = ["slot gacor maxwin hari ini", "lagu ini bagus banget kak", ""]
+        explained = ModelExplainer(pipe).explain_many(texts)
+
+        union = pipe.named_steps["features"]
+        names = union.get_feature_names_out()
+        coefs = pipe.named_steps["clf"].coef_[0]
+        X = union.transform(texts).tocsr()
+        for i, feats in enumerate(explained):
+            row = X[i]
+            expected = {
+                names[j].replace("word__", ""): v * coefs[j]
+                for j, v in zip(row.indices, row.data) if names[j].startswith("word__")
+            }
+            self.assertEqual({f["feature"] for f in feats}, set(expected))
+            for f in feats:
+                self.assertAlmostEqual(f["contribution"], expected[f["feature"]], places=12)
+            contribs = [abs(f["contribution"]) for f in feats]
+            self.assertEqual(contribs, sorted(contribs, reverse=True))
+        self.assertEqual(explained[2], [])
+
+
+class BatchPredictTests(SimpleTestCase):
+    """predict_comments harus sama dengan predict_comment per baris, termasuk duplikat dan teks kosong."""
+
+    def test_batch_matches_single(self):
+        with open(DATASET_PATH, encoding="utf-8") as f:
+            texts = [r["text"] for r, _ in zip(csv.DictReader(f), range(150))]
+        texts += ["", "   ", None, "!!!", texts[0], texts[3].upper(), texts[3], ""]
+        rng = random.Random(11)
+        rng.shuffle(texts)
+        text_cache.get_text_cache().clear()
+        batch = predict.predict_comments(texts)
+        self.assertEqual(len(batch), len(texts))
+        text_cache.get_text_cache().clear()
+        for text, row in zip(texts, batch):
+            single = predict.predict_comment(text)
+            self.assertEqual(set(row), set(single))
+            self.assertEqual((row["label"], row["clean"], row["brands"], row["unsure"]),
+                             (single["label"], single["clean"], single["brands"], single["unsure"]), repr(text))
+            self.assertAlmostEqual(row["proba"], single["proba"], places=12)
+        empty = predict.predict_comment("")
+        self.assertEqual((empty["label"], empty["proba"], empty["clean"]), (0, 0.0, ""))
+        self.assertEqual(predict.predict_comments([]), [])
+
+
+class ExplainConsistencyTests(SimpleTestCase):
+    """Modal detail memakai kaskade dan ambang per sumber yang sama dengan baris tabel."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        path = Path(self._tmp.name) / "thresholds.json"
+        path.write_text(json.dumps({"channels": {"UCx": {"threshold": 0.99}}}), encoding="utf-8")
+        self._policy = ThresholdPolicy(path, poll_interval=0)
+        self._orig = predict.get_threshold_policy, cascade.CASCADE_MODE
+        predict.get_threshold_policy = lambda: self._policy
+        cascade.CASCADE_MODE = "both"
+
+    def tearDown(self):
+        predict.get_threshold_policy, cascade.CASCADE_MODE = self._orig
+        self._tmp.cleanup()
+
+    def test_matches_predict_comments(self):
+        texts = ["main di pulauwin pasti maxwin", "slot gacor maxwin hari ini", "lagu ini bagus banget kak", ""]
+        for channel_id in (None, "UCx"):
+            rows = predict.predict_comments(texts, channel_id=channel_id, video_id="vid1")
+            explained = predict.explain_comments(texts, channel_id=channel_id, video_id="vid1")
+            for row, exp in zip(rows, explained):
+                self.assertEqual(exp["label"], row["label"], (channel_id, exp["text"]))
+                self.assertAlmostEqual(exp.get("proba_judol", 0.0), row["proba"], places=12)
+        self.assertEqual(predict.predict_and_explain(texts[0], channel_id="UCx")["proba_judol"], 1.0)
+        self.assertEqual(predict.predict_and_explain(texts[1], channel_id="UCx")["label"],
+                         int(predict.predict_and_explain(texts[1])["proba_judol"] >= 0.99))
+
+    def test_shadow_gets_model_scored_texts(self):
+        submitted = []
+
+        class _Shadow:
+            def submit(self, production, probas, production_ms, threshold):
+                submitted.append((dict(probas), threshold))
+
+        orig = predict.get_shadow
+        predict.get_shadow = lambda: _Shadow()
+        try:
+            texts = ["main di pulauwin pasti maxwin bosku", "mampir ke voliad bosku", "lagu ini bagus banget bosku"]
+            predict.predict_comments(texts, channel_id="UCx")
+        finally:
+            predict.get_shadow = orig
+        cleans = [pp.preprocess(t) for t in texts]
+        decided, remaining = cascade.split_by_stage(cleans)
+        self.assertTrue(decided and remaining)
+        self.assertEqual([(sorted(p), thr) for p, thr in submitted], [(sorted(remaining), 0.99)])
+
+
+class CompactModelTests(SimpleTestCase):
+    """Model ringkas harus bisa dimuat registry dan tetap memberi prediksi yang wajar."""
+
+    def test_prune_and_load(self):
+        model = ModelRegistry(shared=False, linear_scorer=False).load("v13")
+        texts = ["slot gacor maxwin hari ini", "lagu ini bagus banget kak", "depo 10rb wd 500rb"]
+        same = prune_pipeline(model.pipeline, 0.0)
+        self.assertEqual(same.predict_proba(texts).tolist(), model.pipeline.predict_proba(texts).tolist())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            name, _, pipeline = write_compact_model(model, 0.05, "int8", model_dir=tmp)
+            loaded = ModelRegistry(model_dir=tmp, shared=False).load(name)
+            clf = loaded.pipeline.named_steps["clf"]
+            self.assertEqual(clf.coef_.dtype.name, "float64")
+            self.assertLess(clf.coef_.shape[1], model.pipeline.named_steps["clf"].coef_.shape[1])
+            self.assertEqual(loaded.meta["compact"]["source"], "v13")
+            expected = pipeline.predict_proba(texts)[:, 1]
+            self.assertLess(abs(expected - loaded.proba_positive(texts)).max(), 1e-12)
+            self.assertEqual(list(pipeline.predict(texts)), [1, 0, 1])
+
+
+class HashingModelTests(SimpleTestCase):
+    """Pipeline hashing harus bisa dilatih, dijelaskan, dan tetap tanpa vocabulary."""
+
+    def test_train_and_explain(self):
+        with open(DATASET_PATH, encoding="utf-8") as f:
+            rows = [r for r, _ in zip(csv.DictReader(f), range(600))]
+        texts = [pp.preprocess(r["text"]) for r in rows]
+        pipe = build_hashing_pipeline(n_features=2 ** 12).fit(texts, [int(r["label"]) for r in rows])
+        self.assertFalse(any(hasattr(v, "vocabulary_") for _, v in pipe.named_steps["features"].transformer_list))
+
+        doc = "slot gacor maxwin hari ini"
+        feats = ModelExplainer(pipe).explain_many([doc])[0]
+        analyzer = pipe.named_steps["features"].transformer_list[0][1].steps[0][1].build_analyzer()
+        names = {n for f in feats for n in f["feature"].split(" | ")}
+        self.assertEqual(names, set(analyzer(doc)))
+        word = pipe.named_steps["features"].transformer_list[0][1].transform([doc])
+        expected = (word @ pipe.named_steps["clf"].coef_[0][:2 ** 12])[0]
+        self.assertAlmostEqual(sum(f["contribution"] for f in feats), expected, places=12)
+
+
+class ClassificationMetricsTests(SimpleTestCase):
+    def test_metrics(self):
+        m = classification_metrics([1, 1, 0, 0, 1], [1, 0, 0, 1, 1])
+        self.assertAlmostEqual(m["accuracy"], 0.6)
+        self.assertAlmostEqual(m["precision"], 2 / 3)
+        self.assertAlmostEqual(m["recall"], 2 / 3)
+        self.assertEqual((m["fp"], m["fn"]), (1, 1))
+        self.assertEqual(classification_metrics([0, 0], [0, 0])["f1"], 0.0)
+
+
+class ShadowScorerTests(SimpleTestCase):
+    """Kandidat menskor di proses terpisah dan ketidaksepakatan ditulis ke log JSONL."""
+
+    def test_logs_disagreements(self):
+        production = ModelRegistry(shared=False).load("v14")
+        with tempfile.TemporaryDirectory() as tmp:
+            shadow = ShadowScorer("v13", log_dir=tmp, sample=1.0)
+            self.assertFalse(shadow.submit(ModelRegistry(shared=False).load("v13"), {"a": 0.0}, 0.0, 0.5))
+            # Proba produksi sengaja dibalik agar teks judol pasti tercatat sebagai ketidaksepakatan.
+            probas = {"slot gacor maxwin hari ini": 0.0, "lagu ini bagus banget kak": 0.0}
+            self.assertTrue(shadow.submit(production, probas, 1.5, 0.5))
+            deadline = time.monotonic() + 30
+            while shadow.stats()["batches"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            shadow.stop()
+            with open(shadow.log_path("v14"), encoding="utf-8") as f:
+                entry = json.loads(f.readline())
+        self.assertEqual((entry["prod"], entry["cand"], entry["n"]), ("v14", "v13", 2))
+        self.assertEqual([d[0] for d in entry["diff"]], ["slot gacor maxwin hari ini"])
+        self.assertEqual(shadow.stats()["disagreements"], 1)
+
+
+class CalibrationTests(SimpleTestCase):
+    """Tabel kalibrasi berupa interpolasi monoton; ambang per channel/video dari file JSON."""
+
+    def test_calibrator(self):
+        cal = Calibrator([0.0, 0.5, 1.0], [0.1, 0.2, 0.9])
+        self.assertEqual(cal([-1.0, 0.25, 0.75, 2.0]).tolist(), [0.1, 0.15000000000000002, 0.55, 0.9])
+        self.assertEqual(Calibrator.from_dict(cal.to_dict()).digest, cal.digest)
+        rng = random.Random(0)
+        scores = [rng.random() for _ in range(500)]
+        labels = [int(rng.random() < s) for s in scores]
+        for method in ("isotonic", "platt"):
+            fitted = fit_calibrator(scores, labels, method)
+            out = fitted([i / 100 for i in range(101)])
+            self.assertTrue(all(a <= b + 1e-12 for a, b in zip(out, out[1:])), method)
+
+    def test_threshold_overrides(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "thresholds.json"
+            policy = ThresholdPolicy(path, poll_interval=0)
+            self.assertEqual(policy.for_source("UCx", "vid1").source, "default")
+            path.write_text(json.dumps({
+                "default": {"threshold": 0.55},
+                "channels": {"UCx": {"threshold": 0.7}},
+                "videos": {"vid1": {"unsure": [0.3, 0.5]}},
+            }), encoding="utf-8")
+            video = policy.for_source("UCx", "vid1")
+            channel = policy.for_source("UCx", "vid2")
+            self.assertEqual(policy.for_source(None, None).threshold, 0.55)
+        self.assertEqual((video.threshold, video.unsure_low, video.source), (0.55, 0.3, "video:vid1"))
+        self.assertEqual((channel.threshold, channel.label(0.65), channel.label(0.7)), (0.7, 0, 1))
+        # File dihapus: kembali ke ambang bawaan.
+        self.assertEqual(policy.for_source("UCx", "vid1").source, "default")
+
+
+class _FakeRequest:
+    def __init__(self, execute):
+        self.execute = execute
+
+
+class _FakeYouTube:
+    """
+    Klien palsu: setiap video punya `pages` halaman berisi 2 thread. Setiap thread punya
+    `replies` balasan, satu di antaranya inline; balasan lain dikembalikan 2 per halaman.
+    """
+
+    def __init__(self, pages=3, delay=0.02, replies=0):
+        self.pages = pages
+        self.delay = delay
+        self.replies = replies
+        self.reply_calls = 0
+        self.reply_threads = set()
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _call(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+
+    def commentThreads(self):
+        return _FakeResource(self._threads)
+
+    def comments(self):
+        return _FakeResource(self._replies)
+
+    def _threads(self, videoId, pageToken=None, **kwargs):
+        self._call()
+        page = int(pageToken or 0)
+        items = []
+        for i in range(2):
+            cid = f"{videoId}-{page}-{i}"
+            item = {"snippet": {"topLevelComment": {"id": cid, "snippet": {"textDisplay": cid}},
+                                "totalReplyCount": self.replies}}
+            if self.replies:
+                item["replies"] = {"comments": [{"id": f"{cid}-r0", "snippet": {"textDisplay": "r0"}}]}
+            items.append(item)
+        resp = {"items": items}
+        if page + 1 < self.pages:
+            resp["nextPageToken"] = str(page + 1)
+        return resp
+
+    def _replies(self, parentId, pageToken=None, **kwargs):
+        with self.lock:
+            self.reply_calls += 1
+            self.reply_threads.add(threading.current_thread())
+        self._call()
+        start = int(pageToken or 0)
+        items = [{"id": f"{parentId}-r{j}", "snippet": {"textDisplay": f"r{j}"}}
+                 for j in range(start, min(start + 2, self.replies))]
+        resp = {"items": items}
+        if start + 2 < self.replies:
+            resp["nextPageToken"] = str(start + 2)
+        return resp
+
+
+class _FakeResource:
+    def __init__(self, handler):
+        self.handler = handler
+
+    def list(self, **kwargs):
+        return _FakeRequest(lambda: self.handler(**kwargs))
+
+
+class ConcurrentCollectTests(SimpleTestCase):
+    """Pengambilan komentar banyak video: urutan dan batas sama dengan versi berurutan."""
+
+    def setUp(self):
+        self.fake = _FakeYouTube()
+        self._orig = yt._api_client
+        yt._api_client = lambda: self.fake
+
+    def tearDown(self):
+        yt._api_client = self._orig
+
+    def test_order_limit_and_cap(self):
+        videos = [f"vid{i}" for i in range(5)]
+        batches = yt.collect_comments_many(videos, limit=3, max_workers=2)
+        self.assertEqual([[r["comment_id"] for r in b] for b in batches],
+                         [[f"{v}-0-0", f"{v}-0-1", f"{v}-1-0"] for v in videos])
+        self.assertEqual(self.fake.peak, 2)
+
+    def test_quota_budget(self):
+        quota = yt.QuotaTracker(budget=4)
+        batches = yt.collect_comments_many(["a", "b", "c"], limit=0, max_workers=1, quota=quota)
+        self.assertEqual([len(b) for b in batches], [6, 2, 0])
+        self.assertEqual((quota.used, quota.exhausted), (4, True))
+
+    def test_parallel_replies_in_order(self):
+        self.fake.replies = 5
+        self.fake.pages = 1
+        rows = yt.collect_comments("https://youtu.be/v", limit=0, max_workers=2)
+        expected = [c for i in range(2) for c in [f"v-0-{i}"] + [f"v-0-{i}-r{j}" for j in range(5)]]
+        self.assertEqual([r["comment_id"] for r in rows], expected)
+        self.assertEqual(self.fake.peak, 2)
+
+    def test_reply_pool_reused_across_pages(self):
+        self.fake.replies = 5
+        rows = yt.collect_comments("https://youtu.be/v", limit=0, max_workers=2)
+        self.assertEqual(len(rows), 3 * 2 * 6)
+        # Satu pool untuk seluruh video: thread (dan klien API-nya) tidak dibuat ulang per halaman.
+        self.assertEqual(len(self.fake.reply_threads), 2)
+
+    def test_replies_stop_at_limit(self):
+        self.fake.replies = 5
+        rows = yt.collect_comments("https://youtu.be/v", limit=4, max_workers=4)
+        self.assertEqual([r["comment_id"] for r in rows], ["v-0-0", "v-0-0-r0", "v-0-0-r1", "v-0-0-r2"])
+        # Hanya thread pertama yang diperluas (2 halaman); tanpa berhenti dini 4 thread x 3 halaman.
+        self.assertEqual(self.fake.reply_calls, 2)
+
+    def test_stream_stops_paging_at_row_budget(self):
+        # Setiap thread membawa 1 balasan inline: halaman pertama sudah memberi 4 baris.
+        self.fake.replies = 1
+        quota = yt.QuotaTracker()
+        pages = list(yt.stream_comments("https://youtu.be/v", limit=4, quota=quota))
+        self.assertEqual([len(p) for p in pages], [4])
+        self.assertEqual(quota.snapshot(), {"units": 1, "budget": 0, "exhausted": False, "rows": 4,
+                                            "calls": {"commentThreads": 1}})
+
+
+class CommentPipelineTests(SimpleTestCase):
+    """Statistik bertahap sama dengan sekaligus; prefetch menjaga urutan dan meneruskan error."""
+
+    def test_incremental_stats_match(self):
+        rng = random.Random(1)
+        results = [{"text": f"t{i}", "text_clean": rng.choice(["slot gacor", "lagu bagus", "main slot", "ok"]),
+                    "label": rng.randint(0, 1), "proba": rng.choice([0.1, 0.45, 0.5, 0.9, 0.99]),
+                    "brands": rng.choice([[], ["pulauwin"], ["gacor77", "pulauwin"]]),
+                    "unsure": rng.random() < 0.3} for i in range(200)]
+        whole = cp.CommentStats()
+        whole.add(results)
+        chunked = cp.CommentStats()
+        for i in range(0, len(results), 17):
+            chunked.add(results[i:i + 17])
+        thresholds = ThresholdPolicy(Path("/nonexistent")).for_source()
+        self.assertEqual(chunked.finish(thresholds), whole.finish(thresholds))
+
+    def test_prefetch(self):
+        fetched = []
+
+        def pages():
+            for i in range(5):
+                fetched.append(i)
+                yield [i]
+
+        it = cp.prefetch(pages(), depth=2)
+        self.assertEqual(next(it), [0])
+        deadline = time.monotonic() + 5
+        while len(fetched) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Halaman berikutnya sudah diambil di latar selagi halaman pertama diproses.
+        self.assertGreaterEqual(len(fetched), 3)
+        self.assertEqual(list(it), [[1], [2], [3], [4]])
+
+        def failing():
+            yield [1]
+            raise RuntimeError("putus")
+
+        it = cp.prefetch(failing())
+        self.assertEqual(next(it), [1])
+        with self.assertRaises(RuntimeError):
+            next(it)
+
+        # Pemanggil berhenti saat antrean penuh dan sumber sudah habis/gagal: thread latar tetap selesai.
+        def two_then_fail():
+            yield [0]
+            yield [1]
+            raise RuntimeError("putus")
+
+        for source in (iter([[0], [1]]), two_then_fail()):
+            it = cp.prefetch(source, depth=1)
+            next(it)
+            time.sleep(0.3)
+            it.close()
+            deadline = time.monotonic() + 5
+            while any(t.name == "comment-prefetch" for t in threading.enumerate()) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assertFalse(any(t.name == "comment-prefetch" for t in threading.enumerate()))
+
+    def test_youtube_pipeline(self):
+        fake = _FakeYouTube(pages=3, delay=0.0, replies=1)
+        orig = yt._api_client
+        yt._api_client = lambda: fake
+        try:
+            results, stats = cp.process_youtube_comments("https://youtu.be/v", limit=10)
+        finally:
+            yt._api_client = orig
+        self.assertEqual([r["comment_id"] for r in results][:3], ["v-0-0", "v-0-0-r0", "v-0-1"])
+        self.assertEqual(stats["total"], 10)
+        self.assertEqual(stats["judi_count"] + stats["clean_count"], 10)
+
+
+class AnalysisStreamTests(SimpleTestCase):
+    """Form HTMX mengembalikan kerangka hasil; baris dan penghitung menyusul lewat SSE."""
+
+    def setUp(self):
+        self._orig = deteksi_utils.iter_analysis
+
+        def fake_analysis(url, limit, video_count, comments_per_video):
+            row = {"author": "a", "text": "slot gacor", "comment_id": "c1", "label": 1, "proba": 0.9,
+                   "published_at": None}
+            yield "source", {"type": "video", "title": "Judul Video", "thumbnail": "", "channel_name": "ch"}
+            yield "rows", [row]
+            yield "rows", [{**row, "comment_id": "c2", "text": "lagu bagus", "label": 0, "proba": 0.1}]
+            yield "done", {"stats": {"total": 2, "judi_count": 1, "clean_count": 1}, "source_info": None,
+                           "error_msg": None, "quota": {}}
+
+        deteksi_utils.iter_analysis = fake_analysis
+
+    def tearDown(self):
+        deteksi_utils.iter_analysis = self._orig
+
+    def test_sse_event_format(self):
+        self.assertEqual(deteksi_utils.sse_event("rows", "<tr>\n</tr>"), "event: rows\ndata: <tr>\ndata: </tr>\n\n")
+
+    def test_stream(self):
+        resp = self.client.post("/", {"url": "https://youtu.be/abc", "limit": "50"}, HTTP_HX_REQUEST="true")
+        html = resp.content.decode()
+        self.assertIn('id="analysisStream"', html)
+        self.assertIn('id="streamPlaceholder"', html)
+        stream_url = html.split('data-stream-url="')[1].split('"')[0].replace("&amp;", "&")
+
+        resp = self.client.get(stream_url)
+        self.assertEqual(resp["Content-Type"], "text/event-stream")
+        body = b"".join(resp.streaming_content).decode()
+        events = [block.split("\n", 1)[0] for block in body.split("\n\n") if block.startswith("event:")]
+        self.assertEqual(events, ["event: source", "event: rows", "event: stats", "event: rows", "event: stats",
+                                  "event: done"])
+        self.assertIn("Judul Video", body)
+        self.assertIn('"total": 2, "judi_count": 1, "clean_count": 1', body)
+
+        # ID sekali pakai: membuka ulang URL yang sama tidak menjalankan analisis lagi.
+        self.assertEqual(self.client.get(stream_url).status_code, 404)
+        self.assertNotIn("url=", stream_url)
+
+    def test_stream_requires_server_side_id(self):
+        self.assertEqual(self.client.get("/analysis/stream/").status_code, 400)
+        self.assertEqual(self.client.get("/analysis/stream/?analysis_id=bukan-uuid").status_code, 400)
+        resp = self.client.get("/analysis/stream/", {"analysis_id": "00000000-0000-4000-8000-000000000000",
+                                                     "url": "https://youtu.be/abc", "limit": "50"})
+        self.assertEqual(resp.status_code, 404)
+
+    def test_invalid_link(self):
+        resp = self.client.post("/", {"url": "bukan link"}, HTTP_HX_REQUEST="true")
+        self.assertIn("Link tidak valid", resp.content.decode())
@@ -1,15 +1,22 @@
 from django.http import HttpResponse
 from django.core.cache import cache
 from django.conf import settings
+from django.template.loader import render_to_string
+from django.urls import reverse
+from urllib.parse import urlencode
+import json
 import uuid
 from google.oauth2.credentials import Credentials
 
-from .services.orchestrator import analyze_content
+from .services.orchestrator import analyze_content, check_source_url, iter_analysis
 from .services.youtube import fetch_youtube_user_info_oauth
 
+# Lama parameter analisis bertahap menunggu dibuka oleh EventSource (detik).
+STREAM_TICKET_SECONDS = 120
+
 def extract_analysis_params(request):
     """
-    Mengekstrak parameter analisis dari request POST.
+    Mengekstrak parameter analisis dari request POST (form) atau GET.
     
     Args:
         request: Objek HTTP request Django.
@@ -17,8 +24,9 @@ def extract_analysis_params(request):
     Returns:
         tuple: Tuple berisi (url, selected_limit, limit, video_count, comments_per_video).
     """
-    url = (request.POST.get("url") or "").strip()
-    selected_limit = (request.POST.get("limit") or "")
+    params = request.POST if request.method == "POST" else request.GET
+    url = (params.get("url") or "").strip()
+    selected_limit = (params.get("limit") or "")
     
     try:
         limit = int(selected_limit)
@@ -30,12 +38,12 @@ def extract_analysis_params(request):
              limit = 100 
 
     try:
-        video_count = int(request.POST.get("video_count") or 5)
+        video_count = int(params.get("video_count") or 5)
     except (ValueError, TypeError):
         video_count = 5
         
     try:
-        comments_per_video = int(request.POST.get("comments_per_video") or limit)
+        comments_per_video = int(params.get("comments_per_video") or limit)
     except (ValueError, TypeError):
         comments_per_video = limit
         
@@ -121,6 +129,141 @@ def process_analysis(request):
         "source_info": analysis_result["source_info"],
     }
 
+def start_streaming_analysis(request):
+    """
+    Menyiapkan analisis bertahap: hanya memvalidasi input (tanpa memanggil API YouTube)
+    lalu mengembalikan konteks kerangka hasil. Komentar dan penghitung dikirim kemudian
+    oleh `stream_analysis_events` lewat URL `stream_url`.
+    
+    Args:
+        request: Objek HTTP request Django.
+        
+    Returns:
+        tuple: (sukses, data_konteks_atau_error) dengan bentuk yang sama seperti `process_analysis`.
+    """
+    url, selected_limit, limit, video_count, comments_per_video = extract_analysis_params(request)
+
+    error_msg = check_source_url(url)
+    if error_msg:
+        return False, {
+            "error_message": error_msg,
+            "url": url,
+            "selected_limit": selected_limit
+        }
+
+    # Parameter disimpan di server; URL stream hanya membawa ID sekali pakai ini.
+    analysis_id = str(uuid.uuid4())
+    cache.set(_stream_key(analysis_id), {
+        "url": url,
+        "limit": limit,
+        "video_count": video_count,
+        "comments_per_video": comments_per_video,
+    }, STREAM_TICKET_SECONDS)
+    query = urlencode({"analysis_id": analysis_id})
+    return True, {
+        "analysis_id": analysis_id,
+        "url": url,
+        "rows": [],
+        "selected_limit": selected_limit,
+        "total_comments": 0,
+        "judi_count": 0,
+        "clean_count": 0,
+        "source_info": None,
+        "stream_url": f"{reverse('analysis_stream')}?{query}",
+    }
+
+def _stream_key(analysis_id):
+    return f"analysis_stream_{analysis_id}"
+
+def take_stream_params(analysis_id):
+    """
+    Mengambil lalu menghapus parameter analisis bertahap yang disimpan `start_streaming_analysis`,
+    sehingga satu ID hanya bisa menjalankan satu analisis.
+    
+    Args:
+        analysis_id (str): ID analisis dari URL stream.
+        
+    Returns:
+        dict | None: Parameter analisis, atau None jika ID tidak dikenal, kedaluwarsa, atau sudah dipakai.
+    """
+    key = _stream_key(analysis_id)
+    params = cache.get(key)
+    # delete() hanya True untuk pemanggil yang benar-benar menghapus kunci: dua request
+    # bersamaan dengan ID yang sama tidak bisa sama-sama berjalan.
+    if params is None or not cache.delete(key):
+        return None
+    return params
+
+def sse_event(event, data):
+    """
+    Memformat satu event server-sent events (setiap baris data diberi prefiks `data:`).
+    
+    Args:
+        event (str): Nama event.
+        data (str): Isi event (HTML atau JSON).
+        
+    Returns:
+        str: Teks event yang siap dikirim.
+    """
+    lines = "\n".join(f"data: {line}" for line in str(data).split("\n"))
+    return f"event: {event}\n{lines}\n\n"
+
+def stream_analysis_events(request, analysis_id, params):
+    """
+    Menjalankan analisis dan menghasilkan event SSE selagi halaman komentar selesai diskor:
+    'source' (HTML info sumber), 'rows' (HTML baris tabel), 'stats' (JSON penghitung),
+    lalu 'done' (JSON penghitung akhir) atau 'failed' (pesan kesalahan). Statistik akhir
+    disimpan di cache seperti `process_analysis` agar AI Insight bisa dimuat.
+    
+    Args:
+        request: Objek HTTP request Django.
+        analysis_id (str): ID analisis yang dibuat `start_streaming_analysis`.
+        params (dict): Parameter analisis dari `take_stream_params`.
+        
+    Returns:
+        generator: Potongan teks event untuk StreamingHttpResponse.
+    """
+    url, limit = params["url"], params["limit"]
+    video_count, comments_per_video = params["video_count"], params["comments_per_video"]
+    row_ctx = {"oauth_ok": request.session.get("yt_creds") is not None, "is_dataset_view": False}
+
+    def events():
+        # Komentar SSE agar header respons langsung terkirim sebelum panggilan API pertama.
+        yield ": mulai\n\n"
+        counts = {"total": 0, "judi_count": 0, "clean_count": 0}
+        try:
+            for event, payload in iter_analysis(url, limit, video_count, comments_per_video):
+                if event == "source":
+                    row_ctx["source_info"] = payload
+                    html = render_to_string("html/partials/source_info.html", {"source_info": payload}, request=request)
+                    yield sse_event("source", html)
+                elif event == "rows":
+                    html = render_to_string("html/partials/comment_rows.html", {**row_ctx, "rows": payload},
+                                            request=request)
+                    judi = sum(1 for r in payload if r["label"] == 1)
+                    counts["total"] += len(payload)
+                    counts["judi_count"] += judi
+                    counts["clean_count"] += len(payload) - judi
+                    yield sse_event("rows", html)
+                    yield sse_event("stats", json.dumps(counts))
+                elif event == "done":
+                    if payload["error_msg"]:
+                        yield sse_event("failed", payload["error_msg"])
+                        return
+                    stats = payload["stats"]
+                    cache.set(f"analysis_data_{analysis_id}", {"url": url, "limit": limit, "stats": stats}, 600)
+                    yield sse_event("done", json.dumps({
+                        "analysis_id": analysis_id,
+                        "total": stats.get("total", 0),
+                        "judi_count": stats.get("judi_count", 0),
+                        "clean_count": stats.get("clean_count", 0),
+                    }))
+        except Exception as e:
+            print(f"Error streaming analysis: {e}")
+            yield sse_event("failed", "Terjadi kesalahan saat mengambil atau menganalisis komentar.")
+
+    return events()
+
 def refresh_user_session(request):
     """
     Memperbarui informasi pengguna di sesi jika kredensial ada dan valid.
@@ -1,9 +1,14 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse, HttpResponseForbidden, HttpResponse
+from django.http import (
+    JsonResponse, HttpResponseBadRequest, HttpResponseForbidden, HttpResponse, HttpResponseNotFound,
+    StreamingHttpResponse,
+)
+from django.views.decorators.http import require_GET
 from django.conf import settings
 from django.urls import reverse
 from django.core.cache import cache
 import os
+import uuid
 from googleapiclient.errors import HttpError
 
 from deteksi.ml.predict import predict_comment, predict_and_explain
@@ -19,6 +24,9 @@ from .services.youtube import (
 )
 from .utils import (
     process_analysis, 
+    start_streaming_analysis,
+    stream_analysis_events,
+    take_stream_params,
     render_htmx_inline_error, 
     refresh_user_session, 
     map_moderation_error
@@ -203,6 +211,8 @@ def index(request):
     Halaman utama aplikasi.
     Menangani input URL YouTube (video/channel), melakukan analisis komentar menggunakan orchestrator,
     dan menampilkan hasilnya. Juga menampilkan video terbaru pengguna jika login.
+    Untuk request HTMX dengan STREAM_ANALYSIS aktif, yang dikembalikan adalah kerangka hasil;
+    komentar menyusul bertahap lewat `analysis_stream`.
     
     Args:
         request: Objek HTTP request Django.
@@ -220,7 +230,10 @@ def index(request):
     selected_limit = ""
     
     if request.method == "POST":
-        success, result_data = process_analysis(request)
+        if settings.STREAM_ANALYSIS and request.headers.get('HX-Request'):
+            success, result_data = start_streaming_analysis(request)
+        else:
+            success, result_data = process_analysis(request)
         
         if not success:
             ctx.update(result_data)
@@ -236,6 +249,37 @@ def index(request):
 
     return render(request, "html/index.html", ctx)
 
+@require_GET
+def analysis_stream(request):
+    """
+    Endpoint server-sent events untuk analisis bertahap yang dimulai oleh `index`.
+    Baris komentar dan penghitung judi/bersih dikirim setiap kali satu halaman komentar
+    selesai diskor, sehingga hasil pertama tampil tanpa menunggu seluruh video.
+
+    Hanya menerima `analysis_id` sekali pakai dari form POST (yang lolos CSRF); parameter
+    analisis tidak pernah dibaca dari query string.
+    
+    Args:
+        request: Objek HTTP request Django.
+        
+    Returns:
+        StreamingHttpResponse: Aliran event `text/event-stream`, 400 jika ID tidak valid,
+        atau 404 jika ID tidak dikenal/sudah dipakai.
+    """
+    analysis_id = request.GET.get("analysis_id") or ""
+    try:
+        analysis_id = str(uuid.UUID(analysis_id))
+    except ValueError:
+        return HttpResponseBadRequest("analysis_id tidak valid.")
+    params = take_stream_params(analysis_id)
+    if params is None:
+        return HttpResponseNotFound("Analisis tidak ditemukan atau sudah dijalankan.")
+    response = StreamingHttpResponse(stream_analysis_events(request, analysis_id, params),
+                                     content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
 def get_dataset(request):
     """
     Halaman khusus untuk mendapatkan dataset dari komentar YouTube.
@@ -376,7 +420,8 @@ def comment_detail(request):
     if not text:
         return HttpResponse("No text provided", status=400)
     
-    explanation = predict_and_explain(text)
+    explanation = predict_and_explain(text, channel_id=request.POST.get("channel_id") or None,
+                                      video_id=request.POST.get("video_id") or None)
     
     ctx = explanation
     if "proba_judol_pct" not in ctx:
@@ -0,0 +1,20 @@
+# Konfigurasi gunicorn (otomatis dibaca dari folder kerja, dipakai juga oleh Procfile).
+#
+# Jumlah worker web diambil gunicorn dari WEB_CONCURRENCY. Setiap worker memakai process pool
+# preprocessing sebesar cpu_count // WEB_CONCURRENCY (lihat deteksi/ml/preprocess.py,
+# `default_workers`) untuk batch komentar besar; atur PREPROCESS_WORKERS untuk mengganti
+# ukurannya, atau PREPROCESS_WORKERS=1 untuk preprocessing serial.
+
+
+def post_fork(server, worker):
+    """Memuat model aktif di setiap worker sebelum menerima request pertama."""
+    from deteksi.ml.registry import get_registry
+    from deteksi.ml.shadow import get_shadow
+
+    model = get_registry().preload()
+    server.log.info("Worker %s: model %s dimuat dalam %.2f s", worker.pid, model.name, model.load_seconds)
+
+    shadow = get_shadow()
+    if shadow is not None:
+        shadow.start()
+        server.log.info("Worker %s: shadow scoring dengan kandidat %s", worker.pid, shadow.candidate)
@@ -267,6 +267,109 @@ window.initSidebar = function () {
     });
 };
 
+/**
+ * Menampilkan pesan kesalahan di bawah input URL (setara dengan respons render_htmx_inline_error).
+ * @param {string} msg - Pesan kesalahan.
+ */
+window.showInlineError = function (msg) {
+    const box = document.getElementById('urlInlineError');
+    if (box) {
+        box.className = 'error-message-inline';
+        box.textContent = msg;
+    }
+    const input = document.getElementById('urlInput');
+    if (input) {
+        input.classList.add('input-error');
+        input.focus();
+    }
+};
+
+/**
+ * Memperbarui kartu ringkasan (total, non-promosi, promosi) dari data penghitung.
+ * @param {Object} counts - {total, judi_count, clean_count}.
+ */
+window.updateStatCounters = function (counts) {
+    const fields = { statTotal: counts.total, statClean: counts.clean_count, statGambling: counts.judi_count };
+    Object.keys(fields).forEach(id => {
+        const el = document.getElementById(id);
+        if (el && fields[id] !== undefined) el.innerText = fields[id];
+    });
+};
+
+/**
+ * Menjalankan analisis bertahap lewat server-sent events dari kerangka hasil (#analysisStream).
+ * Setiap halaman komentar yang selesai diskor langsung ditambahkan ke tabel dan penghitung diperbarui;
+ * AI Insight dimuat setelah event 'done'.
+ * @param {HTMLElement} marker - Elemen dengan atribut data-stream-url.
+ */
+window.startAnalysisStream = function (marker) {
+    if (!marker || marker.dataset.started) return;
+    marker.dataset.started = '1';
+    if (window.analysisStream) window.analysisStream.close();
+
+    const source = new EventSource(marker.dataset.streamUrl);
+    window.analysisStream = source;
+    let finished = false;
+
+    const finish = function () {
+        finished = true;
+        source.close();
+        if (window.analysisStream === source) window.analysisStream = null;
+    };
+
+    source.addEventListener('source', function (e) {
+        const box = document.getElementById('streamSource');
+        if (box) box.outerHTML = e.data;
+    });
+
+    source.addEventListener('rows', function (e) {
+        const body = document.getElementById('resultsBody');
+        if (!body) return;
+        const placeholder = document.getElementById('streamPlaceholder');
+        if (placeholder) placeholder.remove();
+
+        const tmp = document.createElement('tbody');
+        tmp.innerHTML = e.data;
+        // Hanya baris baru yang dicentang otomatis; centang yang sudah diubah pengguna dibiarkan.
+        Array.from(tmp.children).forEach(row => {
+            const cb = row.querySelector('.row-checkbox');
+            if (cb && row.dataset.type === 'gambling') cb.checked = true;
+            body.appendChild(row);
+            htmx.process(row);
+        });
+
+        const filter = document.getElementById('filterSelect');
+        window.filterTable(filter ? filter.value : 'all');
+        window.updateFab();
+    });
+
+    source.addEventListener('stats', function (e) {
+        window.updateStatCounters(JSON.parse(e.data));
+    });
+
+    source.addEventListener('done', function (e) {
+        finish();
+        window.updateStatCounters(JSON.parse(e.data));
+        const placeholder = document.getElementById('streamPlaceholder');
+        if (placeholder) placeholder.querySelector('td').innerText = 'Tidak ada komentar ditemukan.';
+        htmx.trigger(document.body, 'analysis-done');
+    });
+
+    source.addEventListener('failed', function (e) {
+        finish();
+        const container = document.getElementById('resultsContainer');
+        if (container) container.innerHTML = '';
+        window.showInlineError(e.data);
+    });
+
+    // Tanpa ini EventSource akan menyambung ulang dan menjalankan analisis dari awal.
+    source.onerror = function () {
+        if (finished) return;
+        finish();
+        window.showInlineError('Koneksi terputus saat mengambil komentar. Silakan coba lagi.');
+    };
+};
+
 /**
  * Fungsi inisialisasi utama aplikasi.
  * Mengatur konfigurasi, sidebar, event listener form, dan logika moderasi.
@@ -349,12 +452,13 @@ window.initMain = function (config) {
 
 /**
  * Event listener HTMX: Dijalankan setelah konten baru dimuat (afterSwap).
- * Memperbarui FAB dan otomatis mencentang komentar judi.
+ * Memperbarui FAB, otomatis mencentang komentar judi, dan memulai stream hasil jika ada.
  */
 document.body.addEventListener('htmx:afterSwap', function (evt) {
     if (evt.detail.target.id === "resultsContainer") {
         window.updateFab();
         setTimeout(window.autoCheckGamblingComments, 100);
+        window.startAnalysisStream(document.getElementById('analysisStream'));
     }
 });
 